@@ -30,12 +30,12 @@ import pandas as pd
 from ftplib import FTP
 import datetime
 import math
-import glob
 
 # Water Accounting Modules
 import watools.WebAccounts as WebAccounts
 import watools.General.raster_conversions as RC
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 
 def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, TimeStep, Waitbar):
 
@@ -221,10 +221,9 @@ def ALEXI_daily(Dates, output_folder, latlim, lonlim, Waitbar, total_amount, Tim
             amount += 1
             WaitbarConsole.printWaitBar(amount, total_amount, prefix = 'Progress:', suffix = 'Complete', length = 50)
 
-    os.chdir(output_folder)
-    re = glob.glob("*.dat")
+    re = FC.Find_Files(output_folder, "*.dat")
     for f in re:
-        os.remove(os.path.join(output_folder, f))
+        os.remove(f)
 
 def Download_ALEXI_from_WA_FTP(local_filename, DirFile, filename, lonlim, latlim, yID, xID, TimeStep):
     """
@@ -10,7 +10,7 @@ Module: Collect/CFSR
 import pandas as pd
 import os
 import numpy as np
-from netCDF4 import Dataset
+import gdal
 import re
 from joblib import Parallel, delayed
 
@@ -83,18 +83,21 @@ def CollectData(Dir, Var, Startdate, Enddate, latlim, lonlim, Waitbar, cores, Ve
             os.makedirs(output_folder)
 
 
+    # Group the days per month, every monthly grib file is decoded once
+    Months = [Dates[Dates.to_period('M') == Month] for Month in Dates.to_period('M').unique()]
+
     # Pass variables to parallel function and run
     args = [output_folder, latlim, lonlim, Var, Version]
     if not cores:
-        for Date in Dates:
-            RetrieveData(Date, args)
+        for Dates_month in Months:
+            RetrieveData(Dates_month, args)
             if Waitbar == 1:
-                amount += 1
+                amount += len(Dates_month)
                 WaitbarConsole.printWaitBar(amount, total_amount, prefix = 'Progress:', suffix = 'Complete', length = 50)
         results = True
     else:
-        results = Parallel(n_jobs=cores)(delayed(RetrieveData)(Date, args)
-                                         for Date in Dates)
+        results = Parallel(n_jobs=cores)(delayed(RetrieveData)(Dates_month, args)
+                                         for Dates_month in Months)
 
     # Remove all .nc and .grb2 files
     for f in os.listdir(output_folder):
@@ -109,8 +112,16 @@ def CollectData(Dir, Var, Startdate, Enddate, latlim, lonlim, Waitbar, cores, Ve
 
     return results
 
-def RetrieveData(Date, args):
+def RetrieveData(Dates_month, args):
+    """
+    This function creates the daily CFSR tiff files of one month. The monthly
+    grib file is opened once and for every day only the four 6-hourly messages
+    within the extent of the user are read.
 
+    Keyword arguments:
+    Dates_month -- pandas DatetimeIndex with the days of one month
+    args -- A list of parameters defined in the CollectData function.
+    """
     # unpack the arguments
     [output_folder, latlim, lonlim, Var, Version] = args
 
@@ -121,89 +132,106 @@ def RetrieveData(Date, args):
         version_name = 'CFSRv2'
 
     # Name of the outputfile
-    if Var == 'dlwsfc':
-        Outputname = 'DLWR_%s_W-m2_' %version_name + str(Date.strftime('%Y')) + '.' + str(Date.strftime('%m')) + '.' + str(Date.strftime('%d')) + '.tif'
-    if Var == 'dswsfc':
-        Outputname = 'DSWR_%s_W-m2_' %version_name + str(Date.strftime('%Y')) + '.' + str(Date.strftime('%m')) + '.' + str(Date.strftime('%d')) + '.tif'
-    if Var == 'ulwsfc':
-        Outputname = 'ULWR_%s_W-m2_' %version_name + str(Date.strftime('%Y')) + '.' + str(Date.strftime('%m')) + '.' + str(Date.strftime('%d')) + '.tif'
-    if Var == 'uswsfc':
-        Outputname = 'USWR_%s_W-m2_' %version_name + str(Date.strftime('%Y')) + '.' + str(Date.strftime('%m')) + '.' + str(Date.strftime('%d')) + '.tif'
+    Names_Var = dict({'dlwsfc': 'DLWR', 'dswsfc': 'DSWR', 'ulwsfc': 'ULWR', 'uswsfc': 'USWR'})
 
-    # Create the total end output name
-    outputnamePath = os.path.join(output_folder, Outputname)
+    # Define the days of which the output not exists yet
+    Outputs = []
+    for Date in Dates_month:
+        Outputname = '%s_%s_W-m2_' %(Names_Var[Var], version_name) + str(Date.strftime('%Y')) + '.' + str(Date.strftime('%m')) + '.' + str(Date.strftime('%d')) + '.tif'
 
-    # If the output name not exists than create this output
-    if not os.path.exists(outputnamePath):
+        # Create the total end output name
+        outputnamePath = os.path.join(output_folder, Outputname)
 
+        # If the output name not exists than create this output
+        if not os.path.exists(outputnamePath):
+            Outputs.append((Date, outputnamePath))
 
-        local_filename = Download_data(Date, Version, output_folder, Var)
+    if len(Outputs) == 0:
+        return()
 
-        # convert grb2 to netcdf (wgrib2 module is needed)
-        for i in range(0,4):
-            nameNC = 'Output' + str(Date.strftime('%Y')) + str(Date.strftime('%m')) + str(Date.strftime('%d')) + '-' + str(i+1) + '.nc'
+    # Download the monthly grib file
+    local_filename = Download_data(Dates_month[0], Version, output_folder, Var)
 
-            # Total path of the output
-            FileNC6hour = os.path.join(output_folder, nameNC)
+    if Version == 1:
 
-	       # Band number of the grib data which is converted in .nc
-            band=(int(Date.strftime('%d')) - 1) * 28 + (i + 1) * 7
+        if Dates_month[0] < pd.Timestamp(pd.datetime(2011, 1, 1)):
 
-            # Convert the data
-            DC.Convert_grb2_to_nc(local_filename, FileNC6hour, band)
+            # Convert the latlim and lonlim into array
+            Xstart = np.floor((lonlim[0] + 180.1562497) / 0.3125)
+            Xend = np.ceil((lonlim[1] + 180.1562497) / 0.3125) + 1
+            Ystart = np.floor((latlim[0] + 89.9171038899) / 0.3122121663)
+            Yend = np.ceil((latlim[1] + 89.9171038899) / 0.3122121663)
 
-        if Version == 1:
+            # Size of the dataset
+            size_Y, size_X = 576, 1152
 
-            if Date < pd.Timestamp(pd.datetime(2011, 1, 1)):
+        else:
+            Version = 2
 
-                # Convert the latlim and lonlim into array
-                Xstart = np.floor((lonlim[0] + 180.1562497) / 0.3125)
-                Xend = np.ceil((lonlim[1] + 180.1562497) / 0.3125) + 1
-                Ystart = np.floor((latlim[0] + 89.9171038899) / 0.3122121663)
-                Yend = np.ceil((latlim[1] + 89.9171038899) / 0.3122121663)
+    if Version == 2:
 
-                # Create a new dataset
-                Datatot = np.zeros([576, 1152])
+        # Convert the latlim and lonlim into array
+        Xstart = np.floor((lonlim[0] + 180.102272725) / 0.204545)
+        Xend = np.ceil((lonlim[1] + 180.102272725) / 0.204545) + 1
+        Ystart = np.floor((latlim[0] + 89.9462116040955806) / 0.204423)
+        Yend = np.ceil((latlim[1] + 89.9462116040955806) / 0.204423)
 
-            else:
-                Version = 2
+        # Size of the dataset
+        size_Y, size_X = 880, 1760
 
-        if Version == 2:
+    # The rows of the grib file are north up and the columns start at 0 degrees,
+    # define the window of the extent (counted from the south and -180 degrees) in the grib file
+    Xstart, Xend = int(max(Xstart, 0)), int(min(Xend, size_X))
+    Ystart, Yend = int(max(Ystart, 0)), int(min(Yend, size_Y))
+    Window = [size_Y - Yend, Yend - Ystart, (Xstart + size_X // 2) % size_X, Xend - Xstart]
 
-            # Convert the latlim and lonlim into array
-            Xstart = np.floor((lonlim[0] + 180.102272725) / 0.204545)
-            Xend = np.ceil((lonlim[1] + 180.102272725) / 0.204545) + 1
-            Ystart = np.floor((latlim[0] + 89.9462116040955806) / 0.204423)
-            Yend = np.ceil((latlim[1] + 89.9462116040955806) / 0.204423)
+    # save file
+    if Version == 1:
+        pixel_size = 0.3125
+    if Version == 2:
+        pixel_size = 0.204545
+    geo = [lonlim[0],pixel_size,0,latlim[1],0,-pixel_size]
+
+    # Open the monthly grib file once
+    dest = gdal.Open(local_filename)
 
-            # Create a new dataset
-            Datatot = np.zeros([880, 1760])
+    for Date, outputnamePath in Outputs:
 
         # Open 4 times 6 hourly dataset
+        DatatotDay = np.zeros([Window[1], Window[3]])
         for i in range (0, 4):
-            nameNC = 'Output' + str(Date.strftime('%Y')) + str(Date.strftime('%m')) + str(Date.strftime('%d')) + '-' + str(i + 1) + '.nc'
-            FileNC6hour = os.path.join(output_folder, nameNC)
-            f = Dataset(FileNC6hour, mode = 'r')
-            Data = f.variables['Band1'][0:int(Datatot.shape[0]), 0:int(Datatot.shape[1])]
-            f.close()
-            data = np.array(Data)
-            Datatot = Datatot + data
+
+            # Band number of the 6 hourly data in the grib file
+            band = (int(Date.strftime('%d')) - 1) * 28 + (i + 1) * 7
+
+            DatatotDay += Read_Window(dest.GetRasterBand(band), Window, size_X)
 
         # Calculate the average in W/m^2 over the day
-        DatatotDay = Datatot / 4
-        DatatotDayEnd = np.zeros([int(Datatot.shape[0]), int(Datatot.shape[1])])
-        DatatotDayEnd[:,0:int(Datatot.shape[0])] = DatatotDay[:, int(Datatot.shape[0]):int(Datatot.shape[1])]
-        DatatotDayEnd[:,int(Datatot.shape[0]):int(Datatot.shape[1])] = DatatotDay[:, 0:int(Datatot.shape[0])]
-
-        # clip the data to the extent difined by the user
-        DatasetEnd = DatatotDayEnd[int(Ystart):int(Yend), int(Xstart):int(Xend)]
-
-        # save file
-        if Version == 1:
-	        pixel_size = 0.3125
-        if Version == 2:
-	        pixel_size = 0.204545
-        geo = [lonlim[0],pixel_size,0,latlim[1],0,-pixel_size]
-        DC.Save_as_tiff(data = np.flipud(DatasetEnd), name = outputnamePath, geo = geo, projection = "WGS84")
+        DatasetEnd = DatatotDay / 4
+
+        DC.Save_as_tiff(data = DatasetEnd, name = outputnamePath, geo = geo, projection = "WGS84")
+
+    dest = None
 
     return()
+
+def Read_Window(band, Window, size_X):
+    """
+    This function reads a window of a global grib band, the columns of the
+    window can continue at the start of the band (crossing 0 degrees)
+
+    Keyword arguments:
+    band -- gdal band of the grib file
+    Window -- [row offset, amount of rows, column offset, amount of columns]
+    size_X -- amount of columns of the band
+    """
+    Yoff, Ysize, Xoff, Xsize = Window
+
+    Parts = []
+    while Xsize > 0:
+        Xsize_part = min(Xsize, size_X - Xoff)
+        Parts.append(band.ReadAsArray(int(Xoff), int(Yoff), int(Xsize_part), int(Ysize)))
+        Xsize -= Xsize_part
+        Xoff = 0
+
+    return(np.hstack(Parts))
@@ -13,12 +13,12 @@ import os
 import urllib
 import shutil
 import gdal
-import glob
 import sys
 
 # WA+ modules
 import watools.General.raster_conversions as RC
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 
 def DownloadData(output_folder, latlim, lonlim, parameter, resolution):
     """
@@ -276,15 +276,13 @@ def DownloadData(output_folder, latlim, lonlim, parameter, resolution):
 
     # Make geotiff file
     DC.Save_as_tiff(name=Save_name, data=datasetTot, geo=geo_out, projection="WGS84")
-    os.chdir(output_folder)
 
     # Delete the temporary folder
     shutil.rmtree(output_folder_trash)
 
 def Merge_DEM_15s_30s(output_folder_trash,output_file_merged,latlim, lonlim, resolution):
 
-    os.chdir(output_folder_trash)
-    tiff_files = glob.glob('*.tif')
+    tiff_files = FC.Find_Files(output_folder_trash, '*.tif', Full_Path = False)
     resolution_geo = []
     lonmin =  lonlim[0]
     lonmax =  lonlim[1]
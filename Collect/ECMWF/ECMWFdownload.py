@@ -10,7 +10,6 @@ def API(output_folder, DownloadType, string1, string2, string3, string4, string5
 
     import os
     from ecmwfapi import ECMWFDataServer
-    os.chdir(output_folder)	
     server = ECMWFDataServer()
 
     if DownloadType == 1 or DownloadType == 2:
@@ -27,7 +26,7 @@ def API(output_folder, DownloadType, string1, string2, string3, string4, string5
             'class'     : "%s" %string9,     # http://apps.ecmwf.int/codes/grib/format/mars/class/
             'area'      : "%s" %string10,   							
             'format'    : "netcdf",
-            'target'    : "data_interim.nc"
+            'target'    : os.path.join(output_folder, "data_interim.nc")
             })
 
     if DownloadType == 3:
@@ -45,7 +44,7 @@ def API(output_folder, DownloadType, string1, string2, string3, string4, string5
             'class'     : "%s" %string9,     # http://apps.ecmwf.int/codes/grib/format/mars/class/
             'area'      : "%s" %string10,   							
             'format'    : "netcdf",
-            'target'    : "data_interim.nc"
+            'target'    : os.path.join(output_folder, "data_interim.nc")
             })
 	
 	
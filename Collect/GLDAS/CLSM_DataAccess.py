@@ -5,12 +5,12 @@ import numpy as np
 import calendar
 import os
 import pandas as pd
-import requests
 from joblib import Parallel, delayed
 
 # Water Accounting modules
 from watools import WebAccounts
 import watools.General.data_conversions as DC
+from watools.Collect.GLDAS.DataAccess import Download_DAP
 
 def DownloadData(Dir, Var, Startdate, Enddate, latlim, lonlim, Waitbar, CaseParameters, cores, TimeCase):
     """
@@ -194,32 +194,13 @@ def RetrieveData_three_hourly(Date, args):
                     zID = int(((Date - pd.Timestamp("1979-1-2")).days) * 8) + (period - 1)
 
                     # total URL
-                    url_GLDAS = url + '.ascii?%s[%s][%s:1:%s][%s:1:%s]' %(Var,zID,yID[0],yID[1],xID[0],xID[1])
-
-                    # open URL
-                    try:
-                        dataset = requests.get(url_GLDAS, allow_redirects=False, stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        dataset = requests.get(url_GLDAS, allow_redirects=False, stream = True, verify = False)
-
-                    try:
-                        get_dataset = requests.get(dataset.headers['Location'], auth = (username,password), stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True, verify = False)
-
-                                      # download data (first save as text file)
-                    pathtext = os.path.join(path, 'temp%s.txt' % zID)
-                    z = open(pathtext, 'w')
-                    z.write(get_dataset.text)
-                    z.close()
-
-                    # Open text file and remove header and footer
-                    data_start = np.genfromtxt(pathtext,dtype = float,skip_header = 1,skip_footer = 6,delimiter=',')
-                    data = data_start[:,1:]
+                    url_GLDAS = url + '.dods?%s[%s][%s:1:%s][%s:1:%s]' %(Var,zID,yID[0],yID[1],xID[0],xID[1])
+
+                    # download the binary subset
+                    data_dap = Download_DAP(url_GLDAS, username, password)[Var]
+
+                    # Reshape data
+                    data = data_dap.reshape(yID[1] - yID[0] + 1, xID[1] - xID[0] + 1)
 
                     # Add the VarFactor
                     if VarFactor < 0:
@@ -255,9 +236,8 @@ def RetrieveData_three_hourly(Date, args):
             geo = [lonlimGLDAS,1.0,0,latlimGLDAS,0,-1.0]
             DC.Save_as_tiff(name=BasinDir, data=np.flipud(data[:,:]), geo=geo, projection="WGS84")
 
-            # Delete data and text file
+            # Delete data
             del data
-            os.remove(pathtext)
 
     return True
 	
@@ -303,38 +283,18 @@ def RetrieveData_daily(Date, args):
                     zID_end = 24470
 
             # define total url
-            url_GLDAS = url + '.ascii?%s[%s:1:%s][%s:1:%s][%s:1:%s]' %(Var,zID_start,zID_end,yID[0],yID[1],xID[0],xID[1])
+            url_GLDAS = url + '.dods?%s[%s:1:%s][%s:1:%s][%s:1:%s]' %(Var,zID_start,zID_end,yID[0],yID[1],xID[0],xID[1])
 
             # if not downloaded try to download file
             while downloaded == 0:
                 try:
 
-                    # open URL
-                    try:
-                        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True, verify = False)
-                    try:
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True, verify = False)
-
-                    # download data (first save as text file)
-                    pathtext = os.path.join(path[T],'temp%s.txt' %str(zID_start))
-                    z = open(pathtext,'w')
-                    z.write(get_dataset.text)
-                    z.close()
+                    # download the binary subset
+                    data_dap = Download_DAP(url_GLDAS, username, password)[Var]
 
                     # Reshape data
                     datashape = [yID[1] - yID[0] + 1,xID[1] - xID[0] + 1]
-                    data_start = np.genfromtxt(pathtext,dtype = float,skip_header = 1,skip_footer = 6,delimiter = ',')
-                    data_list = np.asarray(data_start[:,1:])
-                    data_end = np.resize(data_list,(datashape[0], datashape[1]))
-                    os.remove(pathtext)
+                    data_end = data_dap.reshape(datashape[0], datashape[1])
 
                     # Add the VarFactor
                     if VarInfo.factors[Var] < 0:
@@ -423,38 +383,18 @@ def RetrieveData_monthly(Date, args):
 
 
             # define total url
-            url_GLDAS = url + '.ascii?%s[%s:1:%s][%s:1:%s][%s:1:%s]' %(Var,zID_start,zID_end,yID[0],yID[1],xID[0],xID[1])
+            url_GLDAS = url + '.dods?%s[%s:1:%s][%s:1:%s][%s:1:%s]' %(Var,zID_start,zID_end,yID[0],yID[1],xID[0],xID[1])
 
             # if not downloaded try to download file
             while downloaded == 0:
                 try:
 
-                    # open URL
-                    try:
-                        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True, verify = False)
-                    try:
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True, verify = False)
-
-                    # download data (first save as text file)
-                    pathtext = os.path.join(path[T],'temp%s.txt' %str(zID_start))
-                    z = open(pathtext,'w')
-                    z.write(get_dataset.text)
-                    z.close()
+                    # download the binary subset
+                    data_dap = Download_DAP(url_GLDAS, username, password)[Var]
 
                     # Reshape data
                     datashape = [Mday,yID[1] - yID[0] + 1,xID[1] - xID[0] + 1]
-                    data_start = np.genfromtxt(pathtext,dtype = float,skip_header = 1,skip_footer = 6,delimiter = ',')
-                    data_list = np.asarray(data_start[:,1:])
-                    data_end = np.resize(data_list,(Mday, datashape[1], datashape[2]))
-                    os.remove(pathtext)
+                    data_end = data_dap.reshape(Mday, datashape[1], datashape[2])
 
                     # Add the VarFactor
                     if VarInfo.factors[Var] < 0:
@@ -4,6 +4,7 @@
 import numpy as np
 import calendar
 import os
+import re
 import pandas as pd
 import requests
 from joblib import Parallel, delayed
@@ -159,6 +160,211 @@ def DownloadData(Dir, Var, Startdate, Enddate, latlim, lonlim, Waitbar, cores,
     return results
 
 
+def DownloadData_daily(Dir, Vars, Startdate, Enddate, latlim, lonlim, Waitbar, cores,
+                       CaseParameters, gldas_version = '2.1', batch_days = 30):
+    """
+    This function downloads GLDAS Version 2 daily data for several variables
+    at once. All the variables and batch_days days are requested in one
+    OPeNDAP subset and the daily mean, min and max are calculated locally.
+
+    Keyword arguments:
+    Dir -- 'C:/file/to/path/'
+    Vars -- ['wind_f_inst','qair_f_inst'] (array of strings) Variable codes: VariablesInfo('day').descriptions.keys()
+    Startdate -- 'yyyy-mm-dd'
+    Enddate -- 'yyyy-mm-dd'
+    latlim -- [ymin, ymax]
+    lonlim -- [xmin, xmax]
+    cores -- 1....8
+    CaseParameters -- [SumMean, Min, Max] see daily.py
+    gldas_version -- '2.1' (Default) or '2.0'
+    batch_days -- amount of days that are requested at once
+    """
+
+    # Load factors / unit / type of variables / accounts
+    VarInfo = VariablesInfo('daily')
+    username, password = WebAccounts.Accounts(Type = 'NASA')
+
+    # seperate the daily case parameters
+    SumMean, Min, Max = CaseParameters
+    selected = np.array([SumMean, Min, Max])
+    types = np.array(('mean', 'min', 'max'))[selected == 1]
+
+    # Define output folders and create these if not exists
+    path = dict()
+    for Var in Vars:
+        path[Var] = dict()
+        for T in types:
+            path[Var][T] = os.path.join(Dir, 'Weather_Data', 'Model', 'GLDAS', 'daily', Var, T)
+            if not os.path.exists(path[Var][T]):
+                os.makedirs(path[Var][T])
+
+    # Define URL
+    url = 'https://hydro1.gesdisc.eosdis.nasa.gov/dods/GLDAS_NOAH025_3H.{0}'.format(gldas_version)
+
+    # Define IDs (latitude/longitude)
+    yID = np.int16(np.array([np.ceil((latlim[0] + 60) * 4),
+                             np.floor((latlim[1] + 60) * 4)]))
+    xID = np.int16(np.array([np.floor((lonlim[0] + 180) * 4),
+                             np.ceil((lonlim[1] + 180) * 4)]))
+
+    # Check dates. If no dates are given, the max number of days is used.
+    if not Startdate:
+        Startdate = pd.Timestamp('2000-02-24')
+    if not Enddate:
+        Enddate = pd.Timestamp('Now')  # Should be much than available
+
+    # Create all dates that will be calculated
+    Dates = pd.date_range(Startdate, Enddate, freq='D')
+
+    # Only request the days of which all the time steps are available
+    Time_Steps = Get_Time_Steps(url, username, password)
+    if Time_Steps is not None:
+        version = url[-3:]
+        Available = np.array([Time_Index(Date, version) + 7 < Time_Steps for Date in Dates], dtype = bool)
+        if not Available.all():
+            if Available.any():
+                print('GLDAS data is only available till ' + Dates[Available][-1].strftime('%Y-%m-%d'))
+            else:
+                print('GLDAS data is not available for the selected period')
+            Dates = Dates[Available]
+            if len(Dates) == 0:
+                return True
+
+    # Split the dates in batches of days
+    Batches = [Dates[i:i + batch_days] for i in range(0, len(Dates), batch_days)]
+
+    # Create Waitbar
+    if Waitbar == 1:
+        import watools.Functions.Start.WaitbarConsole as WaitbarConsole
+        total_amount = len(Batches)
+        amount = 0
+        WaitbarConsole.printWaitBar(amount, total_amount, prefix = 'Progress:', suffix = 'Complete', length = 50)
+
+    # Create one parameter with all the required arguments
+    args = [path, url, Vars, VarInfo, xID, yID, types, username, password]
+
+    # Pass variables to parallel function and run
+    if not cores:
+        for Dates_batch in Batches:
+            RetrieveData_daily_batch(Dates_batch, args)
+            if Waitbar == 1:
+                amount += 1
+                WaitbarConsole.printWaitBar(amount, total_amount, prefix = 'Progress:', suffix = 'Complete', length = 50)
+        results = True
+    else:
+        results = Parallel(n_jobs=cores)(delayed(RetrieveData_daily_batch)(Dates_batch, args)
+                                         for Dates_batch in Batches)
+    return results
+
+
+def RetrieveData_daily_batch(Dates, args):
+    """
+    This function retrieves GLDAS daily data of several variables for a range
+    of days with one OPeNDAP request. If the request keeps failing, the two
+    halves of the range are requested separately, down to single days.
+
+    Returns:
+    True if all the days of the range are available, otherwise False
+
+    Keyword arguments:
+    Dates -- pandas DatetimeIndex with contiguous days
+    args -- A list of parameters defined in the DownloadData_daily function.
+    """
+
+    # Open all the parameters
+    [path, url, Vars, VarInfo, xID, yID, types, username, password] = args
+
+    # Find the output files that do not exist yet
+    Outputs = dict()
+    for Var in Vars:
+        for T in types:
+            if T == 'mean':
+                VarStr = VarInfo.names[Var]
+            else:
+                VarStr = VarInfo.names[Var] + '-' + T
+            for Date in Dates:
+                BasinDir = os.path.join(path[Var][T], VarStr + '_GLDAS-NOAH_' + \
+                    VarInfo.units[Var] + '_daily_' + Date.strftime('%Y.%m.%d') + '.tif')
+                if not os.path.isfile(BasinDir):
+                    Outputs.setdefault(Var, []).append([T, Date, BasinDir])
+
+    if len(Outputs) == 0:
+        return True
+
+    # Create the time dimension
+    zID_start = Time_Index(Dates[0], url[-3:])
+    zID_end = zID_start + len(Dates) * 8 - 1
+
+    # define total url with all the variables that are needed
+    Vars_needed = [Var for Var in Vars if Var in Outputs]
+    url_GLDAS = url + '.dods?' + ','.join(['%s[%s:1:%s][%s:1:%s][%s:1:%s]' %(Var,zID_start,zID_end,yID[0],yID[1],xID[0],xID[1]) for Var in Vars_needed])
+
+    # Reset the begin parameters for downloading
+    downloaded = 0
+    N = 0
+    data_dap = dict()
+
+    # if not downloaded try to download file
+    while downloaded == 0:
+        try:
+
+            # download the binary subset
+            data_dap = Download_DAP(url_GLDAS, username, password)
+            for Var in Vars_needed:
+                data_dap[Var] = data_dap[Var].reshape(len(Dates), 8, yID[1] - yID[0] + 1, xID[1] - xID[0] + 1)
+
+            # Download was succesfull
+            downloaded = 1
+
+        # If download was not succesfull
+        except:
+
+            # Try another time
+            N = N + 1
+
+            # Stop trying after 10 times and try the halves of the range of days,
+            # the second half is only tried if the first half is complete
+            if N == 10:
+                if len(Dates) > 1:
+                    Half = len(Dates) // 2
+                    if RetrieveData_daily_batch(Dates[:Half], args):
+                        return RetrieveData_daily_batch(Dates[Half:], args)
+                    Dates = Dates[Half:]
+                print('Data from ' + Dates[0].strftime('%Y-%m-%d') + ' till ' + Dates[-1].strftime('%Y-%m-%d') + ' is not available')
+                return False
+
+    # define geo
+    lonlimGLDAS = xID[0] * 0.25 - 180
+    latlimGLDAS = (yID[1] + 1) * 0.25 - 60
+    geo = [lonlimGLDAS,0.25,0,latlimGLDAS,0,-0.25]
+
+    for Var in Vars_needed:
+        data_end = data_dap[Var]
+
+        # Add the VarFactor
+        if VarInfo.factors[Var] < 0:
+            data_end[data_end != -9999] = data_end[data_end != -9999] + VarInfo.factors[Var]
+        else:
+            data_end[data_end != -9999] = data_end[data_end != -9999] * VarInfo.factors[Var]
+        data_end[data_end < -9999] = -9999
+
+        # Calculate the daily statistics of all the days at once
+        Stats = dict()
+        if 'mean' in types:
+            Stats['mean'] = np.mean(data_end, axis=1)
+        if 'min' in types:
+            Stats['min'] = np.min(data_end, axis=1)
+        if 'max' in types:
+            Stats['max'] = np.max(data_end, axis=1)
+
+        # Save to geotiff files
+        for T, Date, BasinDir in Outputs[Var]:
+            data = np.flipud(Stats[T][Dates.get_loc(Date)])
+            DC.Save_as_tiff(name=BasinDir, data=data, geo=geo, projection="WGS84")
+
+    return True
+
+
 def RetrieveData_three_hourly(Date, args):
     """
     This function retrieves GLDAS three-hourly data for a given date.
@@ -202,32 +408,13 @@ def RetrieveData_three_hourly(Date, args):
                         zID = int(((Date - pd.Timestamp("1948-1-1")).days) * 8) + (period - 1) - 1
 
                     # total URL
-                    url_GLDAS = url + '.ascii?%s[%s][%s:1:%s][%s:1:%s]' %(Var,zID,yID[0],yID[1],xID[0],xID[1])
-
-                    # open URL
-                    try:
-                        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True, verify = False)
-
-                    try:
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True, verify = False)
-
-                    # download data (first save as text file)
-                    pathtext = os.path.join(path, 'temp%s.txt' % zID)
-                    z = open(pathtext, 'w')
-                    z.write(get_dataset.text)
-                    z.close()
-
-                    # Open text file and remove header and footer
-                    data_start = np.genfromtxt(pathtext,dtype = float,skip_header = 1,skip_footer = 6,delimiter=',')
-                    data = data_start[:,1:]
+                    url_GLDAS = url + '.dods?%s[%s][%s:1:%s][%s:1:%s]' %(Var,zID,yID[0],yID[1],xID[0],xID[1])
+
+                    # download the binary subset
+                    data_dap = Download_DAP(url_GLDAS, username, password)[Var]
+
+                    # Reshape data
+                    data = data_dap.reshape(yID[1] - yID[0] + 1, xID[1] - xID[0] + 1)
 
                     # Add the VarFactor
                     if VarFactor < 0:
@@ -263,9 +450,8 @@ def RetrieveData_three_hourly(Date, args):
             geo = [lonlimGLDAS,0.25,0,latlimGLDAS,0,-0.25]
             DC.Save_as_tiff(name=BasinDir, data=np.flipud(data[:,:]), geo=geo, projection="WGS84")
 
-            # Delete data and text file
+            # Delete data
             del data
-            os.remove(pathtext)
 
     return True
 
@@ -317,38 +503,18 @@ def RetrieveData_daily(Date, args):
                 zID_end = zID_start + 7
 
             # define total url
-            url_GLDAS = url + '.ascii?%s[%s:1:%s][%s:1:%s][%s:1:%s]' %(Var,zID_start,zID_end,yID[0],yID[1],xID[0],xID[1])
+            url_GLDAS = url + '.dods?%s[%s:1:%s][%s:1:%s][%s:1:%s]' %(Var,zID_start,zID_end,yID[0],yID[1],xID[0],xID[1])
 
             # if not downloaded try to download file
             while downloaded == 0:
                 try:
 
-                    # open URL
-                    try:
-                        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True, verify = False)
-                    try:
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True)
-                    except:
-                        from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True, verify = False)
-
-                    # download data (first save as text file)
-                    pathtext = os.path.join(path[T],'temp%s.txt' %str(zID_start))
-                    z = open(pathtext,'w')
-                    z.write(get_dataset.text)
-                    z.close()
+                    # download the binary subset
+                    data_dap = Download_DAP(url_GLDAS, username, password)[Var]
 
                     # Reshape data
                     datashape = [8,yID[1] - yID[0] + 1,xID[1] - xID[0] + 1]
-                    data_start = np.genfromtxt(pathtext,dtype = float,skip_header = 1,skip_footer = 6,delimiter = ',')
-                    data_list = np.asarray(data_start[:,1:])
-                    data_end = np.resize(data_list,(8, datashape[1], datashape[2]))
-                    os.remove(pathtext)
+                    data_end = data_dap.reshape(8, datashape[1], datashape[2])
 
                     # Add the VarFactor
                     if VarInfo.factors[Var] < 0:
@@ -436,35 +602,17 @@ def RetrieveData_monthly(Date, args):
             zID = (Y - 1948) * 12 + (M - 1)
 
         # define total url
-        url_GLDAS = url + '.ascii?%s[%s][%s:1:%s][%s:1:%s]' %(Var,zID,yID[0],yID[1],xID[0],xID[1])
+        url_GLDAS = url + '.dods?%s[%s][%s:1:%s][%s:1:%s]' %(Var,zID,yID[0],yID[1],xID[0],xID[1])
         print(url_GLDAS)
         # if not downloaded try to download file
         while downloaded == 0:
             try:
 
-                # open URL
-                try:
-                    dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True)
-                except:
-                    from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                    requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                    dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True, verify = False)
-                try:
-                    get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True)
-                except:
-                    from requests.packages.urllib3.exceptions import InsecureRequestWarning
-                    requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
-                    get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True, verify = False)
-
-                # download data (first save as text file)
-                pathtext = os.path.join(path,'temp%s.txt' %str(zID))
-                z = open(pathtext,'w')
-                z.write(get_dataset.text)
-                z.close()
+                # download the binary subset
+                data_dap = Download_DAP(url_GLDAS, username, password)[Var]
 
-                # Open text file and remove header and footer
-                data_start = np.genfromtxt(pathtext,dtype = float,skip_header = 1,skip_footer = 6,delimiter=',')
-                data = data_start[:,1:]
+                # Reshape data
+                data = data_dap.reshape(yID[1] - yID[0] + 1, xID[1] - xID[0] + 1)
 
                 # Add the VarFactor
                 if VarFactor < 0:
@@ -501,12 +649,133 @@ def RetrieveData_monthly(Date, args):
             DC.Save_as_tiff(name=BasinDir, data=np.flipud(data[:,:]), geo=geo, projection="WGS84")
 
 
-            # Delete data and text file
+            # Delete data
             del data
-            os.remove(pathtext)
 
     return True
 
+def Time_Index(Date, version):
+    """
+    This function returns the index of the first three hourly time step of a
+    day in the GLDAS time dimension.
+
+    Keyword arguments:
+    Date -- pandas Timestamp of the day
+    version -- '2.0' or '2.1'
+    """
+    if version == '2.0':
+        zID = int(((Date - pd.Timestamp("1948-1-1")).days) * 8) - 1
+    elif version == '2.1':
+        zID = int(((Date - pd.Timestamp("2000-1-1")).days) * 8) - 1
+
+    return(zID)
+
+def Get_Time_Steps(url, username, password):
+    """
+    This function returns the length of the time dimension of a GLDAS dataset
+    from its DDS, or None if the DDS cannot be retrieved.
+
+    Keyword arguments:
+    url -- the OPeNDAP url of the dataset
+    username -- NASA username
+    password -- NASA password
+    """
+    try:
+        DDS = Download_URL(url + '.dds', username, password).decode('utf-8', 'replace')
+        return(int(re.search(r'\btime\s*=\s*(\d+)', DDS).group(1)))
+    except:
+        return(None)
+
+def Download_URL(url_GLDAS, username, password):
+    """
+    This function downloads the content of a NASA OPeNDAP url.
+
+    Keyword arguments:
+    url_GLDAS -- the OPeNDAP url
+    username -- NASA username
+    password -- NASA password
+
+    Returns:
+    content -- bytes of the response
+    """
+    # open URL
+    try:
+        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True)
+    except:
+        from requests.packages.urllib3.exceptions import InsecureRequestWarning
+        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+        dataset = requests.get(url_GLDAS, allow_redirects=False,stream = True, verify = False)
+    try:
+        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True)
+    except:
+        from requests.packages.urllib3.exceptions import InsecureRequestWarning
+        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+        get_dataset = requests.get(dataset.headers['location'], auth = (username,password),stream = True, verify = False)
+
+    return(get_dataset.content)
+
+def Download_DAP(url_GLDAS, username, password):
+    """
+    This function downloads a binary OPeNDAP (DAP2 .dods) subset of GLDAS
+    and decodes it directly into numpy arrays.
+
+    Keyword arguments:
+    url_GLDAS -- the OPeNDAP url with the .dods? subset request
+    username -- NASA username
+    password -- NASA password
+
+    Returns:
+    Arrays -- dictionary with per variable name a numpy array with the subset
+    """
+    return(Decode_DODS(Download_URL(url_GLDAS, username, password)))
+
+def Decode_DODS(content):
+    """
+    This function decodes a DAP2 binary response (a DDS text header followed by
+    XDR encoded data) into numpy arrays. For a grid the array and the map
+    vectors (time, lat, lon) are all returned, if a name occurs more than once
+    the first one is kept.
+
+    Keyword arguments:
+    content -- bytes of the .dods response
+
+    Returns:
+    Arrays -- dictionary with per variable name a numpy array
+    """
+    # Split the header and the data
+    Split = content.find(b'\nData:\n')
+    if Split < 0:
+        raise ValueError('No data in OPeNDAP response: %s' %content[:200])
+    DDS = content[:Split].decode('utf-8', 'replace')
+    Data = content[Split + len(b'\nData:\n'):]
+
+    # XDR types of the DAP2 atomic types
+    Types = {'Byte': '>u1', 'Int16': '>i4', 'UInt16': '>u4', 'Int32': '>i4',
+             'UInt32': '>u4', 'Float32': '>f4', 'Float64': '>f8'}
+
+    Arrays = dict()
+    Position = 0
+    for Declaration in re.finditer(r'(Byte|Int16|UInt16|Int32|UInt32|Float32|Float64)\s+([\w.]+)((?:\s*\[[^\]]*\])*)\s*;', DDS):
+        Type, Name, Dimensions = Declaration.groups()
+        Shape = [int(Size) for Size in re.findall(r'\[(?:[^=\]]*=)?\s*(\d+)\s*\]', Dimensions)]
+        Amount = int(np.prod(Shape))
+        dtype = np.dtype(Types[Type])
+
+        # Arrays start with their length (twice), scalars are written directly
+        if len(Shape) > 0:
+            Position += 8
+        if Type == 'Byte':
+            Values = np.frombuffer(Data, dtype, Amount, Position)
+            Position += Amount + (-Amount) % 4
+        else:
+            Values = np.frombuffer(Data, dtype, Amount, Position)
+            Position += Amount * dtype.itemsize
+
+        if Name not in Arrays:
+            Arrays[Name] = Values.reshape(Shape).astype(np.float64)
+
+    return(Arrays)
+
 class VariablesInfo:
     """
     This class contains the information about the GLDAS variables
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 import sys
-from watools.Collect.GLDAS.DataAccess import DownloadData
+from watools.Collect.GLDAS.DataAccess import DownloadData_daily
 
 
 def main(Dir, Vars, Startdate, Enddate, latlim, lonlim, cores=False,
-         SumMean=1, Min=0, Max=0, Waitbar = 1, gldas_version = '2.1'):
+         SumMean=1, Min=0, Max=0, Waitbar = 1, gldas_version = '2.1', batch_days = 30):
     """
     This function downloads GLDAS daily data for a given variable, time
     interval, and spatial extent.
@@ -22,18 +22,17 @@ def main(Dir, Vars, Startdate, Enddate, latlim, lonlim, cores=False,
     Max -- 0 or 1. Indicates if the output values are the daily maximum
     Waitbar -- 1 (Default) Will print a waitbar
     gldas_version = '2.1' (Default) or '2.0'
+    batch_days -- 30 (Default) amount of days that are requested at once for all the variables
 
     Version 2.1 is available from 2000-01-01 till present
     Version 2.0 is available from 1948-01-01 till 2010-12-31
     """
-    for Var in Vars:
+    if Waitbar == 1:
+        print('\nDownloading daily GLDAS %s data for the period %s till %s' %(', '.join(Vars), Startdate, Enddate))
 
-        if Waitbar == 1:
-            print('\nDownloading daily GLDAS %s data for the period %s till %s' %(Var, Startdate, Enddate))
-
-        # Download data
-        DownloadData(Dir, Var, Startdate, Enddate, latlim, lonlim, Waitbar, cores,
-					 TimeCase='daily', CaseParameters=[SumMean, Min, Max], gldas_version = gldas_version)
+    # Download data of all the variables together
+    DownloadData_daily(Dir, Vars, Startdate, Enddate, latlim, lonlim, Waitbar, cores,
+                       CaseParameters=[SumMean, Min, Max], gldas_version = gldas_version, batch_days = batch_days)
 
 if __name__ == '__main__':
     main(sys.argv)
@@ -12,7 +12,6 @@ Module: Collect/GLEAM
 import os
 import numpy as np
 import pandas as pd
-import glob
 from joblib import Parallel, delayed
 import paramiko
 import calendar
@@ -20,6 +19,7 @@ from netCDF4 import Dataset
 
 # Water Accounting modules
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 from watools import WebAccounts
 
 def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, Waitbar, cores, TimeCase, Product):
@@ -119,10 +119,9 @@ def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, Waitbar, cores, TimeCa
                                          for Date in Dates)
 
     # Remove all .hdf files
-    os.chdir(output_folder)
-    files = glob.glob("*.nc")
+    files = FC.Find_Files(output_folder, "*.nc")
     for f in files:
-        os.remove(os.path.join(output_folder, f))
+        os.remove(f)
 
     return(results)
 
@@ -18,7 +18,6 @@ import re
 import math
 import datetime
 import requests
-import glob
 from joblib import Parallel, delayed
 import sys
 if sys.version_info[0] == 3:
@@ -30,6 +29,7 @@ if sys.version_info[0] == 2:
 import watools
 import watools.General.raster_conversions as RC
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 from watools import WebAccounts
 
 def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, Waitbar, cores, hdf_library, remove_hdf):
@@ -98,15 +98,14 @@ def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, Waitbar, cores, hdf_li
                                          for Date in Dates)
     if remove_hdf == 1:
         # Remove all .hdf files
-        os.chdir(output_folder)
-        files = glob.glob("*.hdf")
+        files = FC.Find_Files(output_folder, "*.hdf")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
         # Remove all .txt files
-        files = glob.glob("*.txt")
+        files = FC.Find_Files(output_folder, "*.txt")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
     return(results)
 
@@ -16,7 +16,6 @@ import urllib
 from bs4 import BeautifulSoup
 import re
 import math
-import glob
 import datetime
 import requests
 from joblib import Parallel, delayed
@@ -31,6 +30,7 @@ if sys.version_info[0] == 2:
 import watools
 import watools.General.raster_conversions as RC
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 from watools import WebAccounts
 
 def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, TimeStep, Waitbar, cores, hdf_library, remove_hdf):
@@ -103,15 +103,14 @@ def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, TimeStep, Waitbar, cor
 
     if remove_hdf == 1:
         # Remove all .hdf files
-        os.chdir(output_folder)
-        files = glob.glob("*.hdf")
+        files = FC.Find_Files(output_folder, "*.hdf")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
         # Remove all .txt files
-        files = glob.glob("*.txt")
+        files = FC.Find_Files(output_folder, "*.txt")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
 
     return(results)
@@ -253,11 +252,10 @@ def Collect_data(TilesHorizontal,TilesVertical,Date,output_folder, TimeStep, hdf
 
 			   # Check the library given by user
             if hdf_library is not None:
-                os.chdir(hdf_library)
                 if TimeStep == 8:
-                    hdf_name = glob.glob("MOD11A2.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical))
+                    hdf_name = FC.Find_Files(hdf_library, "MOD11A2.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical), Full_Path = False)
                 if TimeStep == 1:
-                    hdf_name = glob.glob("MOD11A1.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical))
+                    hdf_name = FC.Find_Files(hdf_library, "MOD11A1.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical), Full_Path = False)
 
                 if len(hdf_name) == 1:
                     hdf_file = os.path.join(hdf_library, hdf_name[0])
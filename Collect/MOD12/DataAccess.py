@@ -15,7 +15,6 @@ import gdal
 import urllib
 from bs4 import BeautifulSoup
 import re
-import glob
 import requests
 from joblib import Parallel, delayed
 import sys
@@ -29,6 +28,7 @@ if sys.version_info[0] == 2:
 import watools
 import watools.General.raster_conversions as RC
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 from watools import WebAccounts
 
 def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, LC_Type, Waitbar, cores, hdf_library, remove_hdf):
@@ -95,15 +95,14 @@ def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, LC_Type, Waitbar, core
                                          for Date in Dates)
     if remove_hdf == 1:
         # Remove all .hdf files
-        os.chdir(output_folder)
-        files = glob.glob("*.hdf")
+        files = FC.Find_Files(output_folder, "*.hdf")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
         # Remove all .txt files
-        files = glob.glob("*.txt")
+        files = FC.Find_Files(output_folder, "*.txt")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
     return(results)
 
@@ -182,8 +181,7 @@ def Collect_data(TilesHorizontal,TilesVertical,Date,output_folder, LC_Type, hdf_
 
 	         # Check the library given by user
             if hdf_library is not None:
-                os.chdir(hdf_library)
-                hdf_name = glob.glob("MCD12Q1.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical))
+                hdf_name = FC.Find_Files(hdf_library, "MCD12Q1.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical), Full_Path = False)
 
                 if len(hdf_name) == 1:
                     hdf_file = os.path.join(hdf_library, hdf_name[0])
@@ -17,7 +17,6 @@ import re
 import math
 import datetime
 import requests
-import glob
 from joblib import Parallel, delayed
 import sys
 if sys.version_info[0] == 3:
@@ -29,6 +28,7 @@ if sys.version_info[0] == 2:
 # Water Accounting modules
 import watools.General.raster_conversions as RC
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 from watools import WebAccounts
 
 def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, Waitbar, cores, nameDownload, hdf_library, remove_hdf):
@@ -105,15 +105,14 @@ def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, Waitbar, cores, nameDo
 
     # Remove all .hdf files
     if remove_hdf == 1:
-        os.chdir(output_folder)
-        files = glob.glob("*.hdf")
+        files = FC.Find_Files(output_folder, "*.hdf")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
         # Remove all .txt files
-        files = glob.glob("*.txt")
+        files = FC.Find_Files(output_folder, "*.txt")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
     return(results)
 
@@ -319,8 +318,7 @@ def Collect_data(TilesHorizontal,TilesVertical,Date,output_folder, nameDownload,
 
 			   # Check the library given by user
             if hdf_library is not None:
-                os.chdir(hdf_library)
-                hdf_name = glob.glob("MOD15A2H.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical))
+                hdf_name = FC.Find_Files(hdf_library, "MOD15A2H.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical), Full_Path = False)
 
                 if len(hdf_name) == 1:
                     hdf_file = os.path.join(hdf_library, hdf_name[0])
@@ -15,7 +15,6 @@ import pandas as pd
 import gdal
 import urllib
 import re
-import glob
 from joblib import Parallel, delayed
 from bs4 import BeautifulSoup
 import datetime
@@ -32,6 +31,7 @@ import watools
 from watools import WebAccounts
 import watools.General.raster_conversions as RC
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 
 def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, timestep, Waitbar, cores, hdf_library, remove_hdf):
     """
@@ -93,15 +93,14 @@ def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, timestep, Waitbar, cor
 
     if remove_hdf == 1:
         # Remove all .hdf files
-        os.chdir(output_folder)
-        files = glob.glob("*.hdf")
+        files = FC.Find_Files(output_folder, "*.hdf")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
         # Remove all .txt files
-        files = glob.glob("*.txt")
+        files = FC.Find_Files(output_folder, "*.txt")
         for f in files:
-            os.remove(os.path.join(output_folder, f))
+            os.remove(f)
 
     return(results)
 
@@ -182,8 +181,7 @@ def Collect_data(TilesHorizontal,TilesVertical,Date,output_folder,timestep, hdf_
             downloaded = 0
 
             if hdf_library is not None:
-                os.chdir(hdf_library)
-                hdf_name = glob.glob("MOD16A2.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical))
+                hdf_name = FC.Find_Files(hdf_library, "MOD16A2.A%s%03s.h%02dv%02d.*" %(Date.strftime('%Y'), Date.strftime('%j'), Horizontal, Vertical), Full_Path = False)
 
                 if len(hdf_name) == 1:
                     hdf_file = os.path.join(hdf_library, hdf_name[0])
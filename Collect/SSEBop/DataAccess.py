@@ -37,6 +37,7 @@ if sys.version_info[0] == 2:
 import watools.WebAccounts as WebAccounts
 import watools.General.raster_conversions as RC
 import watools.General.data_conversions as DC
+import watools.General.file_catalogue as FC
 
 
 def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, Waitbar, version, Product):
@@ -185,15 +186,13 @@ def DownloadData(Dir, Startdate, Enddate, latlim, lonlim, Waitbar, version, Prod
             WaitbarConsole.printWaitBar(amount, total_amount, prefix = 'Progress:', suffix = 'Complete', length = 50)
 
     if version == "V4":
-        import glob
-        os.chdir(output_folder)
         if Product == "ETact":
-            zipfiles = glob.glob("*.zip")
+            zipfiles = FC.Find_Files(output_folder, "*.zip")
             for zipfile in zipfiles:
-                os.remove(os.path.join(output_folder, zipfile))
-            xmlfiles = glob.glob("*.xml")
+                os.remove(zipfile)
+            xmlfiles = FC.Find_Files(output_folder, "*.xml")
             for xmlfile in xmlfiles:
-                os.remove(os.path.join(output_folder, xmlfile))
+                os.remove(xmlfile)
         if Product == "ETpot":  
             import shutil
             Temp_dir = os.path.join(output_folder, "Temp")
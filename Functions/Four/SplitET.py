@@ -30,7 +30,7 @@ def Blue_Green(Dir_Basin, nc_outname, ETref_Product, P_Product, Startdate, Endda
               Array[time, lat, lon] contains Green Evapotranspiration
     """
     import watools.General.raster_conversions as RC
-    import watools.Functions.Start.Get_Dictionaries as GD
+    import watools.Functions.Start.LULC_Tables as LT
 
 
     # Input Parameters functions
@@ -44,16 +44,9 @@ def Blue_Green(Dir_Basin, nc_outname, ETref_Product, P_Product, Startdate, Endda
 
     # Get moving window period
 
-    # Get dictionaries and keys for the moving average
-    ET_Blue_Green_Classes_dict, Moving_Window_Per_Class_dict = GD.get_bluegreen_classes(version = '1.0')
-    Classes = ET_Blue_Green_Classes_dict.keys()
-    Moving_Averages_Values_Array = np.ones(LU.shape) * np.nan
-
     # Create array based on the dictionary that gives the Moving average tail for every pixel
-    for Class in Classes:
-        Values_Moving_Window_Class = Moving_Window_Per_Class_dict[Class]
-        for Values_Class in ET_Blue_Green_Classes_dict[Class]:
-            Moving_Averages_Values_Array[LU == Values_Class] = Values_Moving_Window_Class
+    Moving_Window_Table = LT.Get_Table('moving_window', version = '1.0')
+    Moving_Averages_Values_Array = LT.Apply_Table(Moving_Window_Table, LU)
 
     Additional_Months_front = int(np.nanmax(Moving_Averages_Values_Array))
     Additional_Months_tail = 0
@@ -94,7 +87,7 @@ def Blue_Green(Dir_Basin, nc_outname, ETref_Product, P_Product, Startdate, Endda
         ETref_period = ETref[Start_period:End_period,:,:]
 
      # Loop over the different moving average tails
-    for One_Value in np.unique(list(Moving_Window_Per_Class_dict.values())):
+    for One_Value in np.unique(Moving_Window_Table[~np.isnan(Moving_Window_Table)]):
 
         # If there is no moving average is 1 than use the value of the original ETref or P
         if One_Value == 1:
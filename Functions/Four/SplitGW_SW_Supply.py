@@ -41,21 +41,8 @@ def Fraction_Based(nc_outname, Startdate, Enddate):
     DataCube_LU = RC.Open_nc_array(nc_outname, "Landuse")
     DataCube_Parameter = RC.Open_nc_array(nc_outname, "Total_Supply", Startdate, Enddate)
 
-    # Get Classes
-    LU_Classes = Start.Get_Dictionaries.get_sheet5_classes()
-    LU_Classes_Keys = LU_Classes.keys()
-
-    # Get fractions
-    sw_supply_dict = Start.Get_Dictionaries.sw_supply_fractions()
-
-    # Create Array for consumed fractions
-    DataCube_Parameter_Fractions = np.ones(DataCube_LU.shape) * np.nan
-
-    # Create array with consumed_fractions
-    for Classes_LULC in LU_Classes_Keys:
-        Values_LULC = LU_Classes[Classes_LULC]
-        for Value_LULC in Values_LULC:
-            DataCube_Parameter_Fractions[DataCube_LU == Value_LULC] = sw_supply_dict[Classes_LULC]
+    # Create array with surface water supply fractions
+    DataCube_Parameter_Fractions = Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_Table('sw_supply_fractions'), DataCube_LU)
 
     # Calculate the Surface water and groundwater components based on the fraction
     DataCube_SW_Parameter = DataCube_Parameter[:,:,:] * DataCube_Parameter_Fractions[None,:,:]
@@ -39,20 +39,11 @@ def GWF_Based(nc_outname, Startdate, Enddate):
     DataCube_LU = RC.Open_nc_array(nc_outname, "Landuse")
     DataCube_Non_Consumed = RC.Open_nc_array(nc_outname, "Non_Consumed_Water", Startdate, Enddate)
 
-    # Classes that are manmade in the LULC
-    Manmade_Classes = ['Irrigated crops','Managed water bodies','Aquaculture','Residential','Greenhouses','Other']
+    # Select the pixels that are manmade in the LULC
+    Manmade = Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_Table('manmade'), DataCube_LU)
 
-    # Select the pixels that are manmade
-    LU_Classes = Start.Get_Dictionaries.get_sheet5_classes()
-
-    # Create Array for consumed fractions
-    DataCube_GWF_Mask = np.zeros(DataCube_LU.shape)
-
-    # Create array with consumed_fractions
-    for Manmade_Class in Manmade_Classes:
-        Values_LULC = LU_Classes[Manmade_Class]
-        for Value_LULC in Values_LULC:
-            DataCube_GWF_Mask[DataCube_LU == Value_LULC] = DataCube_GWF[DataCube_LU == Value_LULC]
+    # Create array with the grey water footprint of the manmade pixels
+    DataCube_GWF_Mask = np.where(Manmade == 1, DataCube_GWF, 0.)
 
     # Calculate the Surface water and groundwater components based on the fraction
     DataCube_NonRecovableFlow = DataCube_Non_Consumed[:,:,:] * DataCube_GWF_Mask[None,:,:]
@@ -38,21 +38,8 @@ def Fraction_Based(nc_outname, Startdate, Enddate):
     DataCube_LU = RC.Open_nc_array(nc_outname, "Landuse")
     DataCube_ETblue = RC.Open_nc_array(nc_outname, "Blue_Evapotranspiration", Startdate, Enddate)
 
-    # Get Classes
-    LU_Classes = Start.Get_Dictionaries.get_sheet5_classes()
-    LU_Classes_Keys = LU_Classes.keys()
-
-    # Get fractions
-    consumed_fractions_dict = Start.Get_Dictionaries.consumed_fractions()
-
-    # Create Array for consumed fractions
-    DataCube_Consumed_Fractions = np.ones(DataCube_LU.shape) * np.nan
-
     # Create array with consumed_fractions
-    for Classes_LULC in LU_Classes_Keys:
-        Values_LULC = LU_Classes[Classes_LULC]
-        for Value_LULC in Values_LULC:
-            DataCube_Consumed_Fractions[DataCube_LU == Value_LULC] = consumed_fractions_dict[Classes_LULC]
+    DataCube_Consumed_Fractions = Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_Table('consumed_fractions'), DataCube_LU)
 
     # Calculated Total Supply
     DataCube_Tot_Sup = DataCube_ETblue[:,:,:]/DataCube_Consumed_Fractions[None,:,:]
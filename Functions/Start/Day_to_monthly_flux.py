@@ -8,14 +8,8 @@ Module: Function/Start
 """
 # General Python modules
 import numpy as np
-import os
-import glob
-import pandas as pd
-import gdal
-import calendar
 
-
-def Nearest_Interpolate(Dir_in, Startdate, Enddate, Dir_out=None):
+def Nearest_Interpolate(Dir_in, Startdate, Enddate, Dir_out = None, cores = 1):
     """
     This functions calculates monthly tiff files based on the daily tiff files.
     (will calculate the total sum)
@@ -30,77 +24,33 @@ def Nearest_Interpolate(Dir_in, Startdate, Enddate, Dir_out=None):
         Contains the end date of the model 'yyyy-mm-dd'
     Dir_out : str
         Path to the output data, default is same as Dir_in
+    cores : int
+        Amount of files that are read in parallel
 
     """
     # import WA+ modules
-    import watools.General.data_conversions as DC
-    import watools.General.raster_conversions as RC
-
-    # Change working directory
-    os.chdir(Dir_in)
-
-    # Define end and start date
-    Dates = pd.date_range(Startdate, Enddate, freq='MS')
-
-    # Find all monthly files
-    files = glob.glob('*daily*.tif')
-
-    # Get array information and define projection
-    geo_out, proj, size_X, size_Y = RC.Open_array_info(files[0])
-    if int(proj.split('"')[-2]) == 4326:
-        proj = "WGS84"
-
-    # Get the No Data Value
-    dest = gdal.Open(files[0])
-    NDV = dest.GetRasterBand(1).GetNoDataValue()
-
-    # Define output directory
-    if Dir_out is None:
-	     Dir_out = Dir_in
-
-    if not os.path.exists(Dir_out):
-	     os.makedirs(Dir_out)
-
-    # loop over the months and sum the days
-    for date in Dates:
-        Year = date.year
-        Month = date.month
-        files_one_year = glob.glob('*daily*%d.%02d*.tif' % (Year, Month))
-
-        # Create empty arrays
-        Month_data = np.zeros([size_Y, size_X])
-
-        # Get amount of days in month
-        Amount_days_in_month = int(calendar.monthrange(Year, Month)[1])
+    import watools.General.file_catalogue as FC
+    import watools.Functions.Start.Temporal_Resampling as TR
 
-        if len(files_one_year) is not Amount_days_in_month:
-            print("One day is missing!!! month %s year %s" %(Month, Year))
+    # Find all the daily files and get their dates
+    files, Dates_files = FC.Files_Dates(Dir_in, '*daily*.tif')
 
-        for file_one_year in files_one_year:
-            file_path = os.path.join(Dir_in, file_one_year)
+    # Define the months and which days are within every month
+    Dates, Months_start, Months_end = TR.Periods(Startdate, Enddate, freq = 'MS')
+    Weights = TR.Overlap_Weights(Dates_files, Dates_files, Months_start, Months_end)
 
-            Day_data = RC.Open_tiff_array(file_path)
-            Day_data[np.isnan(Day_data)] = 0.0
-            Day_data[Day_data == -9999] = 0.0
-            Month_data += Day_data
+    # Check if all the days are there
+    Amount_days_in_month = Months_end - Months_start + 1
+    for date, Amount_files, Amount_days in zip(Dates, np.sum(Weights, axis = 0), Amount_days_in_month):
+        if Amount_files != Amount_days:
+            print("One day is missing!!! month %s year %s" %(date.month, date.year))
 
-        # Define output name
-        output_name = os.path.join(Dir_out, file_one_year
-                                   .replace('daily', 'monthly')
-                                   .replace('day', 'month'))
+    # Define output directory and names
+    if Dir_out == None:
+        Dir_out = Dir_in
+    Output_names = TR.Output_Names(Dir_out, files[0], [('daily', 'monthly'), ('day', 'month')], Dates)
 
-        output_name = output_name[:-14] + '%d.%02d.01.tif' % (date.year, date.month)
-
-        # Save tiff file
-        DC.Save_as_tiff(output_name, Month_data, geo_out, proj)
+    # Sum the days of every month
+    TR.Resample(files, Weights, Output_names, Average = False, cores = cores)
 
     return
-
-
-
-
-
-
-
-
-
@@ -9,7 +9,6 @@ Module: Function/Start
 Those function download the data that is not downloaded yet
 """
 import os
-import glob
 import pandas as pd
 import numpy as np
 import calendar
@@ -792,9 +791,11 @@ def Set_Start_End_Dates(Startdate, Enddate, Data_Path, freq):
         Contains all the end dates of data that needs to be downloaded
     """
 
+    # import WA+ modules
+    import watools.General.file_catalogue as FC
+
     # Check if folder already exists
     if os.path.exists(Data_Path):
-        os.chdir(Data_Path)
 
         # Defines the dates of the 8 daily periods
         if freq == '8D':
@@ -822,18 +823,15 @@ def Set_Start_End_Dates(Startdate, Enddate, Data_Path, freq):
 
             # Get all the files that already exists in folder
             if freq == 'MS':
-                files = glob.glob('*monthly_%d.%02d.01.tif' % (year, month))
+                files = FC.Find_Files(Data_Path, '*monthly_%d.%02d.01.tif' % (year, month))
             if freq == 'AS':
-                files = glob.glob('*yearly_%d.%02d.01.tif' % (year, month))
+                files = FC.Find_Files(Data_Path, '*yearly_%d.%02d.01.tif' % (year, month))
             if freq == 'D':
-                files = glob.glob('*daily_%d.%02d.%02d.tif' % (year, month,
-                                                               day))
+                files = FC.Find_Files(Data_Path, '*daily_%d.%02d.%02d.tif' % (year, month, day))
             if freq == '8D':
-                files = glob.glob('*8-daily_%d.%02d.%02d.tif' % (year, month,
-                                                                 day))
+                files = FC.Find_Files(Data_Path, '*8-daily_%d.%02d.%02d.tif' % (year, month, day))
             if freq == '16D':
-                files = glob.glob('*16-daily_%d.%02d.%02d.tif' % (year, month,
-                                                                 day))
+                files = FC.Find_Files(Data_Path, '*16-daily_%d.%02d.%02d.tif' % (year, month, day))
 
             # If file exits put a 1 in the array
             if len(files) == 1:
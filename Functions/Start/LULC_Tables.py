@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Tim Hessels
+         UNESCO-IHE 2017
+Contact: t.hessels@unesco-ihe.org
+Repository: https://github.com/wateraccounting/wa
+Module: Function/Start
+"""
+# General Python modules
+import numpy as np
+
+# import WA modules
+import watools.Functions.Start.Get_Dictionaries as GD
+
+# Lookup tables that are already created
+Tables = dict()
+
+# Position in the tables used for the pixels without a valid LULC code
+No_Code = 256
+
+def Get_Table(Name, version = '1.0'):
+    """
+    This functions returns a lookup table (indexed by the LULC code) of one of the
+    dictionaries of Get_Dictionaries. The table is created once and reused afterwards.
+
+    Parameters
+    ----------
+    Name : str
+        'consumed_fractions', 'sw_supply_fractions', 'sw_return_fractions',
+        'manmade' (1 for the manmade sheet 5 classes) or 'moving_window'
+        (length of the moving average of ET blue and green)
+    version : str
+        Version of the dictionaries
+
+    Returns
+    -------
+    Table : array
+        Array containing the value for every LULC code (nan if not defined)
+
+    """
+    if not (Name, version) in Tables:
+
+        if Name == 'moving_window':
+            Classes, Parameters = GD.get_bluegreen_classes(version = version)
+            Table = Create_Table(Classes, Parameters)
+
+        elif Name == 'manmade':
+            Manmade_Classes = ['Irrigated crops','Managed water bodies','Aquaculture','Residential','Greenhouses','Other']
+            Classes = GD.get_sheet5_classes(version = version)
+            Table = Create_Table(dict((Class, Classes[Class]) for Class in Manmade_Classes), dict.fromkeys(Manmade_Classes, 1.), Default = 0.)
+
+        else:
+            Get_Fractions = dict({'consumed_fractions': GD.consumed_fractions,
+                                  'sw_supply_fractions': GD.sw_supply_fractions,
+                                  'sw_return_fractions': GD.sw_return_fractions})[Name]
+            Table = Create_Table(GD.get_sheet5_classes(version = version), Get_Fractions(version = version))
+
+        Table.flags.writeable = False
+        Tables[(Name, version)] = Table
+
+    return(Tables[(Name, version)])
+
+def Get_LULC_Table(Column, lulc_version = '4.0'):
+    """
+    This functions returns a lookup table (indexed by the LULC code) of one column of the LULC legend
+
+    Parameters
+    ----------
+    Column : str
+        Name of the column in the legend of get_lulcs (e.g. 'Beneficial T [%]')
+    lulc_version : str
+        Version of the LULC legend
+
+    Returns
+    -------
+    Table : array
+        Array containing the value for every LULC code (0 if not defined)
+
+    """
+    if not (Column, lulc_version) in Tables:
+        lulc_dict = GD.get_lulcs(lulc_version = lulc_version)
+        Index_Column = lulc_dict['legend'].index(Column)
+        Codes = [Code for Code in lulc_dict.keys() if Code != 'legend']
+        Table = Create_Table(dict((Code, [Code]) for Code in Codes), dict((Code, lulc_dict[Code][Index_Column]) for Code in Codes), Default = 0.)
+        Table.flags.writeable = False
+        Tables[(Column, lulc_version)] = Table
+
+    return(Tables[(Column, lulc_version)])
+
+def Create_Table(Classes, Parameters, Default = np.nan):
+    """
+    This functions creates a lookup table (indexed by the LULC code) of the parameter of each class
+
+    Parameters
+    ----------
+    Classes : dict
+        Dictionary containing the LULC codes of each class
+    Parameters : dict
+        Dictionary containing the parameter of each class
+    Default : float
+        Value of the LULC codes that are not part of a class
+
+    Returns
+    -------
+    Table : array
+        Array containing the value for every LULC code
+
+    """
+    Table = np.ones(No_Code + 1) * Default
+
+    # The same order as the dictionary, so the last class wins if a code is in more classes
+    for Class in Classes.keys():
+        if Class in Parameters:
+            Table[Classes[Class]] = Parameters[Class]
+
+    return(Table)
+
+def Apply_Table(Table, LU):
+    """
+    This functions converts a LULC map into a map of a parameter by using a lookup table
+
+    Parameters
+    ----------
+    Table : array
+        Lookup table, output of Get_Table, Get_LULC_Table or Create_Table
+    LU : array
+        Array containing the LULC map
+
+    Returns
+    -------
+    Array : array
+        Array containing the parameter of each pixel
+
+    """
+    LU = np.asarray(LU)
+    with np.errstate(invalid = 'ignore'):
+        Valid = np.logical_and.reduce([np.isfinite(LU), LU >= 0, LU < No_Code, np.floor(LU) == LU])
+    Index = np.where(Valid, LU, No_Code).astype(np.int32)
+
+    return(Table[Index])
@@ -8,12 +8,8 @@ Module: Function/Start
 """
 # General Python modules
 import numpy as np
-import os
-import glob
-import pandas as pd
-import gdal
 
-def Nearest_Interpolate(Dir_in, Startdate, Enddate, Dir_out = None):
+def Nearest_Interpolate(Dir_in, Startdate, Enddate, Dir_out = None, cores = 1):
     """
     This functions calculates yearly tiff files based on the monthly tiff files. (will calculate the total sum)
 
@@ -27,68 +23,32 @@ def Nearest_Interpolate(Dir_in, Startdate, Enddate, Dir_out = None):
         Contains the end date of the model 'yyyy-mm-dd'
     Dir_out : str
         Path to the output data, default is same as Dir_in
+    cores : int
+        Amount of files that are read in parallel
 
     """
     # import WA+ modules
-    import watools.General.data_conversions as DC
-    import watools.General.raster_conversions as RC
+    import watools.General.file_catalogue as FC
+    import watools.Functions.Start.Temporal_Resampling as TR
 
-    # Change working directory
-    os.chdir(Dir_in)
+    # Find all the monthly files and get their dates
+    files, Dates_files = FC.Files_Dates(Dir_in, '*monthly*.tif')
 
-    # Define end and start date
-    Dates = pd.date_range(Startdate, Enddate, freq='AS')
+    # Define the years and which months are within every year
+    Dates, Years_start, Years_end = TR.Periods(Startdate, Enddate, freq = 'AS')
+    Weights = TR.Overlap_Weights(Dates_files, Dates_files, Years_start, Years_end)
 
-    # Find all monthly files
-    files = glob.glob('*monthly*.tif')
+    # Check if all the months are there
+    for date, Amount_files in zip(Dates, np.sum(Weights, axis = 0)):
+        if Amount_files != 12:
+            print("One month in year %s is missing!" %date.year)
 
-    # Get array information and define projection
-    geo_out, proj, size_X, size_Y = RC.Open_array_info(files[0])
-    if int(proj.split('"')[-2]) == 4326:
-        proj = "WGS84"
+    # Define output directory and names
+    if Dir_out == None:
+        Dir_out = Dir_in
+    Output_names = TR.Output_Names(Dir_out, files[0], [('monthly', 'yearly'), ('month', 'year')], Dates, freq = 'AS')
 
-    # Get the No Data Value
-    dest = gdal.Open(files[0])
-    NDV = dest.GetRasterBand(1).GetNoDataValue()
-
-    for date in Dates:
-        Year = date.year
-        files_one_year = glob.glob('*monthly*%d*.tif' %Year)
-
-        # Create empty arrays
-        Year_data = np.zeros([size_Y, size_X])
-
-        if len(files_one_year) is not int(12):
-            print("One month in year %s is missing!" %Year)
-
-        for file_one_year in files_one_year:
-            file_path = os.path.join(Dir_in, file_one_year)
-
-            Month_data = RC.Open_tiff_array(file_path)
-            Month_data[np.isnan(Month_data)] = 0.0
-            Month_data[Month_data == -9999] = 0.0
-            Year_data += Month_data
-
-        # Define output directory
-        if Dir_out == None:
-            Dir_out = Dir_in
-        if not os.path.exists(Dir_out):
-            os.makedirs(Dir_out)
-
-        # Define output name
-        output_name = os.path.join(Dir_out, file_one_year.replace('monthly', 'yearly').replace('month','year'))
-        output_name = output_name[:-14] + '%d.01.01.tif' %(date.year)
-
-        # Save tiff file
-        DC.Save_as_tiff(output_name, Year_data, geo_out, proj)
+    # Sum the months of every year
+    TR.Resample(files, Weights, Output_names, Average = False, cores = cores)
 
     return
-
-
-
-
-
-
-
-
-
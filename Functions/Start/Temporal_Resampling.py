@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Tim Hessels
+         UNESCO-IHE 2017
+Contact: t.hessels@unesco-ihe.org
+Repository: https://github.com/wateraccounting/wa
+Module: Function/Start
+"""
+# General Python modules
+import numpy as np
+import os
+import pandas as pd
+import gdal
+
+def Periods(Startdate, Enddate, freq = 'MS'):
+    """
+    This functions defines the months ('MS') or years ('AS') that are completely or partly between the start and end date
+
+    Parameters
+    ----------
+    Startdate : str
+        Contains the start date of the model 'yyyy-mm-dd'
+    Enddate : str
+        Contains the end date of the model 'yyyy-mm-dd'
+    freq : str
+        'MS' for months or 'AS' for years
+
+    Returns
+    -------
+    Dates : DatetimeIndex
+        First day of every period
+    Periods_start : array
+        First day (ordinal) of every period
+    Periods_end : array
+        Last day (ordinal) of every period
+
+    """
+    if freq == 'MS':
+        Offset = pd.DateOffset(months = 1)
+        Startdate = pd.Timestamp(Startdate).replace(day = 1)
+    else:
+        Offset = pd.DateOffset(years = 1)
+        Startdate = pd.Timestamp(Startdate).replace(month = 1, day = 1)
+
+    Dates = pd.date_range(Startdate, Enddate, freq = freq)
+    Periods_start = np.array([Date.toordinal() for Date in Dates], dtype = int)
+    Periods_end = np.array([(Date + Offset).toordinal() - 1 for Date in Dates], dtype = int)
+
+    return(Dates, Periods_start, Periods_end)
+
+def Overlap_Weights(Files_start, Files_end, Periods_start, Periods_end):
+    """
+    This functions calculates the amount of days that every file overlaps with every period
+
+    Parameters
+    ----------
+    Files_start, Files_end : array
+        First and last day (ordinal) of every file
+    Periods_start, Periods_end : array
+        First and last day (ordinal) of every period
+
+    Returns
+    -------
+    Weights : array
+        Array containing the amount of overlapping days [files, periods]
+
+    """
+    Last = np.minimum(np.asarray(Files_end)[:,None], np.asarray(Periods_end)[None,:])
+    First = np.maximum(np.asarray(Files_start)[:,None], np.asarray(Periods_start)[None,:])
+    Weights = np.maximum(Last - First + 1, 0).astype(float)
+
+    return(Weights)
+
+def Composite_Weights(Dates_files, Length_Composite, Periods_start, Periods_end):
+    """
+    This functions calculates the overlap weights of composites (e.g. 8 daily) with the periods.
+    The last composite of a year ends at the end of that year.
+
+    Parameters
+    ----------
+    Dates_files : array
+        First day (ordinal) of every composite
+    Length_Composite : int
+        Amount of days of one composite
+    Periods_start, Periods_end : array
+        First and last day (ordinal) of every period
+
+    Returns
+    -------
+    Weights : array
+        Array containing the amount of overlapping days [files, periods]
+
+    """
+    Ends_year = np.array([pd.Timestamp('%d-12-31' %pd.Timestamp.fromordinal(Date_file).year).toordinal() for Date_file in Dates_files], dtype = int)
+    Files_end = np.minimum(np.asarray(Dates_files) + Length_Composite - 1, Ends_year)
+
+    return(Overlap_Weights(Dates_files, Files_end, Periods_start, Periods_end))
+
+def Output_Names(Dir_out, File, Replace, Dates, freq = 'MS'):
+    """
+    This functions defines the output names of the periods based on the name of an input file
+
+    Parameters
+    ----------
+    Dir_out : str
+        Path to the output data
+    File : str
+        Path of one of the input files ('*yyyy.mm.dd.tif')
+    Replace : list
+        List with the (old, new) parts of the filename that must be replaced, e.g. [('8-daily', 'monthly')]
+    Dates : DatetimeIndex
+        First day of every period
+
+    Returns
+    -------
+    Output_names : list
+        Paths of the output files
+
+    """
+    Filename = os.path.basename(File)
+    for Old, New in Replace:
+        Filename = Filename.replace(Old, New)
+
+    Output_names = []
+    for Date in Dates:
+        if freq == 'MS':
+            Output_names.append(os.path.join(Dir_out, Filename[:-14] + '%d.%02d.01.tif' %(Date.year, Date.month)))
+        else:
+            Output_names.append(os.path.join(Dir_out, Filename[:-14] + '%d.01.01.tif' %(Date.year)))
+
+    return(Output_names)
+
+def Resample(files, Weights, Output_names, Average = True, Scale = None, cores = 1):
+    """
+    This functions creates the tiff files of the periods by reading every input file only once.
+    Each file is added to all the periods it overlaps with, and a period is saved as soon as its
+    last file is added.
+
+    Parameters
+    ----------
+    files : list
+        Paths of the input files sorted by date
+    Weights : array
+        Array containing the weight of every file in every period [files, periods]
+    Output_names : list
+        Paths of the output files of the periods
+    Average : boolean
+        True to calculate the weighted average (missing data is ignored),
+        False to calculate the weighted sum (missing data is zero)
+    Scale : array
+        Factor for every period that is multiplied with the output (default is 1)
+    cores : int
+        Amount of files that are read in parallel
+
+    """
+    # import WA+ modules
+    import watools.General.data_conversions as DC
+    import watools.General.raster_conversions as RC
+    from joblib import Parallel, delayed
+
+    Weights = np.asarray(Weights, dtype = float)
+    Number_periods = Weights.shape[1]
+    if Scale is None:
+        Scale = np.ones(Number_periods)
+
+    # Get array information and define projection
+    geo_out, proj, size_X, size_Y = RC.Open_array_info(files[0])
+    if int(proj.split('"')[-2]) == 4326:
+        proj = "WGS84"
+
+    # Get the No Data Value
+    dest = gdal.Open(files[0])
+    NDV = dest.GetRasterBand(1).GetNoDataValue()
+    dest = None
+
+    # Create output directories
+    for Dir_out in set(os.path.dirname(Output_name) for Output_name in Output_names):
+        if not os.path.exists(Dir_out):
+            os.makedirs(Dir_out)
+
+    # Find the last file of every period
+    Used = Weights > 0
+    Last_file = np.where(np.any(Used, axis = 0), Weights.shape[0] - 1 - np.argmax(Used[::-1,:], axis = 0), -1)
+
+    # Periods without files
+    for Period in np.argwhere(Last_file == -1)[:,0]:
+        if Average:
+            DC.Save_as_tiff(Output_names[Period], np.ones([size_Y, size_X]) * np.nan, geo_out, proj)
+        else:
+            print("No data for %s" %Output_names[Period])
+
+    # Read the files that are used in chunks of cores files
+    Files_used = np.argwhere(np.any(Used, axis = 1))[:,0]
+    Sums = dict()
+    Weights_tot = dict()
+    for Chunk_start in range(0, len(Files_used), cores):
+        Chunk = Files_used[Chunk_start:Chunk_start + cores]
+        if cores == 1:
+            Datas = [Read_File(files[File_number], NDV) for File_number in Chunk]
+        else:
+            Datas = Parallel(n_jobs = cores, backend = 'threading')(delayed(Read_File)(files[File_number], NDV) for File_number in Chunk)
+
+        for File_number, Data in zip(Chunk, Datas):
+            Valid = ~np.isnan(Data)
+            Data[~Valid] = 0.0
+
+            # Add the file to all the periods it overlaps with
+            for Period in np.argwhere(Used[File_number,:])[:,0]:
+                if Period not in Sums:
+                    Sums[Period] = np.zeros([size_Y, size_X])
+                    Weights_tot[Period] = np.zeros([size_Y, size_X])
+                Sums[Period] += Weights[File_number, Period] * Data
+                if Average:
+                    Weights_tot[Period] += Weights[File_number, Period] * Valid
+
+                # Save the period after its last file
+                if Last_file[Period] == File_number:
+                    if Average:
+                        Data_period = np.ones([size_Y, size_X]) * np.nan
+                        Data_period[Weights_tot[Period] != 0.] = Sums[Period][Weights_tot[Period] != 0.] / Weights_tot[Period][Weights_tot[Period] != 0.]
+                    else:
+                        Data_period = Sums[Period]
+                    DC.Save_as_tiff(Output_names[Period], Data_period * Scale[Period], geo_out, proj)
+                    del Sums[Period], Weights_tot[Period]
+
+    return()
+
+def Read_File(File, NDV):
+    """
+    This functions opens a tiff file and sets the missing data to nan
+    """
+    # import WA+ modules
+    import watools.General.raster_conversions as RC
+
+    Data = np.float64(RC.Open_tiff_array(File))
+    Data[np.logical_or(Data == NDV, Data == -9999)] = np.nan
+
+    return(Data)
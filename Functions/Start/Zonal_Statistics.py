@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Tim Hessels
+         UNESCO-IHE 2017
+Contact: t.hessels@unesco-ihe.org
+Repository: https://github.com/wateraccounting/wa
+Module: Function/Start
+"""
+# General Python modules
+import numpy as np
+
+def Create_Zones(LULC, Classes):
+    """
+    This functions maps the LULC map once on the LULC classes that are used by the sheets.
+    Every pixel gets the index of its LULC value, and a membership matrix defines
+    which LULC values belong to which class (a LULC value can be part of more classes).
+
+    Parameters
+    ----------
+    LULC : array
+        Array containing the LULC map
+    Classes : list
+        List with for every class a list of the LULC values of that class
+
+    Returns
+    -------
+    Zones : tuple
+        Tuple containing the index array of the LULC values and the membership matrix [values, classes]
+
+    """
+    # Get the index of the LULC value of each pixel
+    Values_LULC, Index_LULC = np.unique(LULC, return_inverse = True)
+
+    # Define which LULC values are part of each class
+    Membership = np.zeros([len(Values_LULC), len(Classes)])
+    for Class_number, Values_Class in enumerate(Classes):
+        Membership[np.in1d(Values_LULC, Values_Class), Class_number] = 1
+
+    return(Index_LULC.reshape(np.shape(LULC)), Membership)
+
+def Sum_Per_Class(Zones, DataCube):
+    """
+    This functions calculates the spatial sum of each class for every time step (nan values are ignored)
+
+    Parameters
+    ----------
+    Zones : tuple
+        Output of Create_Zones
+    DataCube : array
+        Array containing the data [time, y, x] or [y, x]
+
+    Returns
+    -------
+    Sums : array
+        Array containing the sums [classes, time] (or [classes] for a 2D input)
+
+    """
+    Index_LULC, Membership = Zones
+    Number_Values = Membership.shape[0]
+    Data = np.reshape(DataCube, (-1, Index_LULC.size))
+    Time_steps = Data.shape[0]
+
+    # Sum per LULC value and time step with a single bincount
+    Index_all = (Index_LULC.ravel()[None,:] + Number_Values * np.arange(Time_steps)[:,None]).ravel()
+    Weights = np.where(np.isnan(Data), 0., Data).ravel()
+    Sums_LULC = np.bincount(Index_all, weights = Weights, minlength = Number_Values * Time_steps).reshape(Time_steps, Number_Values)
+
+    # Sum the LULC values of every class
+    Sums = np.dot(Membership.T, Sums_LULC.T)
+
+    if np.ndim(DataCube) == 2:
+        Sums = Sums[:,0]
+
+    return(Sums)
@@ -15,8 +15,8 @@ This data is used within a water accounting framework.
 """
 
 
-from watools.Functions.Start import Area_converter, Boundaries, Download_Data, Eightdaily_to_monthly_state, Get_Dictionaries, Weekly_to_monthly_flux, Sixteendaily_to_monthly_state, Monthly_to_yearly_flux, Day_to_monthly_flux, WaitbarConsole
+from watools.Functions.Start import Area_converter, Boundaries, Download_Data, Eightdaily_to_monthly_state, Get_Dictionaries, Weekly_to_monthly_flux, Sixteendaily_to_monthly_state, Monthly_to_yearly_flux, Day_to_monthly_flux, WaitbarConsole, Zonal_Statistics, LULC_Tables, Temporal_Resampling
 
-__all__ = ['Area_converter', 'Boundaries', 'Download_Data','Eightdaily_to_monthly_state', 'Get_Dictionaries', 'Weekly_to_monthly_flux', 'Sixteendaily_to_monthly_state', 'Monthly_to_yearly_flux', 'Day_to_monthly_flux', 'WaitbarConsole']
+__all__ = ['Area_converter', 'Boundaries', 'Download_Data','Eightdaily_to_monthly_state', 'Get_Dictionaries', 'Weekly_to_monthly_flux', 'Sixteendaily_to_monthly_state', 'Monthly_to_yearly_flux', 'Day_to_monthly_flux', 'WaitbarConsole', 'Zonal_Statistics', 'LULC_Tables', 'Temporal_Resampling']
 
 __version__ = '0.1'
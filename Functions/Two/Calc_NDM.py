@@ -11,7 +11,6 @@ import os
 import gdal
 import numpy as np
 import pandas as pd
-import glob
 
 def NPP_GPP_Based(Dir_Basin, Data_Path_GPP, Data_Path_NPP, Startdate, Enddate):
     """
@@ -41,6 +40,7 @@ def NPP_GPP_Based(Dir_Basin, Data_Path_GPP, Data_Path_NPP, Startdate, Enddate):
     # import WA+ modules
     import watools.General.data_conversions as DC
     import watools.General.raster_conversions as RC
+    import watools.General.file_catalogue as FC
 
     # Define output folder for Normalized Dry Matter
     Data_Path_NDM = os.path.join(Dir_Basin, "NDM")
@@ -58,11 +58,8 @@ def NPP_GPP_Based(Dir_Basin, Data_Path_GPP, Data_Path_NPP, Startdate, Enddate):
     # Loop over the years
     for year in Years:
 
-        # Change working directory to the NPP folder
-        os.chdir(Data_Path_NPP)
-
         # Open yearly NPP data
-        yearly_NPP_File = glob.glob('*yearly*%d.01.01.tif' %int(year))[0]
+        yearly_NPP_File = FC.Find_Files(Data_Path_NPP, '*yearly*%d.01.01.tif' %int(year))[0]
         Yearly_NPP = RC.Open_tiff_array(yearly_NPP_File)
 
         # Get the No Data Value of the NPP file
@@ -72,11 +69,8 @@ def NPP_GPP_Based(Dir_Basin, Data_Path_GPP, Data_Path_NPP, Startdate, Enddate):
         # Set the No Data Value to Nan
         Yearly_NPP[Yearly_NPP == NDV] = np.nan
 
-        # Change working directory to the GPP folder
-        os.chdir(Data_Path_GPP)
-
         # Find all the monthly files of that year
-        monthly_GPP_Files = glob.glob('*monthly*%d.*.01.tif' %int(year))
+        monthly_GPP_Files = FC.Find_Files(Data_Path_GPP, '*monthly*%d.*.01.tif' %int(year))
 
         # Check if it are 12 files otherwise something is wrong and send the ERROR
         if not len(monthly_GPP_Files) == 12:
@@ -84,7 +78,7 @@ def NPP_GPP_Based(Dir_Basin, Data_Path_GPP, Data_Path_NPP, Startdate, Enddate):
 
         # Get the projection information of the GPP inputs
         geo_out, proj, size_X, size_Y = RC.Open_array_info(monthly_GPP_Files[0])
-        geo_out_NPP, proj_NPP, size_X_NPP, size_Y_NPP = RC.Open_array_info(os.path.join(Data_Path_NPP,yearly_NPP_File))
+        geo_out_NPP, proj_NPP, size_X_NPP, size_Y_NPP = RC.Open_array_info(yearly_NPP_File)
 
 
         if int(proj.split('"')[-2]) == 4326:
@@ -126,7 +120,7 @@ def NPP_GPP_Based(Dir_Basin, Data_Path_GPP, Data_Path_NPP, Startdate, Enddate):
                 month = Date.month
 
                 # Get the GPP file of the current year and month
-                monthly_GPP_File = glob.glob('*monthly_%d.%02d.01.tif' %(int(year), int(month)))[0]
+                monthly_GPP_File = FC.Find_Files(Data_Path_GPP, '*monthly_%d.%02d.01.tif' %(int(year), int(month)))[0]
                 monthly_GPP = RC.Open_tiff_array(monthly_GPP_File)
                 monthly_GPP[monthly_GPP == NDV] = np.nan
 
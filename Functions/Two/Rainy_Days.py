@@ -8,12 +8,12 @@ Module: Function/Two
 """
 # Import general modules
 import calendar
-import glob
 import os
+import gdal
 import pandas as pd
 import numpy as np
 
-def Calc_Rainy_Days(Dir_Basin, Data_Path_P, Startdate, Enddate):
+def Calc_Rainy_Days(Dir_Basin, Data_Path_P, Startdate, Enddate, Thresholds = None, Block_Size = None, cores = 1):
     """
     This functions calculates the amount of rainy days based on daily precipitation data.
 
@@ -27,6 +27,13 @@ def Calc_Rainy_Days(Dir_Basin, Data_Path_P, Startdate, Enddate):
         Contains the start date of the model 'yyyy-mm-dd'
     Enddate : str
         Contains the end date of the model 'yyyy-mm-dd'
+    Thresholds : dict
+        Dictionary containing the name of the output and the rainfall (mm/day) above which
+        a day is counted, default is {'Rainy_Days': 0.201}
+    Block_Size : int
+        Amount of rows that are read at once, default is None (the whole raster)
+    cores : int
+        Amount of months that are calculated in parallel
 
     Returns
     -------
@@ -34,74 +41,99 @@ def Calc_Rainy_Days(Dir_Basin, Data_Path_P, Startdate, Enddate):
         Path from the Dir_Basin to the rainy days data
 
     """
-    # import WA+ modules
-    import watools.General.data_conversions as DC
-    import watools.General.raster_conversions as RC
+    from joblib import Parallel, delayed
 
     # Create an output directory to store the rainy days tiffs
     Data_Path_RD = os.path.join(Dir_Basin, 'Rainy_Days')
     if not os.path.exists(Data_Path_RD):
         os.mkdir(Data_Path_RD)
 
+    # Define the thresholds of a rainy day
+    if Thresholds is None:
+        Thresholds = dict({'Rainy_Days': 0.201})
+
     # Define the dates that must be created
     Dates = pd.date_range(Startdate, Enddate, freq ='MS')
 
-    # Set working directory to the rainfall folder
-    os.chdir(Data_Path_P)
-
-    # Open all the daily data and store the data in a 3D array
-    for Date in Dates:
-        # Define the year and month and amount of days in month
-        year = Date.year
-        month = Date.month
-        daysinmonth = calendar.monthrange(year, month)[1]
-
-        # Set the third (time) dimension of array starting at 0
-        i = 0
-
-        # Find all files of that month
-        files = glob.glob('*daily_%d.%02d.*.tif' %(year, month))
-
-        # Check if the amount of files corresponds with the amount of days in month
-        if len(files) is not daysinmonth:
-            print('ERROR: Not all Rainfall days for month %d and year %d are downloaded'  %(month, year))
-
-        # Loop over the days and store data in raster
-        for File in files:
-            dir_file = os.path.join(Data_Path_P, File)
-
-            # Get array information and create empty numpy array for daily rainfall when looping the first file
-            if File == files[0]:
-
-                # Open geolocation info and define projection
-                geo_out, proj, size_X, size_Y = RC.Open_array_info(dir_file)
-                if int(proj.split('"')[-2]) == 4326:
-                    proj = "WGS84"
-
-                # Create empty array for the whole month
-                P_Daily = np.zeros([daysinmonth,size_Y, size_X])
-
-            # Open data and put the data in 3D array
-            Data = RC.Open_tiff_array(dir_file)
+    # Count the rainy days of every month
+    if cores == 1:
+        for Date in Dates:
+            Count_Rainy_Days_Month(Date, Data_Path_P, Data_Path_RD, Thresholds, Block_Size)
+    else:
+        Parallel(n_jobs = cores)(delayed(Count_Rainy_Days_Month)(Date, Data_Path_P, Data_Path_RD, Thresholds, Block_Size) for Date in Dates)
 
-            # Remove the weird numbers
-            Data[Data<0] = 0
+    return(Data_Path_RD)
 
-            # Add the precipitation to the monthly cube
-            P_Daily[i, :, :] = Data
-            i += 1
-
-        # Define a rainy day
-        P_Daily[P_Daily > 0.201] = 1
-        P_Daily[P_Daily != 1] = 0
-
-        # Sum the amount of rainy days
-        RD_one_month = np.nansum(P_Daily,0)
-
-        # Define output name
-        Outname = os.path.join(Data_Path_RD, 'Rainy_Days_NumOfDays_monthly_%d.%02d.01.tif' %(year, month))
+def Count_Rainy_Days_Month(Date, Data_Path_P, Data_Path_RD, Thresholds, Block_Size = None):
+    """
+    This functions counts the rainy days of one month by reading the daily rainfall
+    one day (or one block of rows of one day) at the time.
 
-        # Save tiff file
-        DC.Save_as_tiff(Outname, RD_one_month, geo_out, proj)
+    Parameters
+    ----------
+    Date : pandas Timestamp
+        First day of the month
+    Data_Path_P : str
+        Path to the daily rainfall data
+    Data_Path_RD : str
+        Path to the rainy days data
+    Thresholds : dict
+        Dictionary containing the name of the output and the rainfall (mm/day) above which
+        a day is counted
+    Block_Size : int
+        Amount of rows that are read at once, default is None (the whole raster)
 
-    return(Data_Path_RD)
\ No newline at end of file
+    """
+    # import WA+ modules
+    import watools.General.data_conversions as DC
+    import watools.General.raster_conversions as RC
+    import watools.General.file_catalogue as FC
+
+    # Define the year and month and amount of days in month
+    year = Date.year
+    month = Date.month
+    daysinmonth = calendar.monthrange(year, month)[1]
+
+    # Find all files of that month
+    files = FC.Find_Files(Data_Path_P, '*daily_%d.%02d.*.tif' %(year, month))
+
+    # Check if the amount of files corresponds with the amount of days in month
+    if len(files) is not daysinmonth:
+        print('ERROR: Not all Rainfall days for month %d and year %d are downloaded'  %(month, year))
+    if len(files) == 0:
+        return()
+
+    # Open geolocation info and define projection
+    geo_out, proj, size_X, size_Y = RC.Open_array_info(files[0])
+    if int(proj.split('"')[-2]) == 4326:
+        proj = "WGS84"
+
+    # Create a counter for every threshold
+    Counters = dict()
+    for Name in Thresholds.keys():
+        Counters[Name] = np.zeros([size_Y, size_X], dtype = np.uint8)
+
+    if Block_Size is None:
+        Block_Size = size_Y
+
+    # Loop over the blocks of rows and the days and count the days above the thresholds
+    datasets = [gdal.Open(File) for File in files]
+    for Row_Start in range(0, size_Y, Block_Size):
+        Rows = min(Block_Size, size_Y - Row_Start)
+
+        for dataset in datasets:
+            # Compare in float64 like the daily cube of the old implementation
+            Data = dataset.GetRasterBand(1).ReadAsArray(0, Row_Start, size_X, Rows).astype(np.float64)
+
+            # Negative values and nan are never a rainy day
+            with np.errstate(invalid = 'ignore'):
+                for Name, Threshold in Thresholds.items():
+                    Counters[Name][Row_Start:Row_Start + Rows, :] += Data > Threshold
+    datasets = None
+
+    # Save tiff files
+    for Name in Thresholds.keys():
+        Outname = os.path.join(Data_Path_RD, '%s_NumOfDays_monthly_%d.%02d.01.tif' %(Name, year, month))
+        DC.Save_as_tiff(Outname, Counters[Name], geo_out, proj)
+
+    return()
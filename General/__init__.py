@@ -10,8 +10,8 @@ Description:
 This module consists of the general functions that are used in the WA+ toolbox
 """
 
-from watools.General import data_conversions, raster_conversions
+from watools.General import data_conversions, raster_conversions, file_catalogue, data_types
 
-__all__ = ['data_conversions','raster_conversions']
+__all__ = ['data_conversions','raster_conversions','file_catalogue','data_types']
 
 __version__ = '0.1'
\ No newline at end of file
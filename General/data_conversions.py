@@ -15,6 +15,10 @@ import numpy as np
 import netCDF4
 import time
 
+# Layout of the variables in the yearly NetCDF files, can be changed with Set_NC_Layout
+NC_Layout = dict({'chunks': 'map', 'zlib': True, 'complevel': 4, 'shuffle': True,
+                  'tile': 32})
+
 def Convert_nc_to_tiff(input_nc, output_folder):
     """
     This function converts the nc file into tiff files
@@ -204,9 +208,8 @@ def Extract_Data_tar_gz(zip_filename, output_folder):
                            stored
     """
 
-    os.chdir(output_folder)
     tar = tarfile.open(zip_filename, "r:gz")
-    tar.extractall()
+    tar.extractall(output_folder)
     tar.close()
     
 
@@ -292,6 +295,7 @@ def Save_as_NC(namenc, DataCube, Var, Reference_filename,  Startdate = '', Endda
     """
     # Import modules
     import watools.General.raster_conversions as RC
+    import watools.General.data_types as DT
     from netCDF4 import Dataset
 
     if not os.path.exists(namenc):
@@ -351,10 +355,10 @@ def Save_as_NC(namenc, DataCube, Var, Reference_filename,  Startdate = '', Endda
 
         # Create the data variable
         if Startdate is not '':
-            preco = nco.createVariable('%s' %Var, 'f8',  ('time', 'latitude', 'longitude'), zlib=True, least_significant_digit=1)
+            preco = nco.createVariable('%s' %Var, DT.Compute_Type(),  ('time', 'latitude', 'longitude'), zlib=True, least_significant_digit=1)
             timeo[:]=time_or
         else:
-            preco = nco.createVariable('%s' %Var, 'f8',  ('latitude', 'longitude'), zlib=True, least_significant_digit=1)
+            preco = nco.createVariable('%s' %Var, DT.Compute_Type(),  ('latitude', 'longitude'), zlib=True, least_significant_digit=1)
 
         # Set the data variable information
         preco.scale_factor = Scaling_factor
@@ -387,6 +391,72 @@ def Create_NC_name(Var, Simulation, Dir_Basin, sheet_nmbr, info = ''):
 
     return(nameTot)
 
+def Set_NC_Layout(**Layout):
+    """
+    This function changes the layout of the variables in the yearly NetCDF files
+
+    Keyword arguments:
+    chunks -- 'map' (default), 'timeseries' or a tuple with the chunk shape
+        'map' is fast for reading maps (one time step per chunk),
+        'timeseries' is fast for reading the time series of pixels
+    zlib -- boolean, compress the variables (default is True)
+    complevel -- integer 1-9, compression level (default is 4)
+    shuffle -- boolean, use the shuffle filter before compression (default is True)
+    tile -- integer, size in pixels of the lat and lon side of the 'timeseries' chunks (default is 32)
+    """
+    for Key in Layout.keys():
+        if not Key in NC_Layout:
+            raise KeyError('%s is not a NetCDF layout option' %Key)
+    NC_Layout.update(Layout)
+
+    return()
+
+def Get_NC_Layout(Layout = None):
+    """
+    This function returns the NetCDF layout, changed by the given options
+
+    Keyword arguments:
+    Layout -- dictionary with the options of Set_NC_Layout that are changed
+    """
+    Layout_var = dict(NC_Layout)
+    if Layout is not None:
+        for Key in Layout.keys():
+            if not Key in NC_Layout:
+                raise KeyError('%s is not a NetCDF layout option' %Key)
+        Layout_var.update(Layout)
+
+    return(Layout_var)
+
+def Get_NC_Chunks(chunks, shape, tile = 32):
+    """
+    This function returns the chunk shape of a NetCDF variable
+
+    Keyword arguments:
+    chunks -- 'map', 'timeseries' or a tuple with the chunk shape
+    shape -- tuple, shape of the variable ([time,] lat, lon)
+    tile -- integer, size in pixels of the lat and lon side of the 'timeseries' chunks
+    """
+    if not chunks in ['map', 'timeseries']:
+        if isinstance(chunks, basestring):
+            raise ValueError("chunks must be 'map', 'timeseries' or a tuple")
+        return(tuple(chunks))
+
+    # Maximum size in pixels of the lat and lon side of the 'map' chunks
+    Map_tile = 2048
+
+    size_Y, size_X = shape[-2:]
+    if chunks == 'map':
+        Chunks = [max(min(size_Y, Map_tile), 1), max(min(size_X, Map_tile), 1)]
+        Chunks_time = 1
+    else:
+        Chunks = [max(min(size_Y, tile), 1), max(min(size_X, tile), 1)]
+        Chunks_time = max(shape[0], 1) if len(shape) == 3 else None
+
+    if len(shape) == 3:
+        Chunks = [Chunks_time] + Chunks
+
+    return(tuple(Chunks))
+
 def Create_new_NC_file(nc_outname, Basin_Example_File, Basin):
 
     # Open basin file
@@ -449,7 +519,10 @@ def Create_new_NC_file(nc_outname, Basin_Example_File, Basin):
     # Variables
     basin_var = nco.createVariable('Landuse', 'i',
                                            ('latitude', 'longitude'),
-                                           fill_value=-9999)
+                                           fill_value=-9999,
+                                           zlib=NC_Layout['zlib'], complevel=NC_Layout['complevel'],
+                                           shuffle=NC_Layout['shuffle'],
+                                           chunksizes=Get_NC_Chunks(NC_Layout['chunks'], (size_Y, size_X), NC_Layout['tile']))
     basin_var.long_name = 'Landuse'
     basin_var.grid_mapping = 'crs'
 
@@ -471,19 +544,36 @@ def Create_new_NC_file(nc_outname, Basin_Example_File, Basin):
     nco.close()
     return()
 
-def Add_NC_Array_Variable(nc_outname, Array, name, unit, Scaling_factor = 1):
+def Add_NC_Array_Variable(nc_outname, Array, name, unit, Scaling_factor = 1, Layout = None):
+    """
+    This function adds a time dependent variable to a yearly NetCDF file
 
-    # create input array
-    Array[np.isnan(Array)] = -9999 * np.float(Scaling_factor)
-    Array = np.int_(Array * 1./np.float(Scaling_factor))
+    Keyword arguments:
+    nc_outname -- string, complete path of the yearly nc file
+    Array -- [array], dataset [time, lat, lon] (nan is no data)
+    name -- string, the name of the variable
+    unit -- string, the unit of the variable
+    Scaling_factor -- number, scaling_factor of the dataset, default = 1
+    Layout -- dictionary, changes the NC_Layout for this variable, e.g. {'chunks': 'timeseries'}
+    """
+    # import WA+ modules
+    import watools.General.data_types as DT
+
+    # Get the layout of the variable
+    Layout_var = Get_NC_Layout(Layout)
+
+    # create input array of scaled integers
+    Array, Storage_Type = DT.To_Storage(Array, Scaling_factor)
 
     # Create NetCDF file
     nco = netCDF4.Dataset(nc_outname, 'r+', format = 'NETCDF4_CLASSIC')
     nco.set_fill_on()
 
-    paro = nco.createVariable('%s' %name, 'i',
+    paro = nco.createVariable('%s' %name, Storage_Type,
                                    ('time', 'latitude', 'longitude'),fill_value=-9999,
-                                    zlib=True, least_significant_digit=0)
+                                    zlib=Layout_var['zlib'], complevel=Layout_var['complevel'],
+                                    shuffle=Layout_var['shuffle'], least_significant_digit=0,
+                                    chunksizes=Get_NC_Chunks(Layout_var['chunks'], Array.shape, Layout_var['tile']))
 
     paro.scale_factor = Scaling_factor
     paro.add_offset = 0.00
@@ -501,19 +591,36 @@ def Add_NC_Array_Variable(nc_outname, Array, name, unit, Scaling_factor = 1):
 
     return()
 
-def Add_NC_Array_Static(nc_outname, Array, name, unit, Scaling_factor = 1):
+def Add_NC_Array_Static(nc_outname, Array, name, unit, Scaling_factor = 1, Layout = None):
+    """
+    This function adds a static variable to a yearly NetCDF file
+
+    Keyword arguments:
+    nc_outname -- string, complete path of the yearly nc file
+    Array -- [array], dataset [lat, lon] (nan is no data)
+    name -- string, the name of the variable
+    unit -- string, the unit of the variable
+    Scaling_factor -- number, scaling_factor of the dataset, default = 1
+    Layout -- dictionary, changes the NC_Layout for this variable, e.g. {'complevel': 6}
+    """
+    # import WA+ modules
+    import watools.General.data_types as DT
+
+    # Get the layout of the variable
+    Layout_var = Get_NC_Layout(Layout)
 
-    # create input array
-    Array[np.isnan(Array)] = -9999 * np.float(Scaling_factor)
-    Array = np.int_(Array * 1./np.float(Scaling_factor))
+    # create input array of scaled integers
+    Array, Storage_Type = DT.To_Storage(Array, Scaling_factor)
 
     # Create NetCDF file
     nco = netCDF4.Dataset(nc_outname, 'r+', format = 'NETCDF4_CLASSIC')
     nco.set_fill_on()
 
-    paro = nco.createVariable('%s' %name, 'i',
+    paro = nco.createVariable('%s' %name, Storage_Type,
                                    ('latitude', 'longitude'),fill_value=-9999,
-                                    zlib=True, least_significant_digit=0)
+                                    zlib=Layout_var['zlib'], complevel=Layout_var['complevel'],
+                                    shuffle=Layout_var['shuffle'], least_significant_digit=0,
+                                    chunksizes=Get_NC_Chunks(Layout_var['chunks'], Array.shape, Layout_var['tile']))
 
     paro.scale_factor = Scaling_factor
     paro.add_offset = 0.00
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Tim Hessels
+         UNESCO-IHE 2017
+Contact: t.hessels@unesco-ihe.org
+Repository: https://github.com/wateraccounting/watools
+Module: General
+
+Description:
+The data types of the datacubes of the WA+ toolbox. The datacubes are calculated
+in float32 (compute type) and stored in the NetCDF files as scaled integers
+(storage type). The policy can be changed for all the readers and builders with
+Set_Policy, e.g. Set_Policy(compute = 'float64', storage = 'i4').
+"""
+import numpy as np
+
+# Data types used by the readers and builders of the datacubes
+Policy = dict({'compute': 'float32', 'storage': 'auto'})
+
+# Range of the scaled integers that can be stored
+Storage_Ranges = dict({'i2': (np.iinfo(np.int16).min, np.iinfo(np.int16).max),
+                       'i4': (np.iinfo(np.int32).min, np.iinfo(np.int32).max)})
+
+def Set_Policy(compute = None, storage = None):
+    """
+    This function changes the data types of the datacubes
+
+    Keyword arguments:
+    compute -- 'float32' or 'float64'
+        str: Data type of the arrays that are calculated
+    storage -- 'i2', 'i4' or 'auto'
+        str: Data type of the scaled integers in the NetCDF files, 'auto' uses
+        'i2' if the scaled data fits and 'i4' otherwise
+    """
+    if compute is not None:
+        if not compute in ['float32', 'float64']:
+            raise ValueError("compute must be 'float32' or 'float64'")
+        Policy['compute'] = compute
+    if storage is not None:
+        if not storage in ['i2', 'i4', 'auto']:
+            raise ValueError("storage must be 'i2', 'i4' or 'auto'")
+        Policy['storage'] = storage
+
+    return()
+
+def Compute_Type():
+    """
+    This function returns the numpy data type of the arrays that are calculated
+    """
+    return(np.dtype(Policy['compute']))
+
+def As_Compute(Array):
+    """
+    This function converts an array to the compute type (without a copy if it already is)
+
+    Keyword arguments:
+    Array -- [array]
+        array that must be converted
+    """
+    return(np.asarray(Array, dtype = Compute_Type()))
+
+def To_Storage(Array, Scaling_factor = 1, No_Data = -9999):
+    """
+    This function scales an array to the integers that are stored in a NetCDF file
+
+    Keyword arguments:
+    Array -- [array]
+        array with the data (nan is no data)
+    Scaling_factor -- number, scaling_factor of the dataset, default = 1
+    No_Data -- number, value of the missing data in the stored integers
+
+    Returns:
+    Array_Storage -- [array]
+        array with the scaled integers
+    Storage_Type -- 'i2' or 'i4'
+        str: Data type of the NetCDF variable
+    """
+    Array = np.asarray(Array)
+    if not np.issubdtype(Array.dtype, np.floating):
+        Array = As_Compute(Array)
+
+    # Scale the data, rounded to the nearest integer
+    Scaled = np.rint(Array * (1./np.float(Scaling_factor)))
+    Mask = np.isnan(Scaled)
+    Scaled[Mask] = No_Data
+
+    # Select the smallest data type if the policy allows it
+    Storage_Type = Policy['storage']
+    if Storage_Type == 'auto':
+        Storage_Type = 'i4'
+        if Scaled.size == 0 or (np.min(Scaled) >= Storage_Ranges['i2'][0] and np.max(Scaled) <= Storage_Ranges['i2'][1]):
+            Storage_Type = 'i2'
+
+    # Check the range of the data type
+    Minimum, Maximum = Storage_Ranges[Storage_Type]
+    if Scaled.size > 0 and (np.min(Scaled) < Minimum or np.max(Scaled) > Maximum):
+        raise ValueError('The scaled data does not fit in %s, use a larger scaling factor or storage type' %Storage_Type)
+
+    return(Scaled.astype(Storage_Type), Storage_Type)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Tim Hessels
+         UNESCO-IHE 2017
+Contact: t.hessels@unesco-ihe.org
+Repository: https://github.com/wateraccounting/watools
+Module: General
+
+Description:
+A catalogue of the files in a product directory. The directory is listed once,
+the dates are parsed once from the filenames ('*yyyy.mm.dd.tif') and the
+catalogue is only listed again when the directory is changed. The functions
+do not change the working directory, so they can be used within threads.
+"""
+import os
+import re
+import time
+import fnmatch
+import threading
+import numpy as np
+import pandas as pd
+
+# Catalogues of the directories that are already listed
+Catalogues = dict()
+Lock = threading.Lock()
+
+# Date at the end of the WA+ filenames, e.g. 'P_CHIRPS.v2.0_mm-day-1_daily_2010.01.01.tif'
+Date_Pattern = re.compile(r'(\d{4})\.(\d{2})\.(\d{2})\.[^.]+$')
+
+# Seconds after a change of the directory in which the catalogue is always refreshed
+Resolution_Mtime = 2.0
+
+def Get_Catalogue(Data_Path):
+    """
+    This function returns the catalogue of a directory
+
+    Keyword arguments:
+    Data_Path -- 'C:/file/to/path/'
+        str: Path to the directory
+
+    Returns:
+    Catalogue -- dict
+        'names': sorted list of the filenames,
+        'dates': list with the date (pandas Timestamp or None) of every filename
+    """
+    Data_Path = os.path.abspath(Data_Path)
+    Mtime = os.stat(Data_Path).st_mtime
+
+    with Lock:
+        Catalogue = Catalogues.get(Data_Path)
+
+    # Only use the cached catalogue if the directory did not change since it was listed
+    if (Catalogue is None or Catalogue['mtime'] != Mtime
+            or Catalogue['time'] - Mtime < Resolution_Mtime):
+
+        Time_Listed = time.time()
+        Names = sorted(Name for Name in os.listdir(Data_Path) if not Name.startswith('.'))
+        Catalogue = dict({'names': Names,
+                          'dates': [Parse_Date(Name) for Name in Names],
+                          'mtime': Mtime,
+                          'time': Time_Listed})
+        with Lock:
+            Catalogues[Data_Path] = Catalogue
+
+    return(Catalogue)
+
+def Parse_Date(Name):
+    """
+    This function gets the date from a filename ('*yyyy.mm.dd.tif'), None if
+    the filename does not end with a date
+
+    Keyword arguments:
+    Name -- 'P_mm_daily_2010.01.01.tif'
+        str: Filename
+    """
+    Match = Date_Pattern.search(Name)
+    if Match is None:
+        return(None)
+    try:
+        return(pd.Timestamp('%s-%s-%s' %Match.groups()))
+    except ValueError:
+        return(None)
+
+def Find_Files(Data_Path, Pattern = '*', Date = None, Full_Path = True):
+    """
+    This function finds the files of a directory that match a glob pattern,
+    like glob.glob after changing the working directory to Data_Path
+
+    Keyword arguments:
+    Data_Path -- 'C:/file/to/path/'
+        str: Path to the directory
+    Pattern -- '*monthly*.tif'
+        str: Glob pattern of the filenames
+    Date -- pandas Timestamp or 'yyyy-mm-dd' (Default is None)
+        Only the files of this date are returned
+    Full_Path -- True (Default) to return the paths, False for the filenames
+
+    Returns:
+    files -- list
+        Sorted list of the files
+    """
+    Catalogue = Get_Catalogue(Data_Path)
+
+    if Date is None:
+        Names = fnmatch.filter(Catalogue['names'], Pattern)
+    else:
+        Date = pd.Timestamp(Date)
+        Names = [Name for Name, Date_Name in zip(Catalogue['names'], Catalogue['dates'])
+                 if Date_Name == Date and fnmatch.fnmatch(Name, Pattern)]
+
+    if Full_Path:
+        Names = [os.path.join(Data_Path, Name) for Name in Names]
+
+    return(Names)
+
+def Files_Dates(Data_Path, Pattern = '*'):
+    """
+    This function finds the files of a directory that match a glob pattern and
+    end with a date, sorted by date
+
+    Keyword arguments:
+    Data_Path -- 'C:/file/to/path/'
+        str: Path to the directory
+    Pattern -- '*8-daily*.tif'
+        str: Glob pattern of the filenames
+
+    Returns:
+    files -- list
+        Paths of the files sorted by date
+    Dates_files -- array
+        Array containing the date (ordinal) of each file
+    """
+    Catalogue = Get_Catalogue(Data_Path)
+
+    files = []
+    Dates_files = []
+    for Name, Date_Name in zip(Catalogue['names'], Catalogue['dates']):
+        if Date_Name is not None and fnmatch.fnmatch(Name, Pattern):
+            files.append(os.path.join(Data_Path, Name))
+            Dates_files.append(Date_Name.toordinal())
+
+    Order = np.argsort(Dates_files, kind = 'mergesort')
+    files = [files[i] for i in Order]
+    Dates_files = np.array(Dates_files, dtype = int)[Order]
+
+    return(files, Dates_files)
@@ -5,7 +5,6 @@ Created on Fri Dec 16 19:04:22 2016
 @author: tih
 """
 import pandas as pd
-import glob
 import gdal
 import osr
 import os
@@ -166,7 +165,13 @@ def Open_nc_array(NC_filename, Var = None, Startdate = '', Enddate = ''):
         Data = fh.variables[Var][:]
     fh.close()
 
+    # import WA+ modules
+    import watools.General.data_types as DT
+
+    # Calculate with the compute type (integer variables stay integer)
     Data = np.array(Data)
+    if np.issubdtype(Data.dtype, np.floating):
+        Data = DT.As_Compute(Data)
     try:
         Data[Data==-9999] = np.nan
     except:
@@ -743,8 +748,10 @@ def Get3Darray_time_series_monthly(Data_Path, Startdate, Enddate, Example_data =
     # Get a list of dates that needs to be reprojected
     Dates = pd.date_range(Startdate, Enddate, freq = 'MS')
 
-    # Change Working directory
-    os.chdir(Data_Path)
+    # import WA+ modules
+    import watools.General.file_catalogue as FC
+    import watools.General.data_types as DT
+
     i = 0
 
     # Loop over the months
@@ -754,10 +761,10 @@ def Get3Darray_time_series_monthly(Data_Path, Startdate, Enddate, Example_data =
         End_tiff_file_name = 'monthly_%d.%02d.01.tif' %(Date.year, Date.month)
 
         # Search for this file in directory
-        file_name = glob.glob('*%s' %End_tiff_file_name)
+        file_name = FC.Find_Files(Data_Path, '*%s' %End_tiff_file_name)
 
         # Select the first file that is found
-        file_name_path = os.path.join(Data_Path, file_name[0])
+        file_name_path = file_name[0]
 
         # Check if an example file is selected
         if Example_data is not None:
@@ -770,12 +777,12 @@ def Get3Darray_time_series_monthly(Data_Path, Startdate, Enddate, Example_data =
                 # if Tiff
                 if os.path.splitext(Example_data)[-1] == '.tif':
                     geo_out, proj, size_X, size_Y = Open_array_info(Example_data)
-                    dataTot=np.zeros([len(Dates),size_Y,size_X])
+                    dataTot=np.zeros([len(Dates),size_Y,size_X], dtype = DT.Compute_Type())
 
                 # if netCDF
                 if os.path.splitext(Example_data)[-1] == '.nc':
                     geo_out, projection, size_X, size_Y, size_Z, Time = Open_nc_info(Example_data)
-                    dataTot=np.zeros([len(Dates),size_Y,size_X])
+                    dataTot=np.zeros([len(Dates),size_Y,size_X], dtype = DT.Compute_Type())
 
                     # Create memory file for reprojection
                     data = Open_nc_array(Example_data, "Landuse")
@@ -806,7 +813,7 @@ def Get3Darray_time_series_monthly(Data_Path, Startdate, Enddate, Example_data =
             # Get the properties from the first file
             if Date is Dates[0]:
                     geo_out, proj, size_X, size_Y = Open_array_info(file_name_path)
-                    dataTot=np.zeros([len(Dates),size_Y,size_X])
+                    dataTot=np.zeros([len(Dates),size_Y,size_X], dtype = DT.Compute_Type())
             Array_one_date = Open_tiff_array(file_name_path)
 
         # Create the 3D array
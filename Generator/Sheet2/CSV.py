@@ -42,6 +42,7 @@ def Create(Dir_Basin, Simulation, Basin, Startdate, Enddate, nc_outname, Example
     # import WA modules
     import watools.Functions.Start.Get_Dictionaries as GD
     import watools.General.raster_conversions as RC
+    import watools.General.data_types as DT
     from watools.Functions import Start
 
     # Create output folder for CSV files
@@ -70,44 +71,17 @@ def Create(Dir_Basin, Simulation, Basin, Startdate, Enddate, nc_outname, Example
         Years = []
 
     # Calculate the area for each pixel in square meters
-    area_in_m2 = Start.Area_converter.Degrees_to_m2(Example_dataset)
-
-    # Create Beneficial Maps
-    lulc_dict = GD.get_lulcs()
-
-    # Get all the LULC values
-    Values_LULC = np.unique(LULC)
-
-    # Create new Benefial arrays
-    T_ben_array = np.zeros(np.shape(LULC))
-    E_ben_array = np.zeros(np.shape(LULC))
-    I_ben_array = np.zeros(np.shape(LULC))
-    agriculture_array = np.zeros(np.shape(LULC))
-    environment_array= np.zeros(np.shape(LULC))
-    economic_array = np.zeros(np.shape(LULC))
-    energy_array = np.zeros(np.shape(LULC))
-    leisure_array = np.zeros(np.shape(LULC))
-
-    # Loop over LULC values and set benefial fractions
-    for Value_LULC in Values_LULC:
-        if Value_LULC in lulc_dict.keys():
-            T_ben = lulc_dict[Value_LULC][3]
-            E_ben = lulc_dict[Value_LULC][4]
-            I_ben = lulc_dict[Value_LULC][5]
-            agriculture = lulc_dict[Value_LULC][6]
-            environment = lulc_dict[Value_LULC][7]
-            economic = lulc_dict[Value_LULC][8]
-            energy = lulc_dict[Value_LULC][9]
-            leisure = lulc_dict[Value_LULC][10]
-
-            T_ben_array[LULC == Value_LULC] = T_ben/100.
-            E_ben_array[LULC == Value_LULC] = E_ben/100.
-            I_ben_array[LULC == Value_LULC] = I_ben/100.
-            agriculture_array[LULC == Value_LULC] = agriculture/100.
-            environment_array[LULC == Value_LULC] = environment/100.
-            economic_array[LULC == Value_LULC] = economic /100.
-            energy_array[LULC == Value_LULC] = energy/100.
-            leisure_array[LULC == Value_LULC] = leisure /100.
+    area_in_m2 = DT.As_Compute(Start.Area_converter.Degrees_to_m2(Example_dataset))
+
+    # Create Beneficial Maps by using the lookup tables of the LULC legend
+    T_ben_array = DT.As_Compute(Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_LULC_Table('Beneficial T [%]'), LULC))/100.
+    E_ben_array = DT.As_Compute(Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_LULC_Table('Beneficial E [%]'), LULC))/100.
+    I_ben_array = DT.As_Compute(Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_LULC_Table('Beneficial I [%]'), LULC))/100.
+    agriculture_array = DT.As_Compute(Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_LULC_Table('Agriculture [%]'), LULC))/100.
+    environment_array = DT.As_Compute(Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_LULC_Table('Environment [%]'), LULC))/100.
+    economic_array = DT.As_Compute(Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_LULC_Table('Economic [%]'), LULC))/100.
+    energy_array = DT.As_Compute(Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_LULC_Table('Energy [%]'), LULC))/100.
+    leisure_array = DT.As_Compute(Start.LULC_Tables.Apply_Table(Start.LULC_Tables.Get_LULC_Table('Leisure [%]'), LULC))/100.
 
     # Open sheet 2 dict
     sheet2_classes_dict = GD.get_sheet2_classes()
@@ -130,54 +104,22 @@ def Create(Dir_Basin, Simulation, Basin, Startdate, Enddate, nc_outname, Example
     energy_km3 = np.einsum('ij,kij->kij', energy_array, ETben_tot_km3)
     leisure_km3 = np.einsum('ij,kij->kij', leisure_array, ETben_tot_km3)
 
-    # Create empty arrays
-    DataT = np.zeros([29,len(Dates)])
-    DataI = np.zeros([29,len(Dates)])
-    DataE = np.zeros([29,len(Dates)])
-    DataBT = np.zeros([29,len(Dates)])
-    DataBI = np.zeros([29,len(Dates)])
-    DataBE = np.zeros([29,len(Dates)])
-    DataAgriculture = np.zeros([29,len(Dates)])
-    DataEnvironment = np.zeros([29,len(Dates)])
-    DataEconomic = np.zeros([29,len(Dates)])
-    DataEnergy = np.zeros([29,len(Dates)])
-    DataLeisure = np.zeros([29,len(Dates)])
-    i = 0
-
-    # Loop over the LULC by using the Sheet 2 dictionary
-    for LAND_USE in sheet2_classes_dict.keys():
-        for CLASS in sheet2_classes_dict[LAND_USE].keys():
-            lulcs = sheet2_classes_dict[LAND_USE][CLASS]
-
-            # Create a mask to ignore non relevant pixels.
-            mask=np.logical_or.reduce([LULC == value for value in lulcs])
-            mask3d = mask * np.ones(len(Dates))[:,None,None]
-
-            # Calculate the spatial sum of the different parameters.
-            T_LU_tot = np.nansum(np.nansum((T_km3 * mask3d),1),1)
-            I_LU_tot = np.nansum(np.nansum((I_km3 * mask3d),1),1)
-            E_LU_tot = np.nansum(np.nansum((E_km3 * mask3d),1),1)
-            BT_LU_tot = np.nansum(np.nansum((Tben_km3 * mask3d),1),1)
-            BI_LU_tot = np.nansum(np.nansum((Iben_km3 * mask3d),1),1)
-            BE_LU_tot = np.nansum(np.nansum((Eben_km3 * mask3d),1),1)
-            Agriculture_LU_tot = np.nansum(np.nansum((agriculture_km3 * mask3d),1),1)
-            Environment_LU_tot = np.nansum(np.nansum((environment_km3 * mask3d),1),1)
-            Economic_LU_tot = np.nansum(np.nansum((economic_km3 * mask3d),1),1)
-            Energy_LU_tot = np.nansum(np.nansum((energy_km3 * mask3d),1),1)
-            Leisure_LU_tot = np.nansum(np.nansum((leisure_km3 * mask3d),1),1)
-
-            DataT[i,:] = T_LU_tot
-            DataBT[i,:] = BT_LU_tot
-            DataI[i,:] = I_LU_tot
-            DataBI[i,:] = BI_LU_tot
-            DataE[i,:] = E_LU_tot
-            DataBE[i,:] = BE_LU_tot
-            DataAgriculture[i,:] = Agriculture_LU_tot
-            DataEnvironment[i,:] = Environment_LU_tot
-            DataEconomic[i,:] = Economic_LU_tot
-            DataEnergy[i,:] = Energy_LU_tot
-            DataLeisure[i,:] = Leisure_LU_tot
-            i += 1
+    # Map the LULC once on the classes of the Sheet 2 dictionary
+    Classes = [sheet2_classes_dict[LAND_USE][CLASS] for LAND_USE in sheet2_classes_dict.keys() for CLASS in sheet2_classes_dict[LAND_USE].keys()]
+    Zones = Start.Zonal_Statistics.Create_Zones(LULC, Classes)
+
+    # Calculate the spatial sum of the different parameters.
+    DataT = Start.Zonal_Statistics.Sum_Per_Class(Zones, T_km3)
+    DataI = Start.Zonal_Statistics.Sum_Per_Class(Zones, I_km3)
+    DataE = Start.Zonal_Statistics.Sum_Per_Class(Zones, E_km3)
+    DataBT = Start.Zonal_Statistics.Sum_Per_Class(Zones, Tben_km3)
+    DataBI = Start.Zonal_Statistics.Sum_Per_Class(Zones, Iben_km3)
+    DataBE = Start.Zonal_Statistics.Sum_Per_Class(Zones, Eben_km3)
+    DataAgriculture = Start.Zonal_Statistics.Sum_Per_Class(Zones, agriculture_km3)
+    DataEnvironment = Start.Zonal_Statistics.Sum_Per_Class(Zones, environment_km3)
+    DataEconomic = Start.Zonal_Statistics.Sum_Per_Class(Zones, economic_km3)
+    DataEnergy = Start.Zonal_Statistics.Sum_Per_Class(Zones, energy_km3)
+    DataLeisure = Start.Zonal_Statistics.Sum_Per_Class(Zones, leisure_km3)
 
     # Calculate non benefial components
     DataNBT = DataT - DataBT
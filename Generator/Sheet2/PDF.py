@@ -7,9 +7,8 @@ Repository: https://github.com/wateraccounting/wa
 Module: Generator/Sheet2
 """
 import os
-import glob
 
-def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV):
+def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, cores = 1):
     """
     This functions create the monthly and yearly sheet 2 in pdf format, based on the csv files.
 
@@ -23,10 +22,13 @@ def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV):
         Defines the simulation
     Dir_Basin_CSV : str
         Data path pointing to the CSV output files
+    cores : int
+        Number of cores used to create the sheets
 
     """
     # import wa module
-    from watools.Sheets import create_sheet2
+    from watools.Sheets import create_sheet2, create_sheets
+    import watools.General.file_catalogue as FC
 
     # Create output folder for PDF files
     Dir_Basin_PDF = os.path.join(Dir_Basin, "Simulations", "Simulation_%d" %Simulation, "PDF")
@@ -34,10 +36,10 @@ def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV):
         os.mkdir(Dir_Basin_PDF)
 
     # find all the CSV's
-    os.chdir(Dir_Basin_CSV)
-    files = glob.glob('Sheet2_Sim%d*.csv' %Simulation)
+    files = FC.Find_Files(Dir_Basin_CSV, 'Sheet2_Sim%d*.csv' %Simulation, Full_Path = False)
 
     # loop over CSV's files
+    sheets = []
     for File in files:
 
         # split the name
@@ -50,8 +52,8 @@ def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV):
             Year = str(FileName_Splitted[-1].split('.')[0])
             outFile = 'Sheet2_Sim%s_%s_%s.pdf' %(Simulation, Basin, Year)
 
-            # create the sheet
-            create_sheet2(basin=Basin, period = Year, units = units, data = os.path.join(Dir_Basin_CSV,File) , output = os.path.join(Dir_Basin_PDF, outFile),template=False, tolerance=1000)
+            # add the sheet
+            sheets.append(dict(basin=Basin, period = Year, units = units, data = os.path.join(Dir_Basin_CSV,File) , output = os.path.join(Dir_Basin_PDF, outFile),template=False, tolerance=1000))
 
         # If the splitted parts are 5 then it is a monthly sheet
         elif len(FileName_Splitted)==5:
@@ -64,8 +66,11 @@ def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV):
             NameTimeSpace = '%s %s' %(Year, MonthInLetters[int(Month)])
             outFile = 'Sheet2_Sim%s_%s_%s.pdf' %(Simulation, Basin, NameTime)
 
-            # create the sheet
-            create_sheet2(basin=Basin, period = NameTimeSpace, units = units, data = os.path.join(Dir_Basin_CSV,File) , output = os.path.join(Dir_Basin_PDF, outFile),template=False, tolerance=1000)
+            # add the sheet
+            sheets.append(dict(basin=Basin, period = NameTimeSpace, units = units, data = os.path.join(Dir_Basin_CSV,File) , output = os.path.join(Dir_Basin_PDF, outFile),template=False, tolerance=1000))
+
+    # create all the sheets
+    create_sheets(create_sheet2, sheets, cores)
 
     return()
 
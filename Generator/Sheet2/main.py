@@ -7,7 +7,7 @@ Repository: https://github.com/wateraccounting/wa
 Module: Function/Two
 """
 
-def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, LAI_Product, NDM_Product, Startdate, Enddate, Simulation):
+def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, LAI_Product, NDM_Product, Startdate, Enddate, Simulation, cores = 1):
     """
     This functions is the main framework for calculating sheet 2.
 
@@ -29,6 +29,8 @@ def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, LAI_Product, NDM_Pro
         Contains the end date of the model 'yyyy-mm-dd'
     Simulation : int
         Defines the simulation
+    cores : int
+        Number of cores used to create the PDF sheets
 
     """
     ######################### Import WA modules ###################################
@@ -182,7 +184,7 @@ def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, LAI_Product, NDM_Pro
 
     ############################ Create Sheet 2 ###############################
 
-    Generate.PDF.Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV)
+    Generate.PDF.Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, cores)
 
     return()
 
@@ -39,6 +39,7 @@ def Create(Dir_Basin, Simulation, Basin, Startdate, Enddate, nc_outname):
     """
     # import WA modules
     import watools.General.raster_conversions as RC
+    import watools.General.data_types as DT
     import watools.Functions.Start as Start
 
     # Create output folder for CSV files
@@ -72,7 +73,7 @@ def Create(Dir_Basin, Simulation, Basin, Startdate, Enddate, nc_outname):
         Years = []
 
     # Calculate the area for each pixel in square meters
-    area_in_m2 = Start.Area_converter.Degrees_to_m2(nc_outname)
+    area_in_m2 = DT.As_Compute(Start.Area_converter.Degrees_to_m2(nc_outname))
 
      # Get all the LULC types that are defined for sheet 4
     LU_Classes = Start.Get_Dictionaries.get_sheet5_classes()
@@ -89,56 +90,29 @@ def Create(Dir_Basin, Simulation, Basin, Startdate, Enddate, nc_outname):
     NonRecovableFlow_Return_GW_km3 = np.einsum('ij,kij->kij', area_in_m2, DataCube_NonRecovableFlow_Return_GW)/ 1e12
     NonRecovableFlow_Return_SW_km3 = np.einsum('ij,kij->kij', area_in_m2, DataCube_NonRecovableFlow_Return_SW)/ 1e12
 
-    # Create mask for all LU classes
-    All_mask = dict()
+    # Map the LULC once on the LU classes, no map is defined yet for industry and power and energy
+    Classes = [LU_Classes[Required_LU_Class] for Required_LU_Class in Required_LU_Classes[:-2]] + [[], []]
+    Zones = Start.Zonal_Statistics.Create_Zones(DataCube_LU, Classes)
 
-    # Create masks
-    for Required_LU_Class in Required_LU_Classes[:-2]:
-        Mask_Class = np.zeros(DataCube_LU.shape)
-        Values_LULC = LU_Classes[Required_LU_Class]
-        for Value_LULC in Values_LULC:
-            Mask_Class[DataCube_LU == Value_LULC] = 1
-
-        All_mask[Required_LU_Class] = Mask_Class
-
-    # Enter additional map for industry and power and energy
-    All_mask['Industry'] = np.zeros(DataCube_LU.shape)
-    All_mask['Power and Energy'] = np.zeros(DataCube_LU.shape)
-
-    # Create empty arrays for the values
-    Values_Total_Supply_GW_km3 = np.zeros([len(Required_LU_Classes),len(Dates)])
-    Values_Total_Supply_SW_km3 = np.zeros([len(Required_LU_Classes),len(Dates)])
-    Values_Non_Consumed_km3 = np.zeros([len(Required_LU_Classes),len(Dates)])
-    Values_Consumed_km3 = np.zeros([len(Required_LU_Classes),len(Dates)])
-    Values_RecovableFlow_Return_GW_km3 = np.zeros([len(Required_LU_Classes),len(Dates)])
-    Values_RecovableFlow_Return_SW_km3 = np.zeros([len(Required_LU_Classes),len(Dates)])
-    Values_NonRecovableFlow_Return_GW_km3 = np.zeros([len(Required_LU_Classes),len(Dates)])
-    Values_NonRecovableFlow_Return_SW_km3 = np.zeros([len(Required_LU_Classes),len(Dates)])
+    # Calculate sum of every class
+    Values_Total_Supply_GW_km3 = Start.Zonal_Statistics.Sum_Per_Class(Zones, Total_Supply_GW_km3)
+    Values_Total_Supply_SW_km3 = Start.Zonal_Statistics.Sum_Per_Class(Zones, Total_Supply_SW_km3)
+    Values_Non_Consumed_km3 = Start.Zonal_Statistics.Sum_Per_Class(Zones, Non_Consumed_km3)
+    Values_Consumed_km3 = Start.Zonal_Statistics.Sum_Per_Class(Zones, Consumed_km3)
+    Values_RecovableFlow_Return_GW_km3 = Start.Zonal_Statistics.Sum_Per_Class(Zones, RecovableFlow_Return_GW_km3)
+    Values_RecovableFlow_Return_SW_km3 = Start.Zonal_Statistics.Sum_Per_Class(Zones, RecovableFlow_Return_SW_km3)
+    Values_NonRecovableFlow_Return_GW_km3 = Start.Zonal_Statistics.Sum_Per_Class(Zones, NonRecovableFlow_Return_GW_km3)
+    Values_NonRecovableFlow_Return_SW_km3 = Start.Zonal_Statistics.Sum_Per_Class(Zones, NonRecovableFlow_Return_SW_km3)
 
     # zero values for now
     Values_Consumed_Others = np.zeros([len(Required_LU_Classes),len(Dates)])
     Values_Demand = np.zeros([len(Required_LU_Classes),len(Dates)])
 
-    i = 0
+    # Get the maximum total supply
     Max_value = 0
-
-    # Calculate sum by applying mask over the data
-    for Required_LU_Class in Required_LU_Classes:
-        Mask_one_class = All_mask[Required_LU_Class]
-        Values_Total_Supply_GW_km3[i,:] = np.nansum(np.nansum(Total_Supply_GW_km3 * Mask_one_class,2),1)
-        Values_Total_Supply_SW_km3[i,:] = np.nansum(np.nansum(Total_Supply_SW_km3 * Mask_one_class,2),1)
-        Values_Non_Consumed_km3[i,:] = np.nansum(np.nansum(Non_Consumed_km3 * Mask_one_class,2),1)
-        Values_Consumed_km3[i,:] = np.nansum(np.nansum(Consumed_km3 * Mask_one_class,2),1)
-        Values_RecovableFlow_Return_GW_km3[i,:] = np.nansum(np.nansum(RecovableFlow_Return_GW_km3 * Mask_one_class,2),1)
-        Values_RecovableFlow_Return_SW_km3[i,:] = np.nansum(np.nansum(RecovableFlow_Return_SW_km3 * Mask_one_class,2),1)
-        Values_NonRecovableFlow_Return_GW_km3[i,:] = np.nansum(np.nansum(NonRecovableFlow_Return_GW_km3 * Mask_one_class,2),1)
-        Values_NonRecovableFlow_Return_SW_km3[i,:] = np.nansum(np.nansum(NonRecovableFlow_Return_SW_km3 * Mask_one_class,2),1)
-        i += 1
-
-        Max_value_one_LU = np.nanmax(np.nanmax(Values_Total_Supply_GW_km3+Values_Total_Supply_SW_km3))
-
-        if Max_value_one_LU > Max_value:
-            Max_value = Max_value_one_LU
+    Max_value_all_LU = np.nanmax(Values_Total_Supply_GW_km3+Values_Total_Supply_SW_km3)
+    if Max_value_all_LU > Max_value:
+        Max_value = Max_value_all_LU
 
     # Check if scaling is needed
     scaling = 1
@@ -7,9 +7,8 @@ Repository: https://github.com/wateraccounting/wa
 Module: Generator/Sheet4
 """
 import os
-import glob
 
-def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, Unit_front):
+def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, Unit_front, cores = 1):
     """
     This functions create the monthly and yearly sheet 4 in pdf format, based on the csv files.
 
@@ -25,9 +24,12 @@ def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, Unit_front):
         Data path pointing to the CSV output files
     Unit_front : str
         Defines the scaling of the CSV file
+    cores : int
+        Number of cores used to create the sheets
     """
     # import wa module
-    from watools.Sheets import create_sheet4
+    from watools.Sheets import create_sheet4, create_sheets
+    import watools.General.file_catalogue as FC
 
     # Create output folder for CSV files
     Dir_Basin_PDF = os.path.join(Dir_Basin, "Simulations", "Simulation_%d" %Simulation, "PDF")
@@ -35,10 +37,10 @@ def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, Unit_front):
         os.mkdir(Dir_Basin_PDF)
 
     # find all the CSV's
-    os.chdir(Dir_Basin_CSV)
-    files = glob.glob('Sheet4_Sim%d*.csv' %Simulation)
+    files = FC.Find_Files(Dir_Basin_CSV, 'Sheet4_Sim%d*.csv' %Simulation, Full_Path = False)
 
     # loop over CSV's files
+    sheets = []
     for File in files:
 
         # split the name
@@ -52,8 +54,8 @@ def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, Unit_front):
             outFile1 = 'Sheet4a_Sim%s_%s_%s.pdf' %(Simulation, Basin, Year)
             outFile2 = 'Sheet4b_Sim%s_%s_%s.pdf' %(Simulation, Basin, Year)
 
-            # create the sheet
-            create_sheet4(basin=Basin, period = Year, units = [units,units], data = [os.path.join(Dir_Basin_CSV,File),os.path.join(Dir_Basin_CSV,File)] , output = [os.path.join(Dir_Basin_PDF, outFile1),os.path.join(Dir_Basin_PDF, outFile2)], template=False, tolerance=1000)
+            # add the sheet
+            sheets.append(dict(basin=Basin, period = Year, units = [units,units], data = [os.path.join(Dir_Basin_CSV,File),os.path.join(Dir_Basin_CSV,File)] , output = [os.path.join(Dir_Basin_PDF, outFile1),os.path.join(Dir_Basin_PDF, outFile2)], template=False, tolerance=1000))
 
         # If the splitted parts are 5 then it is a monthly sheet
         elif len(FileName_Splitted)==5:
@@ -67,8 +69,11 @@ def Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, Unit_front):
             outFile1 = 'Sheet4a_Sim%s_%s_%s.pdf' %(Simulation, Basin, NameTime)
             outFile2 = 'Sheet4b_Sim%s_%s_%s.pdf' %(Simulation, Basin, NameTime)
 
-            # create the sheet
-            create_sheet4(basin=Basin, period = NameTimeSpace, units = [units,units] , data = [os.path.join(Dir_Basin_CSV,File),os.path.join(Dir_Basin_CSV,File)]  , output = [os.path.join(Dir_Basin_PDF, outFile1),os.path.join(Dir_Basin_PDF, outFile2)],template=False, tolerance=0.2)
+            # add the sheet
+            sheets.append(dict(basin=Basin, period = NameTimeSpace, units = [units,units] , data = [os.path.join(Dir_Basin_CSV,File),os.path.join(Dir_Basin_CSV,File)]  , output = [os.path.join(Dir_Basin_PDF, outFile1),os.path.join(Dir_Basin_PDF, outFile2)],template=False, tolerance=0.2))
+
+    # create all the sheets
+    create_sheets(create_sheet4, sheets, cores)
 
     return()
 
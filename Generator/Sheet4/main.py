@@ -12,7 +12,7 @@ import numpy as np
 import pandas as pd
 from netCDF4 import Dataset
 
-def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, LAI_Product, ETref_Product, Runoff_Product, Startdate, Enddate, Simulation):
+def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, LAI_Product, ETref_Product, Runoff_Product, Startdate, Enddate, Simulation, cores = 1):
     """
     This functions is the main framework for calculating sheet 4.
 
@@ -36,6 +36,8 @@ def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, LAI_Product, ETref_P
         Contains the end date of the model 'yyyy-mm-dd'
     Simulation : int
         Defines the simulation
+    cores : int
+        Number of cores used to create the PDF sheets
 
     """
     ######################### Import WA modules ###################################
@@ -263,7 +265,7 @@ def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, LAI_Product, ETref_P
 
     ############################ Create Sheet 4 ###############################
 
-    Generate.PDF.Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, Unit_front)
+    Generate.PDF.Create(Dir_Basin, Basin, Simulation, Dir_Basin_CSV, Unit_front, cores)
 
     return()
 
@@ -170,22 +170,13 @@ def Calculate(WA_HOME_folder, Basin, P_Product, ET_Product, ETref_Product, DEM_P
         #____________________________fraction surface water _______________________
 
         if not "Fraction_Surface_Water_Supply" in Variables_NC:
-            DataCube_frac_sw = np.ones([size_Y, size_X]) * np.nan
-
-            import watools.Functions.Start.Get_Dictionaries as GD
+            import watools.Functions.Start.LULC_Tables as LT
 
             # Open LU dataset
             DataCube_LU = RC.Open_nc_array(nc_outname, "Landuse")
 
-            # Get dictionaries and keys
-            lulc = GD.get_sheet5_classes()
-            lulc_dict = list(GD.get_sheet5_classes().keys())
-            consumed_frac_dict = GD.sw_supply_fractions()
-
-            for key in lulc_dict:
-                Numbers = lulc[key]
-                for LU_nmbr in Numbers:
-                    DataCube_frac_sw[DataCube_LU==LU_nmbr] = consumed_frac_dict[key]
+            # Get the surface water supply fractions
+            DataCube_frac_sw = LT.Apply_Table(LT.Get_Table('sw_supply_fractions'), DataCube_LU)
 
             DC.Add_NC_Array_Static(nc_outname, DataCube_frac_sw, "Fraction_Surface_Water_Supply", "fraction", 0.01)
             del DataCube_frac_sw, DataCube_LU
@@ -4,7 +4,7 @@ Created on Mon Mar 12 15:26:44 2018
 
 @author: tih
 """
-def Run(input_nc, output_nc, input_JRC):
+def Run(input_nc, output_nc, input_JRC, input_JRC_monthly = None, cores = 1):
 
     # Define names
     #Name_py_Discharge_dict_CR2 = os.path.join(Dir_Basin, 'Simulations', 'Simulation_%d' %Simulation, 'Sheet_5', 'Discharge_dict_CR2_simulation%d.npy' %(Simulation))
@@ -45,11 +45,18 @@ def Run(input_nc, output_nc, input_JRC):
     Diff_Water_Volume = np.zeros([len(Regions), Amount_months, 3])
     reservoir=0
 
+    # Count the water pixels of all the regions from the local JRC monthly maps
+    if input_JRC_monthly is not None:
+        Area_Reservoir_Values_Regions = Local_calc_reservoir_area(Regions, Startdate, Enddate, input_JRC_monthly, cores)
+
     for region in Regions:
 
         popt = Find_Area_Volume_Relation(region, input_JRC, input_nc)
 
-        Area_Reservoir_Values = GEE_calc_reservoir_area(region, Startdate, Enddate)
+        if input_JRC_monthly is not None:
+            Area_Reservoir_Values = Area_Reservoir_Values_Regions[reservoir]
+        else:
+            Area_Reservoir_Values = GEE_calc_reservoir_area(region, Startdate, Enddate)
 
         Diff_Water_Volume[reservoir,:,:] = Calc_Diff_Storage(Area_Reservoir_Values, popt)
         reservoir+=1
@@ -83,68 +90,18 @@ def Calc_Regions(input_nc, output_nc, input_JRC, Boundaries):
     del basin_array
 
     # sum larger areas to find lakes
-    x_size=np.round(int(np.shape(Array_JRC_occ)[0])/30)
-    y_size=np.round(int(np.shape(Array_JRC_occ)[1])/30)
-    sum_array = np.zeros([x_size, y_size])
-
-    for i in range(0,len(sum_array)):
-        for j in range(0,len(sum_array[1])):
-            sum_array[i,j]=np.sum(Array_JRC_occ[i*30:(i+1)*30,j*30:(j+1)*30])
+    x_size=int(np.round(int(np.shape(Array_JRC_occ)[0])/30))
+    y_size=int(np.round(int(np.shape(Array_JRC_occ)[1])/30))
+    Array_JRC_occ = Array_JRC_occ[:x_size*30, :y_size*30]
+    if np.shape(Array_JRC_occ) != (x_size*30, y_size*30):
+        Array_JRC_occ = np.pad(Array_JRC_occ, ((0, x_size*30 - np.shape(Array_JRC_occ)[0]), (0, y_size*30 - np.shape(Array_JRC_occ)[1])), 'constant')
+    sum_array = Array_JRC_occ.reshape(x_size, 30, y_size, 30).sum(axis=3).sum(axis=1)
 
     del Array_JRC_occ
 
-    lakes = np.argwhere(sum_array>=sensitivity)
-    lake_info = np.zeros([1,4])
-
-    i = 0
-    k = 1
-
-    # find all neighboring pixels
-    for lake in lakes:
-        added = 0
-        for j in range(0,k):
-            if (lake[0] >= lake_info[j,0] and lake[0] <= lake_info[j,1] and lake[1] >= lake_info[j,2] and lake[1] <= lake_info[j,3]):
-                lake_info[j,0]=np.maximum(np.minimum(lake_info[j,0],lake[0]-8),0)
-                lake_info[j,1]=np.minimum(np.maximum(lake_info[j,1],lake[0]+8),x_size)
-                lake_info[j,2]=np.maximum(np.minimum(lake_info[j,2],lake[1]-8),0)
-                lake_info[j,3]=np.minimum(np.maximum(lake_info[j,3],lake[1]+8),y_size)
-                added = 1
-
-        if added == 0:
-            lake_info_one = np.zeros([4])
-            lake_info_one[0] = np.maximum(0, lake[0]-8)
-            lake_info_one[1] = np.minimum(x_size, lake[0]+8)
-            lake_info_one[2] = np.maximum(0, lake[1]-8)
-            lake_info_one[3] = np.minimum(y_size, lake[1]+8)
-            lake_info = np.append(lake_info,lake_info_one)
-            lake_info = np.resize(lake_info, (k+1,4))
-            k += 1
-
-
-    # merge all overlaping regions
-    p = 0
-    lake_info_end = np.zeros([1,4])
-
-    for i in range(1,k):
-        added = 0
-        lake_info_one = lake_info[i,:]
-        lake_y_region = range(int(lake_info_one[0]),int(lake_info_one[1]+1))
-        lake_x_region = range(int(lake_info_one[2]),int(lake_info_one[3]+1))
-
-        for j in range(0,p+1):
-            if len(lake_y_region)+len(range(int(lake_info_end[j,0]),int(lake_info_end[j,1]+1))) is not len(np.unique(np.append(lake_y_region,range(int(lake_info_end[j,0]),int(lake_info_end[j,1]+1))))) and len(lake_x_region)+len(range(int(lake_info_end[j,2]),int(lake_info_end[j,3]+1))) is not len(np.unique(np.append(lake_x_region,range(int(lake_info_end[j,2]),int(lake_info_end[j,3]+1))))):
-                lake_info_end[j,0] = np.min(np.unique(np.append(lake_y_region,range(int(lake_info_end[j,0]),int(lake_info_end[j,1]+1)))))
-                lake_info_end[j,1] = np.max(np.unique(np.append(lake_y_region,range(int(lake_info_end[j,0]),int(lake_info_end[j,1]+1)))))
-                lake_info_end[j,2] = np.min(np.unique(np.append(lake_x_region,range(int(lake_info_end[j,2]),int(lake_info_end[j,3]+1)))))
-                lake_info_end[j,3] = np.max(np.unique(np.append(lake_x_region,range(int(lake_info_end[j,2]),int(lake_info_end[j,3]+1)))))
-                added = 1
-
-        if added == 0:
-            lake_info_one = lake_info[i,:]
-            lake_info_end = np.append(lake_info_end,lake_info_one)
-            lake_info_end = np.resize(lake_info_end, (p+2,4))
-
-            p += 1
+    lakes = sum_array>=sensitivity
+    lake_info_end = Find_Lake_Regions(lakes, 8)
+    p = len(lake_info_end) - 1
 
     # calculate the area
     Regions = np.zeros([p,4])
@@ -160,6 +117,61 @@ def Calc_Regions(input_nc, output_nc, input_JRC, Boundaries):
 
 
 
+def Find_Lake_Regions(lakes, buffer_pixels):
+    """
+    This function finds the bounding boxes of the lake regions. Every lake
+    pixel is buffered by buffer_pixels, connected buffers form one region and
+    regions with overlapping bounding boxes are merged.
+
+    Keyword arguments:
+    lakes -- 2D boolean array with the lake pixels
+    buffer_pixels -- amount of pixels around every lake pixel
+
+    Returns:
+    lake_info_end -- array with [ymin, ymax, xmin, xmax] per region, the first row is empty
+    """
+    import numpy as np
+    from scipy import ndimage
+    from scipy.sparse.csgraph import connected_components
+
+    x_size, y_size = np.shape(lakes)
+    lake_info_end = np.zeros([1,4])
+    if not np.any(lakes):
+        return(lake_info_end)
+
+    # Buffer the lake pixels on a grid with half pixel steps, so only overlapping buffers are connected
+    lakes_fine = np.zeros([2 * x_size - 1, 2 * y_size - 1], dtype = bool)
+    lakes_fine[::2, ::2] = lakes
+    lakes_fine = ndimage.binary_dilation(lakes_fine, structure = np.ones([4 * buffer_pixels + 1, 4 * buffer_pixels + 1]))
+    labels, amount = ndimage.label(lakes_fine, structure = np.ones([3, 3]))
+    labels = labels[::2, ::2]
+    lake_labels = labels[lakes]
+
+    # Bounding boxes of the buffered regions
+    lake_pixels = np.argwhere(lakes)
+    index = np.arange(1, amount + 1)
+    lake_info = np.zeros([amount, 4])
+    lake_info[:,0] = np.maximum(np.array(ndimage.minimum(lake_pixels[:,0], lake_labels, index)) - buffer_pixels, 0)
+    lake_info[:,1] = np.minimum(np.array(ndimage.maximum(lake_pixels[:,0], lake_labels, index)) + buffer_pixels, x_size)
+    lake_info[:,2] = np.maximum(np.array(ndimage.minimum(lake_pixels[:,1], lake_labels, index)) - buffer_pixels, 0)
+    lake_info[:,3] = np.minimum(np.array(ndimage.maximum(lake_pixels[:,1], lake_labels, index)) + buffer_pixels, y_size)
+    first_pixel = np.array(ndimage.minimum(np.arange(len(lake_pixels)), lake_labels, index))
+
+    # Merge overlapping bounding boxes until none are overlapping
+    while True:
+        overlap = np.logical_and.reduce([lake_info[:,None,0] <= lake_info[None,:,1], lake_info[None,:,0] <= lake_info[:,None,1], lake_info[:,None,2] <= lake_info[None,:,3], lake_info[None,:,2] <= lake_info[:,None,3]])
+        amount_merged, groups = connected_components(overlap, directed = False)
+        if amount_merged == len(lake_info):
+            break
+        index = np.arange(amount_merged)
+        lake_info = np.array([ndimage.minimum(lake_info[:,0], groups, index), ndimage.maximum(lake_info[:,1], groups, index), ndimage.minimum(lake_info[:,2], groups, index), ndimage.maximum(lake_info[:,3], groups, index)]).T
+        first_pixel = np.array(ndimage.minimum(first_pixel, groups, index))
+
+    # Order the regions by their first lake pixel
+    lake_info_end = np.vstack([lake_info_end, lake_info[np.argsort(first_pixel)]])
+
+    return(lake_info_end)
+
 def Find_Area_Volume_Relation(region, input_JRC, input_nc):
 
     # Find relation between V and A
@@ -421,6 +433,127 @@ def GEE_calc_reservoir_area(region, Startdate, Enddate):
 
     return(all_values)
 
+def Local_calc_reservoir_area(Regions, Startdate, Enddate, input_JRC_monthly, cores = 1):
+    """
+    This function counts the water pixels per region and month from the JRC
+    monthly history maps on disk, the offline version of GEE_calc_reservoir_area.
+    The maps must be named *monthly_yyyy.mm.01.tif, a month that is missing is
+    treated as no data. A month that is exported in several tiles is mosaicked.
+
+    Keyword arguments:
+    Regions -- array with [lonmin, lonmax, latmin, latmax] per region
+    Startdate -- first date of the period
+    Enddate -- last date of the period
+    input_JRC_monthly -- folder with the JRC monthly history GeoTIFFs
+    cores -- amount of regions that are processed in parallel
+
+    Returns:
+    all_values -- list with [month, year, water_pixels] per month for every region
+    """
+    import os
+    import glob
+    import pandas as pd
+    from joblib import Parallel, delayed
+
+    # Get the months, including the month after the enddate like the GEE version
+    Start = pd.Timestamp(Startdate)
+    End = pd.Timestamp(Enddate)
+    Dates = pd.date_range(pd.Timestamp(Start.year, Start.month, 1), pd.Timestamp(End.year, End.month, 1) + pd.DateOffset(months = 1), freq = 'MS')
+
+    # Find the JRC map of every month
+    Months = list()
+    for Date in Dates:
+        files = glob.glob(os.path.join(input_JRC_monthly, '*monthly_%d.%02d.01.tif' %(Date.year, Date.month)))
+        if len(files) == 0:
+            print('WARNING: no JRC map found for %d-%02d, the previous month is used' %(Date.year, Date.month))
+            Months.append([Date.month, Date.year, None])
+        else:
+            Months.append([Date.month, Date.year, sorted(files)])
+
+    all_values = Parallel(n_jobs = cores)(delayed(Count_Water_Pixels_Region)(region, Months) for region in Regions)
+
+    return(all_values)
+
+def Count_Water_Pixels_Region(region, Months):
+    """
+    This function counts the water pixels of one region for every month by only
+    reading the window of the region out of the JRC maps. The no data pixels are
+    filled with the previous month.
+
+    Keyword arguments:
+    region -- [lonmin, lonmax, latmin, latmax]
+    Months -- list with [month, year, filenames] per month
+
+    Returns:
+    all_values -- list with [month, year, water_pixels] per month
+    """
+    import numpy as np
+
+    Water = None
+    all_values = list()
+    for month_val, year_val, filenames in Months:
+
+        if filenames is not None:
+
+            # Read only the window of the region out of all the tiles
+            Array = Read_Region_Tiles(region, filenames)
+
+            # Fill the no data pixels with the previous month
+            if Water is None or np.shape(Water) != np.shape(Array):
+                Water = np.zeros(np.shape(Array))
+            Water = np.where(Array > 0, Array, Water)
+
+        water_val = 0 if Water is None else int(np.sum(Water > 1))
+        all_values.append([month_val, year_val, water_val])
+
+    return(all_values)
+
+def Read_Region_Tiles(region, filenames):
+    """
+    This function reads the window of a region out of one or more tiles of a JRC
+    map. The window is defined on the grid of the first tile, the parts of the
+    tiles that overlap with the window are placed in it and the rest is no data (0).
+
+    Keyword arguments:
+    region -- [lonmin, lonmax, latmin, latmax]
+    filenames -- list with the tiles of one month
+
+    Returns:
+    Array -- array with the JRC values of the region
+    """
+    import numpy as np
+    import gdal
+
+    Array = None
+    for filename in filenames:
+        dest = gdal.Open(filename)
+        Geo_in = dest.GetGeoTransform()
+
+        # Define the window of the region on the grid of the first tile
+        if Array is None:
+            Start_x = int(np.floor((region[0] - Geo_in[0])/Geo_in[1]))
+            End_x = int(np.ceil((region[1] - Geo_in[0])/Geo_in[1]))
+            Start_y = int(np.floor((region[3] - Geo_in[3])/Geo_in[5]))
+            End_y = int(np.ceil((region[2] - Geo_in[3])/Geo_in[5]))
+            Geo_out = [Geo_in[0] + Start_x * Geo_in[1], Geo_in[3] + Start_y * Geo_in[5]]
+            Array = np.zeros([max(End_y - Start_y, 0), max(End_x - Start_x, 0)])
+
+        # Position of the tile in the window
+        Offset_x = int(round((Geo_in[0] - Geo_out[0])/Geo_in[1]))
+        Offset_y = int(round((Geo_in[3] - Geo_out[1])/Geo_in[5]))
+        Start_x_out = max(Offset_x, 0)
+        End_x_out = min(Offset_x + dest.RasterXSize, Array.shape[1])
+        Start_y_out = max(Offset_y, 0)
+        End_y_out = min(Offset_y + dest.RasterYSize, Array.shape[0])
+
+        # Read only the part of the tile within the window
+        if End_x_out > Start_x_out and End_y_out > Start_y_out:
+            Data = dest.GetRasterBand(1).ReadAsArray(Start_x_out - Offset_x, Start_y_out - Offset_y, End_x_out - Start_x_out, End_y_out - Start_y_out)
+            Array[Start_y_out:End_y_out, Start_x_out:End_x_out] = np.maximum(Array[Start_y_out:End_y_out, Start_x_out:End_x_out], Data)
+        dest = None
+
+    return(Array)
+
 def Calc_Diff_Storage(Area_Reservoir_Values, popt):
 
     import numpy as np
@@ -28,9 +28,6 @@ def Run(input_nc, output_nc):
     # Open Basin Array
     Basin = RC.Open_nc_array(input_nc, Var = 'basin')
 
-    # Copy dicts as starting adding reservoir
-    Discharge_dict_new = copy.deepcopy(Discharge_dict)
-
     # Open data array info based on example data
     geo_out_example, epsg_example, size_X_example, size_Y_example, size_Z_example, Time_example = RC.Open_nc_info(input_nc)
 
@@ -44,61 +41,246 @@ def Run(input_nc, output_nc):
 
     # find IDs drainage for only the basin
     ID_Rivers_flow = RC.gap_filling(ID_Rivers,NoDataValue = 0.) * Basin
+
+    # Subtract the withdrawals from the discharge
+    Discharge_dict_new, Error_map = Calc_Withdrawals(Discharge_dict, River_dict, DataCube_surface_withdrawal_m3, Areas_in_m2, ID_Rivers_flow)
+
+    return(Discharge_dict_new, Error_map)
+
+def Calc_Withdrawals(Discharge_dict, River_dict, DataCube_surface_withdrawal_m3, Areas_in_m2, ID_Rivers_flow):
+    """
+    This function subtracts the surface withdrawals from the discharge of the
+    river pixel they drain to and from all the river parts downstream. The
+    withdrawal is limited by the discharge that is left at that river pixel.
+
+    The withdrawals are accumulated on the river tree, which gives the same
+    result as subtracting them one by one as long as no withdrawal is negative.
+    The time steps with negative or missing discharge or negative withdrawals
+    are therefore calculated one by one.
+
+    Keyword arguments:
+    Discharge_dict -- dictionary with the discharge [time, river pixel] per river part
+    River_dict -- dictionary with the river pixel IDs per river part, starting downstream
+    DataCube_surface_withdrawal_m3 -- array with the surface withdrawals [time, y, x]
+    Areas_in_m2 -- array with the area of every pixel [y, x]
+    ID_Rivers_flow -- array with the ID of the river pixel every pixel drains to (0 is outside the basin)
+
+    Returns:
+    Discharge_dict_new -- dictionary with the discharge after the withdrawals
+    Error_map -- array with the withdrawals that could not be supplied [mm]
+    """
+    # Copy dicts as starting adding reservoir
+    Discharge_dict_new = copy.deepcopy(Discharge_dict)
     Water_Error = 0
     Count = 0
 
     # Empty Error map
     Error_map = np.ones(DataCube_surface_withdrawal_m3.shape) * np.nan
 
-    for i in np.unique(ID_Rivers_flow)[1:]:
+    # Aggregate the withdrawals and areas per river pixel in one pass
+    IDs, ID_index = np.unique(ID_Rivers_flow, return_inverse = True)
+    ID_index = ID_index.reshape(ID_Rivers_flow.shape)
+    Withdrawal_per_ID = np.array([np.bincount(ID_index.ravel(), weights = np.nan_to_num(Withdrawal_month.ravel()), minlength = len(IDs)) for Withdrawal_month in DataCube_surface_withdrawal_m3]).T
+    Area_per_ID = np.bincount(ID_index.ravel(), weights = np.nan_to_num(Areas_in_m2.ravel()), minlength = len(IDs))
+
+    # Positions of every river pixel in the river dictionary
+    River_keys = list(River_dict.keys())
+    Positions = dict()
+    for River_key in River_keys:
+        Found_IDs = set()
+        for row_discharge, River_ID in enumerate(np.asarray(River_dict[River_key]).ravel()):
+            if River_ID not in Found_IDs:
+                Found_IDs.add(River_ID)
+                Positions.setdefault(River_ID, []).append((River_key, row_discharge))
+
+    # River tree, the downstream river part starts where the river part ends
+    Order, Subtree_end, Downstream = Create_River_Tree(River_dict, River_keys)
+    Time_steps = DataCube_surface_withdrawal_m3.shape[0]
+    Tree_withdrawals = np.zeros([len(River_keys) + 1, Time_steps])
+    Part_withdrawals = dict((River_key, np.zeros([Discharge_dict[River_key].shape[1] + 1, Time_steps])) for River_key in River_keys)
+
+    # Time steps in which a withdrawal can be negative, these are calculated one by one
+    Sequential = np.any(Withdrawal_per_ID[1:][np.sum(Withdrawal_per_ID[1:], axis = 1) > 0] < 0, axis = 0)
+    for River_key in River_keys:
+        Sequential |= np.any(~(np.asarray(Discharge_dict[River_key]) >= 0), axis = 1)
+    Discharge_sequential = dict((River_key, np.array(Discharge_dict[River_key][Sequential], dtype = float)) for River_key in River_keys)
+
+    for ID_number in range(1, len(IDs)):
+        i = IDs[ID_number]
         Count += 1
-        if np.nansum(DataCube_surface_withdrawal_m3[:,ID_Rivers_flow == i]) > 0:
-            sys.stdout.write("\r%s Procent of adding irrigation completed with %.2f x 10^9 m3 Water Error       " %(np.int(np.ceil((np.float(Count)/len(np.unique(ID_Rivers_flow))*100))),Water_Error/1e9))
+        if np.sum(Withdrawal_per_ID[ID_number]) > 0:
+            sys.stdout.write("\r%s Procent of adding irrigation completed with %.2f x 10^9 m3 Water Error       " %(np.int(np.ceil((np.float(Count)/len(IDs)*100))),Water_Error/1e9))
             sys.stdout.flush()
-            #print('%s Procent of adding irrigation completed' %np.int(i/np.unique(ID_Rivers_flow)[-1]*100))
-            total_surface_withdrawal = np.nansum(DataCube_surface_withdrawal_m3[:,ID_Rivers_flow == i] ,1)
+            total_surface_withdrawal = Withdrawal_per_ID[ID_number]
 
             # Find exact area in river directory
-            for River_part in iter(River_dict.items()):
-                if len(np.argwhere(River_part[1] == i)) > 0:
-
-                    # Find the river part in the dictionery
-                    row_discharge = np.argwhere(River_part[1]==i)[0][0]
-
-                    # Subtract the withdrawal from that specific riverpart
-                    Real_Surface_Withdrawal = np.minimum(Discharge_dict_new[River_part[0]][:,row_discharge].flatten(), total_surface_withdrawal[:,None].flatten())
-
-                    Water_Error += np.maximum(np.nansum(total_surface_withdrawal[:,None].flatten() - Real_Surface_Withdrawal),0)
-                    
-                    # Create Water error map
-                    if np.nansum(total_surface_withdrawal[:,None].flatten() - Real_Surface_Withdrawal) > 0:
-                        Errors_in_mm = (total_surface_withdrawal[:,None].flatten() - Real_Surface_Withdrawal)/(np.nansum(Areas_in_m2[ID_Rivers_flow == i]))
-                        Area_Errors = np.zeros(DataCube_surface_withdrawal_m3.shape)
-                        Area_Errors[:,ID_Rivers_flow == i] = 1
-                        Area_Errors = Errors_in_mm[:,None,None] * Area_Errors
-                        Error_map[:,ID_Rivers_flow == i] = Area_Errors[:,ID_Rivers_flow == i]
-                    
-                    Discharge_dict_new[River_part[0]][:,0:row_discharge] = Discharge_dict_new[River_part[0]][:,0:row_discharge] - Real_Surface_Withdrawal[:,None]
-
-                    # Subtract the withdrawal from the part downstream of the riverpart within the same dictionary
-                    Discharge_dict_new[River_part[0]][np.logical_and(Discharge_dict_new[River_part[0]]<=0,Discharge_dict[River_part[0]]>=0)] = 0
-                    End_river = River_dict[River_part[0]][0]
-                    times = 0
-
-                    # Subtract the withdrawal from all the other downstream dictionaries
-                    while len(River_dict) > times:
-                        for River_part_downstream in iter(River_dict.items()):
-                            if River_part_downstream[1][-1] == End_river:
-
-                                Discharge_dict_new[River_part_downstream[0]][:,:] = Discharge_dict_new[River_part_downstream[0]][:,:] - Real_Surface_Withdrawal[:,None]
-                                #Discharge_dict_new[River_part_downstream[0]][:,1:] = Discharge_dict_new[River_part_downstream[0]][:,1:] - total_surface_withdrawal[:,None]
-
-                                Discharge_dict_new[River_part_downstream[0]][np.logical_and(Discharge_dict_new[River_part_downstream[0]]<=0,Discharge_dict[River_part_downstream[0]]>=0)] = 0
-                                End_river = River_dict[River_part_downstream[0]][0]
-                                times = 0
-                            times += 1
-
-    # Finialize Error map                    
+            for River_key, row_discharge in Positions.get(i, []):
+
+                # Discharge after the withdrawals that are already subtracted upstream
+                Withdrawn_upstream = Fenwick_Sum(Tree_withdrawals, Subtree_end[River_key]) - Fenwick_Sum(Tree_withdrawals, Order[River_key] + 1)
+                Withdrawn_upstream += Fenwick_Sum(Part_withdrawals[River_key], Discharge_dict[River_key].shape[1] - row_discharge - 1)
+                Discharge_now = Clip_Discharge(Discharge_dict[River_key][:,row_discharge] - Withdrawn_upstream, Discharge_dict[River_key][:,row_discharge])
+                Discharge_now[Sequential] = Discharge_sequential[River_key][:,row_discharge]
+
+                # Subtract the withdrawal from that specific riverpart
+                Real_Surface_Withdrawal = np.minimum(Discharge_now, total_surface_withdrawal)
+
+                Water_Error += np.maximum(np.nansum(total_surface_withdrawal - Real_Surface_Withdrawal),0)
+
+                # Create Water error map
+                if np.nansum(total_surface_withdrawal - Real_Surface_Withdrawal) > 0:
+                    Errors_in_mm = (total_surface_withdrawal - Real_Surface_Withdrawal)/Area_per_ID[ID_number]
+                    Error_map[:,ID_index == ID_number] = Errors_in_mm[:,None]
+
+                # Store the withdrawal for the downstream propagation
+                Tree_withdrawal = np.where(Sequential, 0, Real_Surface_Withdrawal)
+                Fenwick_Add(Tree_withdrawals, Order[River_key] + 1, Tree_withdrawal)
+                Fenwick_Add(Part_withdrawals[River_key], Discharge_dict[River_key].shape[1] - row_discharge, Tree_withdrawal)
+                if Sequential.any():
+                    Subtract_Sequential(Discharge_sequential, Discharge_dict, Sequential, Downstream, River_key, row_discharge, Real_Surface_Withdrawal[Sequential])
+
+    # Propagate the cumulative withdrawals downstream in topological order
+    Inflow_withdrawals = dict((River_key, np.zeros(Time_steps)) for River_key in River_keys)
+    for River_key in sorted(River_keys, key = lambda River_key: -Order[River_key]):
+        Part_withdrawal = Fenwick_Values(Part_withdrawals[River_key])[::-1].T
+        Withdrawn = Inflow_withdrawals[River_key][:,None] + np.cumsum(np.hstack((Part_withdrawal[:,1:], np.zeros([Time_steps, 1])))[:,::-1], axis = 1)[:,::-1]
+        if Downstream[River_key] is not None:
+            Inflow_withdrawals[Downstream[River_key]] += Inflow_withdrawals[River_key] + np.sum(Part_withdrawal, axis = 1)
+
+        # Subtract the withdrawals and clip the discharge at zero
+        Discharge_dict_new[River_key] = Clip_Discharge(Discharge_dict[River_key] - Withdrawn, Discharge_dict[River_key])
+        Discharge_dict_new[River_key][Sequential] = Discharge_sequential[River_key]
+
+    # Finialize Error map
     Error_map[Error_map<=0] = np.nan
-    
-    return(Discharge_dict_new, Error_map)
\ No newline at end of file
+
+    return(Discharge_dict_new, Error_map)
+
+def Create_River_Tree(River_dict, River_keys):
+    """
+    This function orders the river parts from downstream to upstream, so that
+    all the river parts upstream of a river part follow it directly
+
+    Keyword arguments:
+    River_dict -- dictionary with the river pixel IDs per river part, starting downstream
+    River_keys -- list with the keys of River_dict
+
+    Returns:
+    Order -- dictionary with the position of every river part
+    Subtree_end -- dictionary with the position after the last upstream river part
+    Downstream -- dictionary with the key of the downstream river part (None for the outlet)
+    """
+    # Find the river part downstream of every river part
+    Part_ends = dict()
+    for River_key in River_keys:
+        Part_ends.setdefault(River_dict[River_key][-1], River_key)
+    Downstream = dict()
+    Upstream = dict((River_key, []) for River_key in River_keys)
+    for River_key in River_keys:
+        Downstream_key = Part_ends.get(River_dict[River_key][0])
+        if Downstream_key == River_key:
+            Downstream_key = None
+        Downstream[River_key] = Downstream_key
+        if Downstream_key is not None:
+            Upstream[Downstream_key].append(River_key)
+
+    # River parts that do not flow to an outlet are in a loop, the loop is cut
+    # at one of its river parts which is used as an outlet
+    Outlets = [River_key for River_key in River_keys if Downstream[River_key] is None]
+    Reached = set()
+    Stack = list(Outlets)
+    while Stack:
+        River_key = Stack.pop()
+        Reached.add(River_key)
+        Stack.extend(Upstream_key for Upstream_key in Upstream[River_key] if Upstream_key not in Reached)
+    for River_key in River_keys:
+        if River_key not in Reached:
+            Loop_key = River_key
+            Loop = set()
+            while Loop_key not in Loop:
+                Loop.add(Loop_key)
+                Loop_key = Downstream[Loop_key]
+            print('WARNING: river part %s does not flow to an outlet, the loop is cut at river part %s' %(River_key, Loop_key))
+            Upstream[Downstream[Loop_key]].remove(Loop_key)
+            Downstream[Loop_key] = None
+            Outlets.append(Loop_key)
+            Stack = [Loop_key]
+            while Stack:
+                Upstream_key = Stack.pop()
+                Reached.add(Upstream_key)
+                Stack.extend(Key for Key in Upstream[Upstream_key] if Key not in Reached)
+
+    # Depth first ordering starting at the outlets
+    Order = dict()
+    Subtree_end = dict()
+    for Outlet_key in Outlets:
+        Stack = [(Outlet_key, False)]
+        while Stack:
+            River_key, Visited = Stack.pop()
+            if Visited:
+                Subtree_end[River_key] = len(Order)
+            else:
+                Order[River_key] = len(Order)
+                Stack.append((River_key, True))
+                Stack.extend((Upstream_key, False) for Upstream_key in Upstream[River_key] if Upstream_key not in Order)
+
+    return(Order, Subtree_end, Downstream)
+
+def Subtract_Sequential(Discharge_sequential, Discharge_dict, Sequential, Downstream, River_key, row_discharge, Withdrawal):
+    """
+    This function subtracts one withdrawal from the discharge of the time steps
+    that are calculated one by one, from the river pixel downstream and from all
+    the river parts downstream, and clips the discharge at zero after every step
+
+    Keyword arguments:
+    Discharge_sequential -- dictionary with the discharge of these time steps per river part
+    Discharge_dict -- dictionary with the discharge without withdrawals per river part
+    Sequential -- boolean array with the time steps that are calculated one by one
+    Downstream -- dictionary with the key of the downstream river part (None for the outlet)
+    River_key -- key of the river part of the withdrawal
+    row_discharge -- position of the withdrawal in the river part
+    Withdrawal -- array with the withdrawal of these time steps
+    """
+    Discharge_sequential[River_key][:,0:row_discharge] -= Withdrawal[:,None]
+    Discharge_sequential[River_key] = Clip_Discharge(Discharge_sequential[River_key], Discharge_dict[River_key][Sequential])
+    River_key = Downstream[River_key]
+    while River_key is not None:
+        Discharge_sequential[River_key] = Clip_Discharge(Discharge_sequential[River_key] - Withdrawal[:,None], Discharge_dict[River_key][Sequential])
+        River_key = Downstream[River_key]
+
+def Clip_Discharge(Discharge, Discharge_natural):
+    """
+    This function sets the discharge to zero where the withdrawals made it negative
+    """
+    Discharge = np.array(Discharge, dtype = float)
+    Discharge[np.logical_and(Discharge<=0, Discharge_natural>=0)] = 0
+    return(Discharge)
+
+def Fenwick_Add(Tree, Index, Values):
+    """
+    This function adds values at a position (starting at 1) of a Fenwick tree
+    """
+    while Index < Tree.shape[0]:
+        Tree[Index] += Values
+        Index += Index & -Index
+
+def Fenwick_Sum(Tree, Index):
+    """
+    This function returns the sum of the values at the positions 1 up to Index of a Fenwick tree
+    """
+    Total = np.zeros(Tree.shape[1:])
+    while Index > 0:
+        Total += Tree[Index]
+        Index -= Index & -Index
+    return(Total)
+
+def Fenwick_Values(Tree):
+    """
+    This function returns the values at the positions 1 up to the end of a Fenwick tree
+    """
+    Values = Tree[1:].copy()
+    for Index in range(Values.shape[0], 0, -1):
+        Parent = Index + (Index & -Index)
+        if Parent <= Values.shape[0]:
+            Values[Parent - 1] -= Tree[Index]
+    return(Values)
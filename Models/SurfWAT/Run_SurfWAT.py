@@ -5,7 +5,7 @@ Created on Mon Mar 12 15:11:17 2018
 @author: tih
 """
 
-def main(input_nc, output_nc, input_JRC, Inflow_Text_Files, include_reservoirs = 1):
+def main(input_nc, output_nc, input_JRC, Inflow_Text_Files, include_reservoirs = 1, input_JRC_monthly = None, cores = 1):
 
     import time
     import watools.General.raster_conversions as RC
@@ -179,7 +179,7 @@ def main(input_nc, output_nc, input_JRC, Inflow_Text_Files, include_reservoirs =
 
     if include_reservoirs == 1:
         import watools.Models.SurfWAT.Part3_Reservoirs as Part3_Reservoirs
-        Discharge_dict_2, River_dict_2, DEM_dict_2, Distance_dict_2 = Part3_Reservoirs.Run(input_nc, output_nc, input_JRC)
+        Discharge_dict_2, River_dict_2, DEM_dict_2, Distance_dict_2 = Part3_Reservoirs.Run(input_nc, output_nc, input_JRC, input_JRC_monthly, cores)
 
     else:
         import copy
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Tim Hessels
+         IHE Delft 2018
+Contact: t.hessels@un-ihe.org
+Repository:
+Module: SurfWAT
+"""
+import copy
+import unittest
+import numpy as np
+from watools.Models.SurfWAT.Part4_Withdrawals import Calc_Withdrawals
+
+
+def Withdrawals_Loop(Discharge_dict, River_dict, DataCube_surface_withdrawal_m3, Areas_in_m2, ID_Rivers_flow):
+    """
+    The withdrawals subtracted one by one, as in the first version of Part4_Withdrawals.Run
+    """
+    Discharge_dict_new = copy.deepcopy(Discharge_dict)
+    Error_map = np.ones(DataCube_surface_withdrawal_m3.shape) * np.nan
+
+    for i in np.unique(ID_Rivers_flow)[1:]:
+        if np.nansum(DataCube_surface_withdrawal_m3[:,ID_Rivers_flow == i]) > 0:
+            total_surface_withdrawal = np.nansum(DataCube_surface_withdrawal_m3[:,ID_Rivers_flow == i] ,1)
+            for River_part in iter(River_dict.items()):
+                if len(np.argwhere(River_part[1] == i)) > 0:
+                    row_discharge = np.argwhere(River_part[1]==i)[0][0]
+                    Real_Surface_Withdrawal = np.minimum(Discharge_dict_new[River_part[0]][:,row_discharge].flatten(), total_surface_withdrawal[:,None].flatten())
+                    if np.nansum(total_surface_withdrawal[:,None].flatten() - Real_Surface_Withdrawal) > 0:
+                        Errors_in_mm = (total_surface_withdrawal[:,None].flatten() - Real_Surface_Withdrawal)/(np.nansum(Areas_in_m2[ID_Rivers_flow == i]))
+                        Error_map[:,ID_Rivers_flow == i] = Errors_in_mm[:,None]
+                    Discharge_dict_new[River_part[0]][:,0:row_discharge] = Discharge_dict_new[River_part[0]][:,0:row_discharge] - Real_Surface_Withdrawal[:,None]
+                    Discharge_dict_new[River_part[0]][np.logical_and(Discharge_dict_new[River_part[0]]<=0,Discharge_dict[River_part[0]]>=0)] = 0
+                    End_river = River_dict[River_part[0]][0]
+                    times = 0
+                    while len(River_dict) > times:
+                        for River_part_downstream in iter(River_dict.items()):
+                            if River_part_downstream[1][-1] == End_river:
+                                Discharge_dict_new[River_part_downstream[0]][:,:] = Discharge_dict_new[River_part_downstream[0]][:,:] - Real_Surface_Withdrawal[:,None]
+                                Discharge_dict_new[River_part_downstream[0]][np.logical_and(Discharge_dict_new[River_part_downstream[0]]<=0,Discharge_dict[River_part_downstream[0]]>=0)] = 0
+                                End_river = River_dict[River_part_downstream[0]][0]
+                                times = 0
+                            times += 1
+
+    Error_map[Error_map<=0] = np.nan
+    return(Discharge_dict_new, Error_map)
+
+
+def Random_Basin(seed, Negative = True):
+    """
+    Random river tree with discharge and withdrawals, the discharge and some
+    withdrawals are negative if Negative is True
+    """
+    Random = np.random.RandomState(seed)
+    Time_steps = 6
+    River_dict = dict()
+    Next_ID = 1
+    for River_key in range(Random.randint(1, 8)):
+        Length = Random.randint(2, 6)
+        if River_key == 0:
+            River_IDs = list(range(Next_ID, Next_ID + Length))
+        else:
+            Junction = River_dict[Random.randint(0, River_key)][-1]
+            River_IDs = [Junction] + list(range(Next_ID, Next_ID + Length - 1))
+        Next_ID = River_IDs[-1] + 1
+        River_dict[River_key] = np.array(River_IDs)
+
+    Discharge_dict = dict()
+    for River_key in River_dict.keys():
+        Discharge = Random.uniform(0, 20, (Time_steps, len(River_dict[River_key])))
+        if Negative:
+            Discharge[Random.rand(*Discharge.shape) < 0.2] *= -1
+        Discharge_dict[River_key] = Discharge
+
+    ID_Rivers_flow = Random.randint(0, Next_ID, (6, 7)).astype(float)
+    Areas_in_m2 = Random.uniform(1, 2, ID_Rivers_flow.shape)
+    DataCube_surface_withdrawal_m3 = Random.uniform(0, 15, (Time_steps,) + ID_Rivers_flow.shape)
+    if Negative:
+        DataCube_surface_withdrawal_m3[Random.rand(*DataCube_surface_withdrawal_m3.shape) < 0.1] *= -1
+    return(Discharge_dict, River_dict, DataCube_surface_withdrawal_m3, Areas_in_m2, ID_Rivers_flow)
+
+
+class TestWithdrawals(unittest.TestCase):
+
+    def Compare(self, seed, Negative):
+        Inputs = Random_Basin(seed, Negative)
+        Discharge_loop, Error_loop = Withdrawals_Loop(*copy.deepcopy(Inputs))
+        Discharge_tree, Error_tree = Calc_Withdrawals(*copy.deepcopy(Inputs))
+        for River_key in Discharge_loop.keys():
+            np.testing.assert_allclose(Discharge_tree[River_key], Discharge_loop[River_key], rtol = 1e-10, atol = 1e-8)
+        np.testing.assert_allclose(Error_tree, Error_loop, rtol = 1e-10, atol = 1e-8)
+
+    def test_positive_inputs(self):
+        for seed in range(100):
+            self.Compare(seed, False)
+
+    def test_negative_inputs(self):
+        for seed in range(300):
+            self.Compare(seed, True)
+
+    def test_river_loop(self):
+        Discharge_dict, River_dict, DataCube_surface_withdrawal_m3, Areas_in_m2, ID_Rivers_flow = Random_Basin(0, False)
+        River_dict[10] = np.array([100, 101, 102])
+        River_dict[11] = np.array([102, 103, 100])
+        for River_key in [10, 11]:
+            Discharge_dict[River_key] = np.ones((DataCube_surface_withdrawal_m3.shape[0], 3)) * 50
+        ID_Rivers_flow[0, :3] = [100, 101, 103]
+        Discharge_new, Error_map = Calc_Withdrawals(Discharge_dict, River_dict, DataCube_surface_withdrawal_m3, Areas_in_m2, ID_Rivers_flow)
+        self.assertEqual(set(Discharge_new.keys()), set(River_dict.keys()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,12 +8,14 @@ Module: waterpix
 """
 
 from __future__ import division
+import os
 from math import exp, sqrt
 import pandas as pd
 from scipy.optimize import minimize_scalar
 from scipy.optimize import fsolve
-import rpy2.robjects as robjects
-from rpy2.robjects import pandas2ri
+from scipy.optimize import least_squares
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import pdist
 
 np = pd.np
 
@@ -502,18 +504,19 @@ def get_mean_neighbors(array, index, include_cell):
     '''
     x_i, y_i = index
     n_x, n_y = array.shape
-    stay = True
+    value = np.nan
     cells = 1
-    while stay:
-        neighbors_ls = get_neighbors(x_i, y_i, n_x, n_y, cells)
-        if include_cell:
-            neighbors_ls = neighbors_ls + [(x_i, y_i)]
-        values_ls = [array[i] for i in neighbors_ls]
-        if np.isnan(values_ls).all():
+    while cells < max(n_x, n_y):
+        x_0, y_0 = max(x_i - cells, 0), max(y_i - cells, 0)
+        window = np.array(array[x_0:x_i + cells + 1, y_0:y_i + cells + 1],
+                          dtype=float)
+        if not include_cell:
+            window[x_i - x_0, y_i - y_0] = np.nan
+        if np.isnan(window).all():
             cells += 1
         else:
-            value = np.nanmean(values_ls)
-            stay = False
+            value = np.nanmean(window)
+            break
     return value
 
 
@@ -521,15 +524,175 @@ def get_neighbors(x, y, n_x, n_y, cells):
     '''
     Get the indeces of neighboring cells
     '''
-    neighbors_ls = [(x_i, y_i)
-                    for x_i in range(x - 1 - cells + 1, x + 2 + cells - 1)
-                    for y_i in range(y - 1 - cells + 1, y + 2 + cells - 1)
-                    if (-1 < x <= n_x - 1 and -1 < y <= n_y - 1 and
-                        (x != x_i or y != y_i) and
-                        (0 <= x_i <= n_x - 1) and (0 <= y_i <= n_y - 1))]
+    if not (-1 < x <= n_x - 1 and -1 < y <= n_y - 1):
+        return []
+    x_i, y_i = np.mgrid[max(x - cells, 0):min(x + cells + 1, n_x),
+                        max(y - cells, 0):min(y + cells + 1, n_y)]
+    keep = (x_i != x) | (y_i != y)
+    neighbors_ls = list(zip(x_i[keep], y_i[keep]))
     return neighbors_ls
 
 
+def mean_neighbors(array, include_cell=False, mask=None):
+    '''
+    Calculate for every cell (or the cells in mask) of an array (..., lat, lon)
+    the mean of the closest neighboring cells with values, growing the
+    window until values are found
+    '''
+    array = np.array(array, dtype=float)
+    valid = np.isfinite(array)
+    values = np.where(valid, array, 0)
+    values_sat = summed_area_table(values)
+    count_sat = summed_area_table(valid.astype(float))
+    mean = np.full(array.shape, np.nan)
+    if mask is None:
+        missing = np.ones(array.shape, dtype=bool)
+    else:
+        missing = np.array(mask, dtype=bool)
+    n_y, n_x = array.shape[-2:]
+    cells = 1
+    while missing.any() and cells < max(n_y, n_x):
+        values_sum = window_sum(values_sat, cells)
+        values_count = window_sum(count_sat, cells)
+        if not include_cell:
+            values_sum -= values
+            values_count -= valid
+        found = missing & (values_count > 0)
+        mean[found] = values_sum[found] / values_count[found]
+        missing &= ~found
+        cells += 1
+    return mean
+
+
+def replace_nan_with_closest(array):
+    '''
+    Replace nan values in an array (time, lat, lon) with the mean of the
+    spatially closest values, growing the window until values are found
+    '''
+    array = np.array(array, dtype=float)
+    missing = np.isnan(array)
+    if missing.any():
+        array[missing] = mean_neighbors(array, False, missing)[missing]
+    return array
+
+
+def get_fit_window_sizes(valid, min_no_of_values, min_cells=3):
+    '''
+    Get for every cell the smallest offset of neighboring cells, starting
+    at min_cells, with at least min_no_of_values valid values in the time
+    series (time, lat, lon) of the neighbors
+    '''
+    counts = np.sum(valid, axis=0).astype(float)
+    counts_sat = summed_area_table(counts)
+    n_y, n_x = counts.shape
+    window_cells = np.full(counts.shape, min_cells, dtype=int)
+    missing = np.ones(counts.shape, dtype=bool)
+    cells = min_cells
+    while missing.any() and cells < max(n_y, n_x):
+        found = missing & (window_sum(counts_sat, cells) - counts >=
+                           min_no_of_values)
+        window_cells[found] = cells
+        missing &= ~found
+        cells += 1
+    window_cells[missing] = max(cells, min_cells)
+    return window_cells
+
+
+def summed_area_table(array):
+    '''
+    Calculate the summed area table of an array along the last two axes
+    '''
+    shape = array.shape[:-2] + (array.shape[-2] + 1, array.shape[-1] + 1)
+    sat = np.zeros(shape)
+    sat[..., 1:, 1:] = array.cumsum(axis=-2).cumsum(axis=-1)
+    return sat
+
+
+def window_sum(sat, cells):
+    '''
+    Sum of the values within a window of +/- cells around every cell,
+    clipped at the edges, using a summed area table
+    '''
+    n_y, n_x = sat.shape[-2] - 1, sat.shape[-1] - 1
+    y_0 = np.clip(np.arange(n_y) - cells, 0, n_y)[:, np.newaxis]
+    y_1 = np.clip(np.arange(n_y) + cells + 1, 0, n_y)[:, np.newaxis]
+    x_0 = np.clip(np.arange(n_x) - cells, 0, n_x)[np.newaxis, :]
+    x_1 = np.clip(np.arange(n_x) + cells + 1, 0, n_x)[np.newaxis, :]
+    value = (sat[..., y_1, x_1] - sat[..., y_0, x_1] -
+             sat[..., y_1, x_0] + sat[..., y_0, x_0])
+    return value
+
+
+def read_nc_array(nc_var, index):
+    '''
+    Read a slab of a netcdf variable into memory with nan as NoData value
+    '''
+    array = np.ma.filled(np.ma.asarray(nc_var[index], dtype=float), np.nan)
+    array[np.isclose(array, nc_var._FillValue)] = np.nan
+    return array
+
+
+def stage_year_inputs(ncv, year_pars, min_qratio, staging_dir):
+    '''
+    Read the inputs of a single year once, replace the NoData values with
+    the mean of the closest values and save them as numpy files
+    '''
+    yyyyi, ti1, ti2 = year_pars
+    index = (slice(ti1, ti2), slice(None), slice(None))
+    inputs = {'p': read_nc_array(ncv['Precipitation_M'], index),
+              'et': read_nc_array(ncv['Evapotranspiration_M'], index),
+              'eto': read_nc_array(ncv['ReferenceET_M'], index),
+              'lai': read_nc_array(ncv['LeafAreaIndex_M'], index)}
+    # Arrays with NoData values replaced by the closest values
+    for name, var_name in [('swi', 'SWI_M'), ('swio', 'SWIo_M'),
+                           ('swix', 'SWIx_M'), ('rainydays', 'RainyDays_M')]:
+        inputs[name] = replace_nan_with_closest(
+            read_nc_array(ncv[var_name], index))
+    qratio = read_nc_array(ncv['RunoffRatio_Y'],
+                           (slice(yyyyi, yyyyi + 1), slice(None), slice(None)))
+    qratio[qratio < min_qratio] = min_qratio
+    inputs['qratio'] = replace_nan_with_closest(qratio)[0]
+    # Save arrays
+    for name, array in inputs.items():
+        np.save(os.path.join(staging_dir,
+                             '{0}_{1}.npy'.format(name, yyyyi)), array)
+
+
+def stage_static_inputs(ncv, default_pars, staging_dir):
+    '''
+    Read the time-invariant inputs once, replace the NoData values with the
+    default values and save them as numpy files
+    '''
+    default_thetasat, default_rootdepth = default_pars
+    index = (slice(None), slice(None))
+    thetasat = read_nc_array(ncv['SaturatedWaterContent'], index)
+    thetasat[np.isnan(thetasat)] = default_thetasat
+    rootdepth = read_nc_array(ncv['RootDepth'], index)
+    rootdepth[np.isnan(rootdepth)] = default_rootdepth
+    basin = np.ma.filled(ncv['BasinBuffer'][:], 0) != 0
+    # Save arrays
+    for name, array in [('thetasat', thetasat), ('rootdepth', rootdepth),
+                        ('basin', basin)]:
+        np.save(os.path.join(staging_dir, '{0}.npy'.format(name)), array)
+
+
+def load_staged_inputs(staging_dir, yyyyi, block=(slice(None), slice(None))):
+    '''
+    Load the staged inputs of a single year for a spatial block
+    '''
+    lat_sl, lon_sl = block
+    inputs = {}
+    for name in ['p', 'et', 'eto', 'lai', 'swi', 'swio', 'swix', 'rainydays',
+                 'qratio', 'thetasat', 'rootdepth', 'basin']:
+        if name in ['thetasat', 'rootdepth', 'basin']:
+            file_name = '{0}.npy'.format(name)
+        else:
+            file_name = '{0}_{1}.npy'.format(name, yyyyi)
+        array = np.load(os.path.join(staging_dir, file_name), mmap_mode='r')
+        inputs[name] = np.array(array[..., lat_sl, lon_sl])
+    return inputs
+
+
 def percolation_fit_calculation(rdsm, a, b):
     '''
     Percolation function of root depth soil moisture
@@ -572,13 +735,209 @@ def monthly_reducer(array, periods, nodata_value=-9999):
     return array_out
 
 
+def get_blocks(lat_n, lon_n, block_size):
+    '''
+    Split the grid into spatial blocks of block_size x block_size cells
+    '''
+    blocks = [(slice(i, min(i + block_size, lat_n)),
+               slice(j, min(j + block_size, lon_n)))
+              for i in range(0, lat_n, block_size)
+              for j in range(0, lon_n, block_size)]
+    return blocks
+
+
+def write_block(nc_var, index, values, mask):
+    '''
+    Write the masked cells of a block of values into a netcdf variable
+    using a single contiguous write
+    '''
+    if not mask.any():
+        return
+    if mask.all():
+        nc_var[index] = values
+    else:
+        nc_var[index] = np.ma.where(mask, values, nc_var[index])
+
+
 def array_interpolation(lon_ls, lat_ls, infz_array_in, min_infz,
-                        return_single_value):
+                        return_single_value, method='kriging',
+                        n_neighbors=16):
     '''
-    Interpolate missing values in an array using kriging in R
+    Interpolate missing values in an array using ordinary kriging ('kriging'),
+    inverse distance weighting ('idw') or automatic kriging in R ('r')
     '''
     # Replace values smaller than the minimum
     infz_array_in[infz_array_in < min_infz] = np.nan
+    # Interpolation
+    if method == 'kriging':
+        infz_array_out = kriging_interpolation(lon_ls, lat_ls, infz_array_in,
+                                               n_neighbors)
+    elif method == 'idw':
+        infz_array_out = idw_interpolation(lon_ls, lat_ls, infz_array_in,
+                                           n_neighbors)
+    elif method == 'r':
+        infz_array_out = r_kriging_interpolation(lon_ls, lat_ls,
+                                                 infz_array_in)
+    else:
+        raise ValueError('Unknown interpolation method: {0}'.format(method))
+    # Return
+    if not return_single_value:
+        return infz_array_out
+    else:
+        x, y = return_single_value
+        return infz_array_out[y, x]
+
+
+def get_interpolation_points(lon_ls, lat_ls, array):
+    '''
+    Get the coordinates of all cells and the coordinates and values of the
+    cells with data
+    '''
+    lon_grid, lat_grid = np.meshgrid(np.array(lon_ls, dtype=float),
+                                     np.array(lat_ls, dtype=float))
+    grid_xy = np.column_stack((lon_grid.ravel(), lat_grid.ravel()))
+    known = np.isfinite(array).ravel()
+    return grid_xy, grid_xy[known], array.ravel()[known]
+
+
+def idw_interpolation(lon_ls, lat_ls, array, n_neighbors=16, power=2):
+    '''
+    Interpolate an array using inverse distance weighting of the closest
+    cells with data
+    '''
+    grid_xy, known_xy, known_values = get_interpolation_points(lon_ls, lat_ls,
+                                                               array)
+    if len(known_values) == 0:
+        return np.full(array.shape, np.nan)
+    k = min(n_neighbors, len(known_values))
+    dist, idx = cKDTree(known_xy).query(grid_xy, k=k)
+    dist = dist.reshape(len(grid_xy), k)
+    idx = idx.reshape(len(grid_xy), k)
+    # Weights, cells with data keep their own value
+    with np.errstate(divide='ignore'):
+        weights = 1.0 / dist ** power
+    exact = dist[:, 0] == 0
+    weights[exact] = 0
+    weights[exact, 0] = 1
+    values = (np.sum(weights * known_values[idx], axis=1) /
+              np.sum(weights, axis=1))
+    return values.reshape(array.shape)
+
+
+def kriging_interpolation(lon_ls, lat_ls, array, n_neighbors=16,
+                          chunk_size=10000, max_cond=1e6,
+                          max_abs_weights=2.0):
+    '''
+    Interpolate an array using ordinary kriging with a fitted variogram on
+    the closest cells with data. Cells with an ill-conditioned kriging
+    system or oversized weights are interpolated with inverse distance
+    weighting, and the values are clipped to the range of the data
+    '''
+    grid_xy, known_xy, known_values = get_interpolation_points(lon_ls, lat_ls,
+                                                               array)
+    if len(known_values) < 3 or np.isclose(np.var(known_values), 0):
+        return idw_interpolation(lon_ls, lat_ls, array, n_neighbors)
+    variogram = fit_variogram(known_xy, known_values)
+    sill = variogram[1][0] + variogram[1][1]
+    k = min(n_neighbors, len(known_values))
+    tree = cKDTree(known_xy)
+    values = np.empty(len(grid_xy))
+    fallback = np.zeros(len(grid_xy), dtype=bool)
+    for i in range(0, len(grid_xy), chunk_size):
+        target_xy = grid_xy[i:i + chunk_size]
+        dist, idx = tree.query(target_xy, k=k)
+        dist = dist.reshape(len(target_xy), k)
+        idx = idx.reshape(len(target_xy), k)
+        # Kriging system for each target cell, scaled by the sill
+        neighbors_xy = known_xy[idx]
+        pair_dist = np.sqrt(np.sum((neighbors_xy[:, :, np.newaxis, :] -
+                                    neighbors_xy[:, np.newaxis, :, :]) ** 2,
+                                   axis=-1))
+        a_mat = np.ones((len(target_xy), k + 1, k + 1))
+        a_mat[:, :k, :k] = variogram_function(variogram, pair_dist) / sill
+        a_mat[:, k, k] = 0
+        b_vec = np.ones((len(target_xy), k + 1))
+        b_vec[:, :k] = variogram_function(variogram, dist) / sill
+        # Ill-conditioned systems are not solved
+        with np.errstate(all='ignore'):
+            ill = ~(np.linalg.cond(a_mat) < max_cond)
+        a_mat[ill] = np.eye(k + 1)
+        weights = np.linalg.solve(a_mat, b_vec[:, :, np.newaxis])[:, :k, 0]
+        ill |= np.sum(np.abs(weights), axis=1) > max_abs_weights
+        values[i:i + chunk_size] = np.sum(weights * known_values[idx], axis=1)
+        fallback[i:i + chunk_size] = ill
+    # Inverse distance weighting for the ill-conditioned cells
+    if fallback.any():
+        values[fallback] = idw_interpolation(lon_ls, lat_ls, array,
+                                             n_neighbors).ravel()[fallback]
+    values = np.clip(values, known_values.min(), known_values.max())
+    return values.reshape(array.shape)
+
+
+def fit_variogram(coords, values, n_lags=15, max_points=2000,
+                  min_nugget_fraction=0.01):
+    '''
+    Fit the spherical, exponential and gaussian variogram models to the
+    experimental variogram and return the best fit (model, parameters)
+    '''
+    if len(values) > max_points:
+        subset = np.random.RandomState(0).choice(len(values), max_points,
+                                                 replace=False)
+        coords = coords[subset]
+        values = values[subset]
+    # Experimental variogram
+    dist = pdist(coords)
+    semivar = 0.5 * pdist(values[:, np.newaxis], 'sqeuclidean')
+    max_lag = dist.max() / 2
+    lag_i = np.digitize(dist, np.linspace(0, max_lag, n_lags + 1)) - 1
+    in_range = (lag_i >= 0) & (lag_i < n_lags)
+    count = np.bincount(lag_i[in_range], minlength=n_lags)
+    lags = np.bincount(lag_i[in_range], dist[in_range], minlength=n_lags)
+    gammas = np.bincount(lag_i[in_range], semivar[in_range],
+                         minlength=n_lags)
+    lags = lags[count > 0] / count[count > 0]
+    gammas = gammas[count > 0] / count[count > 0]
+    count = count[count > 0]
+    # Model fits weighted by the number of pairs
+    # The nugget is at least a fraction of the variance of the data
+    min_nugget = min_nugget_fraction * np.var(values)
+    first_guess = (min_nugget, np.var(values), max_lag / 3)
+    bounds = ((min_nugget, 0.0, max_lag / 100),
+              (np.inf, np.inf, 2 * dist.max()))
+    best = None
+    for model in ['spherical', 'exponential', 'gaussian']:
+        fit_res = least_squares(
+            lambda parms: np.sqrt(count) * (
+                variogram_function((model, parms), lags) - gammas),
+            x0=first_guess, bounds=bounds)
+        if best is None or fit_res.cost < best[0]:
+            best = (fit_res.cost, (model, fit_res.x))
+    return best[1]
+
+
+def variogram_function(variogram, dist):
+    '''
+    Semivariance of a variogram model (model, (nugget, partial sill, range))
+    at the given distances
+    '''
+    model, (nugget, psill, vrange) = variogram
+    h_r = dist / vrange
+    if model == 'spherical':
+        value = np.where(h_r < 1, 1.5 * h_r - 0.5 * h_r ** 3, 1.0)
+    elif model == 'exponential':
+        value = 1 - np.exp(-3 * h_r)
+    else:
+        value = 1 - np.exp(-3 * h_r ** 2)
+    value = nugget + psill * value
+    return np.where(dist == 0, 0.0, value)
+
+
+def r_kriging_interpolation(lon_ls, lat_ls, infz_array_in):
+    '''
+    Interpolate missing values in an array using kriging in R
+    '''
+    import rpy2.robjects as robjects
+    from rpy2.robjects import pandas2ri
     # Total values in array
     n_values = np.isfinite(infz_array_in).sum()
     # Load function
@@ -620,13 +979,9 @@ def array_interpolation(lon_ls, lat_ls, infz_array_in, min_infz,
                   return(values_out)
                 }
                 ''')
-    kriging_interpolation = robjects.r['kriging_interpolation']
+    r_kriging = robjects.r['kriging_interpolation']
     # Execute kriging function and get array
-    r_array = kriging_interpolation(lon_ls, lat_ls, infz_array_in, n_values)
+    r_array = r_kriging(lon_ls, lat_ls, infz_array_in, n_values)
     infz_array_out = np.array(r_array)
     # Return
-    if not return_single_value:
-        return infz_array_out
-    else:
-        x, y = return_single_value
-        return infz_array_out[y, x]
+    return infz_array_out
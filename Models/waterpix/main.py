@@ -8,17 +8,24 @@ Module: waterpix
 """
 
 from __future__ import division
+import os
+import shutil
+import tempfile
 import datetime as dt
 from warnings import filterwarnings
 import pandas as pd
 import netCDF4
 from waterpix.functions import (calculate_first_round, calculate_second_round,
-                                return_empty_df_columns, get_neighbors,
+                                return_empty_df_columns,
+                                get_fit_window_sizes,
                                 percolation_fit_error,
-                                replace_with_closest, budyko,
-                                monthly_reducer, array_interpolation)
+                                budyko, monthly_reducer, array_interpolation,
+                                get_blocks, write_block,
+                                stage_year_inputs, stage_static_inputs,
+                                load_staged_inputs)
 
 from scipy.optimize import least_squares
+from joblib import Parallel, delayed
 
 np = pd.np
 filterwarnings("ignore")
@@ -31,9 +38,22 @@ def run(input_nc, output_nc,
         et_separation_no_periods=2, baseflow_filter=0.5,
         perc_fit_parms_bounds=((0.1, 4.5), (7500, 10.0)),
         tolerance_monthly_greenpx=5, tolerance_yearly_waterbal=10,
-        incrunoff_propfactor_bounds=(1.0, 15.0)):
+        incrunoff_propfactor_bounds=(1.0, 15.0), n_jobs=1, block_size=50,
+        infz_interpolation='kriging'):
     '''
     Executes the main module of waterpix
+
+    The inputs of each year are read once from the input netcdf file and
+    staged as numpy files, with the NoData values of SWI, SWIo, SWIx,
+    RainyDays and RunoffRatio replaced by the mean of the closest cells.
+    The cells of the first and second round are processed per spatial
+    block of block_size x block_size cells. Blocks are distributed over
+    n_jobs worker processes which read the staged inputs and return
+    their results, which are then written to the output netcdf file
+    block by block. The infiltration depth of the cells of the second
+    round is interpolated with infz_interpolation, which can be 'kriging'
+    (ordinary kriging in python), 'idw' (inverse distance weighting), or
+    'r' (automatic kriging in R, requires rpy2).
     '''
     # Read file and get lat, lon, and time data
     started = dt.datetime.now()
@@ -111,16 +131,6 @@ def run(input_nc, output_nc,
     year_var.standard_name = 'time_yyyy'
     year_var.format = 'yyyy'
     # FillValues
-    p_fv = ncv['Precipitation_M']._FillValue
-    et_fv = ncv['Evapotranspiration_M']._FillValue
-    eto_fv = ncv['ReferenceET_M']._FillValue
-    lai_fv = ncv['LeafAreaIndex_M']._FillValue
-    swi_fv = ncv['SWI_M']._FillValue
-    swio_fv = ncv['SWIo_M']._FillValue
-    swix_fv = ncv['SWIx_M']._FillValue
-    qratio_fv = ncv['RunoffRatio_Y']._FillValue
-    rainydays_fv = ncv['RainyDays_M']._FillValue
-    thetasat_fv = ncv['SaturatedWaterContent']._FillValue
     rootdepth_fv = ncv['RootDepth']._FillValue
     # Copy data
     lat_var[:] = lat_ls
@@ -296,377 +306,351 @@ def run(input_nc, output_nc,
                                   ('time_yyyy', 'latitude', 'longitude'),
                                   fill_value=std_fv)
     b_var.long_name = 'b parameter in the eqn: perc = a*rdsm^b'
-    # Pre-process first round
-    print 'Evapotranspiration separation (blue & green)'
-    budyko_v = np.vectorize(budyko)
-    inp_bas_vals = np.array(inp_basinb[:])
-    # Year loop
-    for yyyy in years_ls:
-        print '\tyear: {0}'.format(yyyy)
-        yyyyi = years_ls.index(yyyy)
-        ti1 = time_indeces[yyyy][0]
-        ti2 = time_indeces[yyyy][-1] + 1
-        # Read values & apply reducer
-        p = monthly_reducer(ncv['Precipitation_M'][ti1:ti2, :, :],
-                            et_separation_no_periods,
-                            p_fv)
-        et = monthly_reducer(ncv['Evapotranspiration_M'][ti1:ti2, :, :],
-                             et_separation_no_periods,
-                             et_fv)
-        eto = monthly_reducer(ncv['ReferenceET_M'][ti1:ti2, :, :],
-                              et_separation_no_periods,
-                              eto_fv)
-        # Budyko
+    # Stage inputs
+    print 'Staging inputs'
+    staging_dir = tempfile.mkdtemp(prefix='waterpix_',
+                                   dir=os.path.dirname(
+                                       os.path.abspath(output_nc)))
+    try:
+        stage_static_inputs(ncv, (default_thetasat, default_rootdepth),
+                            staging_dir)
+        for yyyy in years_ls:
+            print '\tyear: {0}'.format(yyyy)
+            yyyyi = years_ls.index(yyyy)
+            ti1 = time_indeces[yyyy][0]
+            ti2 = time_indeces[yyyy][-1] + 1
+            stage_year_inputs(ncv, (yyyyi, ti1, ti2), min_qratio, staging_dir)
+        # Pre-process first round
+        print 'Evapotranspiration separation (blue & green)'
+        budyko_v = np.vectorize(budyko)
         inp_bas_vals = np.array(inp_basinb[:])
-        phi = np.where(inp_bas_vals, eto/p, np.nan)
-        phi[np.isinf(phi)] = np.nan
-        phi[phi == 0] = np.nan
-        et_p_bk = budyko_v(phi)
-        et_p_bk[np.isnan(et_p_bk)] = 0
-        green_et = np.minimum(1.1*et_p_bk*p, et)
-        blue_et = et - green_et
-        green_et_yr = np.nansum(green_et, axis=0)
-        blue_et_yr = np.nansum(blue_et, axis=0)
-        # Store values
-        etg_var[yyyyi, :, :] = green_et_yr
-        etb_var[yyyyi, :, :] = blue_et_yr
-        # Green pixels
-        gpix_array = np.where(np.isclose(blue_et_yr, 0), 1,
-                              np.where(inp_bas_vals, 0, np.nan))
-        # Check percentage of green pixels
-        if np.nanmean(gpix_array) < min_greenpx_proportion:
-            gpix_array = np.where(blue_et_yr < np.nanpercentile(
-                blue_et_yr, 100*min_greenpx_proportion),
-                                  1, np.nan)
-        if np.isnan(np.nanmean(gpix_array)):
-            gpix_array = np.where(blue_et_yr < np.nanpercentile(
-                blue_et_yr, 100*min_greenpx_proportion),
-                                  1, np.nan)
-        # Store green pixels
-        gpix_var[yyyyi, :, :] = gpix_array
-    # First round
-    print 'FIRST ROUND'
-    print 'Running...'
-    # Year loop
-    for yyyy in years_ls:
-        print '\tyear: {0}'.format(yyyy)
-        yyyyi = years_ls.index(yyyy)
-        ti1 = time_indeces[yyyy][0]
-        ti2 = time_indeces[yyyy][-1] + 1
-        # Cells loops
-        for loni, lati in np.ndindex(lon_n, lat_n):
-            if inp_basinb[lati, loni]:
-                if gpix_var[yyyyi, lati, loni] == 1:
-                    # Read data
-                    p = np.array(ncv['Precipitation_M'][ti1:ti2,
-                                                        lati, loni])
-                    et = np.array(ncv['Evapotranspiration_M'][ti1:ti2,
-                                                              lati, loni])
-                    lai = np.array(ncv['LeafAreaIndex_M'][ti1:ti2,
-                                                          lati, loni])
-                    swi = np.array(ncv['SWI_M'][ti1:ti2,
-                                                lati, loni])
-                    swio = np.array(ncv['SWIo_M'][ti1:ti2,
-                                                  lati, loni])
-                    swix = np.array(ncv['SWIx_M'][ti1:ti2,
-                                                  lati, loni])
-                    rainydays = np.array(ncv['RainyDays_M'][ti1:ti2,
-                                                            lati, loni])
-                    qratio = float(ncv['RunoffRatio_Y'][yyyyi, lati, loni])
-                    # Check for NoData values
-                    p[np.isclose(p, p_fv)] = np.nan
-                    et[np.isclose(et, et_fv)] = np.nan
-                    lai[np.isclose(lai, lai_fv)] = np.nan
-                    # Check for NoData values - arrays
-                    swi[np.isclose(swi, swi_fv)] = np.nan
-                    if np.isnan(swi).any():
-                        swi_arr = np.array(ncv['SWI_M'])
-                        swi = replace_with_closest(swi, swi_arr,
-                                                   (lati, loni), (ti1, ti2))
-                    swio[np.isclose(swio, swio_fv)] = np.nan
-                    if np.isnan(swio).any():
-                        swio_arr = np.array(ncv['SWIo_M'])
-                        swio = replace_with_closest(swio, swio_arr,
-                                                    (lati, loni), (ti1, ti2))
-                    swix[np.isclose(swix, swix_fv)] = np.nan
-                    if np.isnan(swix).any():
-                        swix_arr = np.array(ncv['SWIx_M'])
-                        swix = replace_with_closest(swix, swix_arr,
-                                                    (lati, loni), (ti1, ti2))
-                    if np.isclose(qratio, qratio_fv):
-                        qratio_arr = np.array(ncv['RunoffRatio_Y'])
-                        qratio_arr[qratio_arr < min_qratio] = min_qratio
-                        qratio = replace_with_closest(qratio,
-                                                      qratio_arr,
-                                                      (lati, loni),
-                                                      (yyyyi, yyyyi + 1))
-                    elif qratio < min_qratio:
-                        qratio = min_qratio
-                    rainydays[np.isclose(rainydays, rainydays_fv)] = np.nan
-                    if np.isnan(rainydays).any():
-                        rainydays_arr = np.array(ncv['RainyDays_M'])
-                        rainydays = replace_with_closest(rainydays,
-                                                         rainydays_arr,
-                                                         (lati, loni),
-                                                         (ti1, ti2))
-                    thetasat = float(ncv['SaturatedWaterContent'][lati,
-                                                                  loni])
-                    if np.isnan(thetasat) or thetasat == thetasat_fv:
-                        thetasat = default_thetasat
-                    rootdepth = float(ncv['RootDepth'][lati, loni])
-                    if np.isnan(rootdepth) or rootdepth == rootdepth_fv:
-                        rootdepth = default_rootdepth
-                    # Dataframe
-                    if not (np.isnan(swi).any() or
-                            np.isnan(swio).any() or
-                            np.isnan(swix).any()):
-                        df = pd.DataFrame(data={'p': p, 'et': et,
-                                                'lai': lai, 'swi': swi,
-                                                'swio': swio, 'swix': swix,
-                                                'rainydays': rainydays})
-                        # Calculate first round
-                        df_out, second_round = calculate_first_round(
-                            df, (thetasat, rootdepth, qratio, baseflow_filter),
-                            infz_bounds, tolerance_yearly_waterbal)
-                    else:
-                        second_round = 0
-                        df_out = return_empty_df_columns(pd.DataFrame())
-                    # Store values in output NetCDF
-                    if not second_round:
-                        ss_var[ti1:ti2,
-                               lati, loni] = np.array(df_out['Qsw'])
-                        bf_var[ti1:ti2,
-                               lati, loni] = np.array(df_out['Qgw'])
-                        sr_var[ti1:ti2,
-                               lati, loni] = np.array(df_out['Qtot'])
-                        dsm_var[ti1:ti2,
-                                lati, loni] = np.array(df_out['dsm'])
-                        per_var[ti1:ti2,
-                                lati, loni] = np.array(df_out['perc'])
-                        rdsm_var[ti1:ti2,
-                                 lati, loni] = np.array(df_out['thetarz'])
-                        infz_var[yyyyi,
-                                 lati, loni] = float(df_out['infz'][0])
-                        rco_var[yyyyi,
-                                lati, loni] = 0
-                        etbm_var[ti1:ti2,
-                                lati, loni] = 0
-                        etgm_var[ti1:ti2,
-                                lati, loni] = np.array(df['et'])
-                        sup_var[ti1:ti2,
-                                lati, loni] = 0
-                        incss_var[ti1:ti2,
-                                lati, loni] = 0
-                        incper_var[ti1:ti2,
-                                lati, loni] = 0
-                    else:
-                        rco_var[yyyyi, lati, loni] = int(second_round)
-                else:
-                    second_round = 10
-                    rco_var[yyyyi, lati, loni] = int(second_round)
-            else:
-                gpix_var[yyyyi, lati, loni] = std_fv
-    # Pre-process second round
-    print 'Calculating infz and rdsm-perc fits'
-    infz_array_all = np.zeros((years_n, lat_n, lon_n))
-    infz_array_all[:] = np.nan
-    perc_fit_parms_first_guess = (np.mean([perc_fit_parms_bounds[0][0],
-                                           perc_fit_parms_bounds[1][0]]),
-                                  np.mean([perc_fit_parms_bounds[0][1],
-                                           perc_fit_parms_bounds[1][1]]))
-    for yyyy in years_ls:
-        print '\tyear: {0}'.format(yyyy)
-        # Time indeces
-        yyyyi = years_ls.index(yyyy)
-        ti1 = time_indeces[yyyy][0]
-        ti2 = time_indeces[yyyy][-1] + 1
-        # Estimation of infz
-        infz_array_in = np.array(infz_var[yyyyi, :, :])
-        infz_array_in[np.isclose(infz_array_in, std_fv)] = np.nan
-        infz_array_out = array_interpolation(inp_lon[:], inp_lat[:],
-                                             infz_array_in, infz_bounds[0],
-                                             False)
-        infz_array_all[yyyyi, :, :] = np.where(rco_var[yyyyi, :, :] > 0,
-                                               infz_array_out[:, :],
-                                               infz_array_in[:, :])
-        # Fit rdsm and percolation
-        # percolation_fit_func(yyyyi, perc_fit_min_no_of_values). Returns a,b,
-        for loni, lati in np.ndindex(lon_n, lat_n):
-            if rco_var[yyyyi, lati, loni] > 0:
-                n_nb = 3  # minimum_neighboring_cells_offset
-                rdsm_fit = []
-                while len(rdsm_fit) < perc_fit_min_no_of_values:
-                    tot_neighbors_ls = get_neighbors(lati, loni,
-                                                     lat_n, lon_n,
-                                                     n_nb)
-                    # Vector with values
-                    rdsm_fit = np.array(
-                        [rdsm_var[ti1:ti2, y, x] for y, x in tot_neighbors_ls]
-                        ).flatten()
-                    perc_fit = np.array(
-                        [per_var[ti1:ti2, y, x] for y, x in tot_neighbors_ls]
-                        ).flatten()
-                    # Remove small percolation values (~0)
-                    rdsm_perc_cond = np.logical_and(perc_fit > 0.01,
-                                                    rdsm_fit != std_fv)
-                    rdsm_fit = rdsm_fit[rdsm_perc_cond]
-                    perc_fit = perc_fit[rdsm_perc_cond]
-                    n_nb += 1
+        # Year loop
+        for yyyy in years_ls:
+            print '\tyear: {0}'.format(yyyy)
+            yyyyi = years_ls.index(yyyy)
+            # Read values & apply reducer
+            inputs = load_staged_inputs(staging_dir, yyyyi)
+            p = monthly_reducer(inputs['p'], et_separation_no_periods)
+            et = monthly_reducer(inputs['et'], et_separation_no_periods)
+            eto = monthly_reducer(inputs['eto'], et_separation_no_periods)
+            # Budyko
+            phi = np.where(inp_bas_vals, eto/p, np.nan)
+            phi[np.isinf(phi)] = np.nan
+            phi[phi == 0] = np.nan
+            et_p_bk = budyko_v(phi)
+            et_p_bk[np.isnan(et_p_bk)] = 0
+            green_et = np.minimum(1.1*et_p_bk*p, et)
+            blue_et = et - green_et
+            green_et_yr = np.nansum(green_et, axis=0)
+            blue_et_yr = np.nansum(blue_et, axis=0)
+            # Store values
+            etg_var[yyyyi, :, :] = green_et_yr
+            etb_var[yyyyi, :, :] = blue_et_yr
+            # Green pixels
+            gpix_array = np.where(np.isclose(blue_et_yr, 0), 1,
+                                  np.where(inp_bas_vals, 0, np.nan))
+            # Check percentage of green pixels
+            if np.nanmean(gpix_array) < min_greenpx_proportion:
+                gpix_array = np.where(blue_et_yr < np.nanpercentile(
+                    blue_et_yr, 100*min_greenpx_proportion),
+                                      1, np.nan)
+            if np.isnan(np.nanmean(gpix_array)):
+                gpix_array = np.where(blue_et_yr < np.nanpercentile(
+                    blue_et_yr, 100*min_greenpx_proportion),
+                                      1, np.nan)
+            # Store green pixels
+            gpix_var[yyyyi, :, :] = gpix_array
+        # Output variables per round
+        monthly_vars = {'Qsw': ss_var, 'Qgw': bf_var, 'Qtot': sr_var,
+                        'dsm': dsm_var, 'perc': per_var, 'thetarz': rdsm_var,
+                        'et_blue': etbm_var, 'et_green': etgm_var,
+                        'supply': sup_var, 'delta_Qsw': incss_var,
+                        'delta_perc': incper_var, 'eff': effi_var}
+        # Spatial blocks
+        blocks = get_blocks(lat_n, lon_n, block_size)
+        # First round
+        print 'FIRST ROUND'
+        print 'Running...'
+        first_round_pars = (infz_bounds, baseflow_filter,
+                            tolerance_yearly_waterbal)
+        # Year loop
+        for yyyy in years_ls:
+            print '\tyear: {0}'.format(yyyy)
+            yyyyi = years_ls.index(yyyy)
+            ti1 = time_indeces[yyyy][0]
+            ti2 = time_indeces[yyyy][-1] + 1
+            # Blocks loop
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(first_round_block)(
+                    staging_dir, (lat_sl, lon_sl), yyyyi,
+                    np.ma.filled(gpix_var[yyyyi, lat_sl, lon_sl], std_fv),
+                    first_round_pars)
+                for lat_sl, lon_sl in blocks)
+            # Store values in output NetCDF
+            for (lat_sl, lon_sl), res in zip(blocks, results):
+                for name, values in res['monthly'].items():
+                    write_block(monthly_vars[name],
+                                (slice(ti1, ti2), lat_sl, lon_sl),
+                                values, res['mask'])
+                write_block(infz_var, (yyyyi, lat_sl, lon_sl),
+                            res['infz'], res['mask'])
+                rco_var[yyyyi, lat_sl, lon_sl] = res['rco']
+                write_block(gpix_var, (yyyyi, lat_sl, lon_sl),
+                            np.full(res['basin'].shape, std_fv),
+                            ~res['basin'])
+        # Pre-process second round
+        print 'Calculating infz and rdsm-perc fits'
+        infz_array_all = np.zeros((years_n, lat_n, lon_n))
+        infz_array_all[:] = np.nan
+        perc_fit_parms_first_guess = (np.mean([perc_fit_parms_bounds[0][0],
+                                               perc_fit_parms_bounds[1][0]]),
+                                      np.mean([perc_fit_parms_bounds[0][1],
+                                               perc_fit_parms_bounds[1][1]]))
+        for yyyy in years_ls:
+            print '\tyear: {0}'.format(yyyy)
+            # Time indeces
+            yyyyi = years_ls.index(yyyy)
+            ti1 = time_indeces[yyyy][0]
+            ti2 = time_indeces[yyyy][-1] + 1
+            # Estimation of infz
+            infz_array_in = np.array(infz_var[yyyyi, :, :])
+            infz_array_in[np.isclose(infz_array_in, std_fv)] = np.nan
+            infz_array_out = array_interpolation(inp_lon[:], inp_lat[:],
+                                                 infz_array_in, infz_bounds[0],
+                                                 False, infz_interpolation)
+            infz_array_all[yyyyi, :, :] = np.where(rco_var[yyyyi, :, :] > 0,
+                                                   infz_array_out[:, :],
+                                                   infz_array_in[:, :])
+            # Fit rdsm and percolation
+            rco_array = np.ma.filled(rco_var[yyyyi, :, :], 0) > 0
+            rdsm_array = np.ma.filled(rdsm_var[ti1:ti2, :, :], np.nan)
+            perc_array = np.ma.filled(per_var[ti1:ti2, :, :], np.nan)
+            # Remove small percolation values (~0)
+            valid_array = np.logical_and(perc_array > 0.01,
+                                         np.isfinite(rdsm_array))
+            # Smallest offset of neighboring cells with enough values
+            n_nb_array = get_fit_window_sizes(valid_array,
+                                              perc_fit_min_no_of_values)
+            a_array = np.full((lat_n, lon_n), np.nan)
+            b_array = np.full((lat_n, lon_n), np.nan)
+            for lati, loni in zip(*np.where(rco_array)):
+                n_nb = n_nb_array[lati, loni]
+                lat_0, lon_0 = max(lati - n_nb, 0), max(loni - n_nb, 0)
+                window = (slice(None), slice(lat_0, lati + n_nb + 1),
+                          slice(lon_0, loni + n_nb + 1))
+                # Vector with values
+                valid_window = valid_array[window].copy()
+                valid_window[:, lati - lat_0, loni - lon_0] = False
+                rdsm_fit = rdsm_array[window][valid_window]
+                perc_fit = perc_array[window][valid_window]
+                if len(rdsm_fit) == 0:
+                    continue
                 # Fit
                 fit_res = least_squares(percolation_fit_error,
                                         x0=perc_fit_parms_first_guess,
                                         bounds=perc_fit_parms_bounds,
                                         args=(rdsm_fit, perc_fit),
                                         loss='soft_l1')
-                # Store fit parameters in output netcdf
-                a_var[yyyyi, lati, loni] = fit_res.x[0]
-                b_var[yyyyi, lati, loni] = fit_res.x[1]
-                infz_var[yyyyi, lati, loni] = infz_array_all[yyyyi,
-                                                             lati, loni]
-    # Second round
-    print 'SECOND ROUND'
-    print 'Running...'
-    # Year loop
-    for yyyy in years_ls:
-        print '\tyear: {0}'.format(yyyy)
-        # Time indeces
-        yyyyi = years_ls.index(yyyy)
-        ti1 = time_indeces[yyyy][0]
-        ti2 = time_indeces[yyyy][-1] + 1
-        # Cells loops
-        for loni, lati in np.ndindex(lon_n, lat_n):
-            if rco_var[yyyyi, lati, loni] > 0:
-                # Read data
-                p = np.array(ncv['Precipitation_M'][ti1:ti2,
-                                                    lati, loni])
-                et = np.array(ncv['Evapotranspiration_M'][ti1:ti2,
-                                                          lati, loni])
-                eto = np.array(ncv['ReferenceET_M'][ti1:ti2, lati, loni])
-                lai = np.array(ncv['LeafAreaIndex_M'][ti1:ti2,
-                                                      lati, loni])
-                swi = np.array(ncv['SWI_M'][ti1:ti2,
-                                            lati, loni])
-                swio = np.array(ncv['SWIo_M'][ti1:ti2,
-                                              lati, loni])
-                swix = np.array(ncv['SWIx_M'][ti1:ti2,
-                                              lati, loni])
-                rainydays = np.array(ncv['RainyDays_M'][ti1:ti2,
-                                                        lati, loni])
-                qratio = float(ncv['RunoffRatio_Y'][yyyyi, lati, loni])
-                # Check for NoData values
-                p[np.isclose(p, p_fv)] = np.nan
-                et[np.isclose(et, et_fv)] = np.nan
-                lai[np.isclose(lai, lai_fv)] = np.nan
-                # Check for NoData values - arrays
-                swi[np.isclose(swi, swi_fv)] = np.nan
-                if np.isnan(swi).any():
-                    swi_arr = np.array(ncv['SWI_M'])
-                    swi = replace_with_closest(swi, swi_arr,
-                                               (lati, loni), (ti1, ti2))
-                swio[np.isclose(swio, swio_fv)] = np.nan
-                if np.isnan(swio).any():
-                    swio_arr = np.array(ncv['SWIo_M'])
-                    swio = replace_with_closest(swio, swio_arr,
-                                                (lati, loni), (ti1, ti2))
-                swix[np.isclose(swix, swix_fv)] = np.nan
-                if np.isnan(swix).any():
-                    swix_arr = np.array(ncv['SWIx_M'])
-                    swix = replace_with_closest(swix, swix_arr,
-                                                (lati, loni), (ti1, ti2))
-                if np.isclose(qratio, qratio_fv):
-                    qratio_arr = np.array(ncv['RunoffRatio_Y'])
-                    qratio_arr[qratio_arr < min_qratio] = min_qratio
-                    qratio = replace_with_closest(qratio,
-                                                  qratio_arr,
-                                                  (lati, loni),
-                                                  (yyyyi, yyyyi + 1))
-                elif qratio < min_qratio:
-                    qratio = min_qratio
-                rainydays[np.isclose(rainydays, rainydays_fv)] = np.nan
-                if np.isnan(rainydays).any():
-                    rainydays_arr = np.array(ncv['RainyDays_M'])
-                    rainydays = replace_with_closest(rainydays,
-                                                     rainydays_arr,
-                                                     (lati, loni), (ti1, ti2))
-                thetasat = float(ncv['SaturatedWaterContent'][lati, loni])
-                if np.isnan(thetasat) or thetasat == thetasat_fv:
-                    thetasat = default_thetasat
-                rootdepth = float(
-                    ncv['RootDepth'][lati, loni])
-                if np.isnan(rootdepth) or rootdepth == rootdepth_fv:
-                    rootdepth = default_rootdepth
-                # Additional parameters for second round
-                infz = float(infz_var[yyyyi, lati, loni])
-                a = float(a_var[yyyyi, lati, loni])
-                b = float(b_var[yyyyi, lati, loni])
-                green_et_yr = float(etg_var[yyyyi, lati, loni])
-                blue_et_yr = float(etb_var[yyyyi, lati, loni])
-                # Dataframe
-                df = pd.DataFrame(data={'p': p, 'et': et, 'eto': eto,
-                                        'lai': lai, 'swi': swi,
-                                        'swio': swio, 'swix': swix,
-                                        'qratio': qratio,
-                                        'rainydays': rainydays})
-                # Calculate second round
-                df_out = calculate_second_round(df, (thetasat, rootdepth,
-                                                     qratio, infz, a, b,
-                                                     green_et_yr, blue_et_yr,
-                                                     baseflow_filter),
-                                                default_eff,
-                                                tolerance_monthly_greenpx,
-                                                incrunoff_propfactor_bounds)
-                # Store values in output NetCDF
-                ss_var[ti1:ti2,
-                       lati, loni] = pd.np.array(df_out['Qsw'])
-                incss_var[ti1:ti2,
-                          lati, loni] = pd.np.array(df_out['delta_Qsw'])
-                bf_var[ti1:ti2,
-                       lati, loni] = pd.np.array(df_out['Qgw'])
-                sr_var[ti1:ti2,
-                       lati, loni] = pd.np.array(df_out['Qtot'])
-                dsm_var[ti1:ti2,
-                        lati, loni] = pd.np.array(df_out['dsm'])
-                per_var[ti1:ti2,
-                        lati, loni] = pd.np.array(df_out['perc'])
-                incper_var[ti1:ti2,
-                           lati, loni] = pd.np.array(df_out['delta_perc'])
-                sup_var[ti1:ti2,
-                        lati, loni] = pd.np.array(df_out['supply'])
-                rdsm_var[ti1:ti2,
-                         lati, loni] = pd.np.array(df_out['thetarz'])
-                effi_var[ti1:ti2,
-                         lati, loni] = pd.np.array(df_out['eff'])
-                gpix_var[yyyyi, lati, loni] = df_out['rainfed'][0]
-                etbm_var[ti1:ti2,
-                         lati, loni] = pd.np.array(df_out['et_blue'])
-                etgm_var[ti1:ti2,
-                         lati, loni] = pd.np.array(df_out['et_green'])
-    # Calculate yearly variables
-    print 'Calculating values per year...'
-    for yyyy in years_ls:
-        # Time indeces
-        yyyyi = years_ls.index(yyyy)
-        ti1 = time_indeces[yyyy][0]
-        ti2 = time_indeces[yyyy][-1] + 1
-        # Sums used in efficiency calculation
-        supply_yearly_val = np.sum(sup_var[ti1:ti2, :, :], axis=0)
-        inc_ss_yearly_val = np.sum(incss_var[ti1:ti2, :, :], axis=0)
-        inc_per_yearly_val = np.sum(incper_var[ti1:ti2, :, :], axis=0)
-        # Store values
-        ssy_var[yyyyi, :, :] = np.sum(ss_var[ti1:ti2, :, :], axis=0)
-        incssy_var[yyyyi, :, :] = inc_ss_yearly_val
-        bfy_var[yyyyi, :, :] = np.sum(bf_var[ti1:ti2, :, :], axis=0)
-        sry_var[yyyyi, :, :] = np.sum(sr_var[ti1:ti2, :, :], axis=0)
-        dsmy_var[yyyyi, :, :] = np.sum(dsm_var[ti1:ti2, :, :], axis=0)
-        pery_var[yyyyi, :, :] = np.sum(per_var[ti1:ti2, :, :], axis=0)
-        incpery_var[yyyyi, :, :] = inc_per_yearly_val
-        supy_var[yyyyi, :, :] = supply_yearly_val
-        # Water use efficiency
-        effiy_var[yyyyi, :, :] = np.nanmean(effi_var[ti1:ti2, :, :], axis=0)
-    # Finishing
-    print 'Closing netcdf...'
-    out_nc.close()
+                a_array[lati, loni] = fit_res.x[0]
+                b_array[lati, loni] = fit_res.x[1]
+            # Store fit parameters in output netcdf
+            year_index = (yyyyi, slice(None), slice(None))
+            write_block(a_var, year_index, a_array, rco_array)
+            write_block(b_var, year_index, b_array, rco_array)
+            write_block(infz_var, year_index, infz_array_all[yyyyi, :, :],
+                        rco_array)
+        # Second round
+        print 'SECOND ROUND'
+        print 'Running...'
+        second_round_pars = (default_eff, baseflow_filter,
+                             tolerance_monthly_greenpx,
+                             incrunoff_propfactor_bounds)
+        # Year loop
+        for yyyy in years_ls:
+            print '\tyear: {0}'.format(yyyy)
+            # Time indeces
+            yyyyi = years_ls.index(yyyy)
+            ti1 = time_indeces[yyyy][0]
+            ti2 = time_indeces[yyyy][-1] + 1
+            # Blocks loop
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(second_round_block)(
+                    staging_dir, (lat_sl, lon_sl), yyyyi,
+                    [np.ma.filled(nc_var[yyyyi, lat_sl, lon_sl], std_fv)
+                     for nc_var in (rco_var, infz_var, a_var, b_var,
+                                    etg_var, etb_var)],
+                    second_round_pars)
+                for lat_sl, lon_sl in blocks)
+            # Store values in output NetCDF
+            for (lat_sl, lon_sl), res in zip(blocks, results):
+                for name, values in res['monthly'].items():
+                    write_block(monthly_vars[name],
+                                (slice(ti1, ti2), lat_sl, lon_sl),
+                                values, res['mask'])
+                write_block(gpix_var, (yyyyi, lat_sl, lon_sl),
+                            res['rainfed'], res['mask'])
+        # Calculate yearly variables
+        print 'Calculating values per year...'
+        for yyyy in years_ls:
+            # Time indeces
+            yyyyi = years_ls.index(yyyy)
+            ti1 = time_indeces[yyyy][0]
+            ti2 = time_indeces[yyyy][-1] + 1
+            # Sums used in efficiency calculation
+            supply_yearly_val = np.sum(sup_var[ti1:ti2, :, :], axis=0)
+            inc_ss_yearly_val = np.sum(incss_var[ti1:ti2, :, :], axis=0)
+            inc_per_yearly_val = np.sum(incper_var[ti1:ti2, :, :], axis=0)
+            # Store values
+            ssy_var[yyyyi, :, :] = np.sum(ss_var[ti1:ti2, :, :], axis=0)
+            incssy_var[yyyyi, :, :] = inc_ss_yearly_val
+            bfy_var[yyyyi, :, :] = np.sum(bf_var[ti1:ti2, :, :], axis=0)
+            sry_var[yyyyi, :, :] = np.sum(sr_var[ti1:ti2, :, :], axis=0)
+            dsmy_var[yyyyi, :, :] = np.sum(dsm_var[ti1:ti2, :, :], axis=0)
+            pery_var[yyyyi, :, :] = np.sum(per_var[ti1:ti2, :, :], axis=0)
+            incpery_var[yyyyi, :, :] = inc_per_yearly_val
+            supy_var[yyyyi, :, :] = supply_yearly_val
+            # Water use efficiency
+            effiy_var[yyyyi, :, :] = np.nanmean(effi_var[ti1:ti2, :, :],
+                                                axis=0)
+        # Finishing
+        print 'Closing netcdf...'
+        out_nc.close()
+        inp_nc.close()
+    finally:
+        shutil.rmtree(staging_dir)
     ended = dt.datetime.now()
     print 'Time elapsed: {0}'.format(ended - started)
     # Return noutput NetCDF file location
     return output_nc
+
+
+def first_round_block(staging_dir, block, yyyyi, gpix_array, model_pars):
+    '''
+    Runs the first round on a spatial block of cells and returns the
+    results in numpy buffers
+    '''
+    # Parameters
+    infz_bounds, baseflow_filter, tolerance_yearly_waterbal = model_pars
+    # Read inputs
+    inputs = load_staged_inputs(staging_dir, yyyyi, block)
+    basin = inputs['basin']
+    n_t = inputs['p'].shape[0]
+    lat_n, lon_n = basin.shape
+    # Buffers
+    res = {'monthly': dict((name, np.full((n_t, lat_n, lon_n), np.nan))
+                           for name in ['Qsw', 'Qgw', 'Qtot', 'dsm', 'perc',
+                                        'thetarz', 'et_blue', 'et_green',
+                                        'supply', 'delta_Qsw', 'delta_perc']),
+           'infz': np.full((lat_n, lon_n), np.nan),
+           'rco': np.zeros((lat_n, lon_n), dtype=int),
+           'mask': np.zeros((lat_n, lon_n), dtype=bool),
+           'basin': basin}
+    # Cells loops
+    for loni, lati in np.ndindex(lon_n, lat_n):
+        if basin[lati, loni]:
+            if gpix_array[lati, loni] == 1:
+                # Read data
+                p = inputs['p'][:, lati, loni]
+                et = inputs['et'][:, lati, loni]
+                lai = inputs['lai'][:, lati, loni]
+                swi = inputs['swi'][:, lati, loni]
+                swio = inputs['swio'][:, lati, loni]
+                swix = inputs['swix'][:, lati, loni]
+                rainydays = inputs['rainydays'][:, lati, loni]
+                qratio = float(inputs['qratio'][lati, loni])
+                thetasat = float(inputs['thetasat'][lati, loni])
+                rootdepth = float(inputs['rootdepth'][lati, loni])
+                # Dataframe
+                if not (np.isnan(swi).any() or
+                        np.isnan(swio).any() or
+                        np.isnan(swix).any()):
+                    df = pd.DataFrame(data={'p': p, 'et': et,
+                                            'lai': lai, 'swi': swi,
+                                            'swio': swio, 'swix': swix,
+                                            'rainydays': rainydays})
+                    # Calculate first round
+                    df_out, second_round = calculate_first_round(
+                        df, (thetasat, rootdepth, qratio, baseflow_filter),
+                        infz_bounds, tolerance_yearly_waterbal)
+                else:
+                    second_round = 0
+                    df_out = return_empty_df_columns(pd.DataFrame())
+                # Store values in buffers
+                if not second_round:
+                    for name in ['Qsw', 'Qgw', 'Qtot', 'dsm', 'perc',
+                                 'thetarz']:
+                        res['monthly'][name][:, lati, loni] = np.array(
+                            df_out[name], dtype=float)
+                    for name in ['et_blue', 'supply', 'delta_Qsw',
+                                 'delta_perc']:
+                        res['monthly'][name][:, lati, loni] = 0
+                    res['monthly']['et_green'][:, lati, loni] = et
+                    res['infz'][lati, loni] = float(df_out['infz'][0])
+                    res['mask'][lati, loni] = True
+                res['rco'][lati, loni] = int(second_round)
+            else:
+                res['rco'][lati, loni] = 10
+    # Return buffers
+    return res
+
+
+def second_round_block(staging_dir, block, yyyyi, year_arrays, model_pars):
+    '''
+    Runs the second round on a spatial block of cells and returns the
+    results in numpy buffers
+    '''
+    # Parameters
+    rco, infz_arr, a_arr, b_arr, green_et_arr, blue_et_arr = year_arrays
+    (default_eff, baseflow_filter, tolerance_monthly_greenpx,
+     incrunoff_propfactor_bounds) = model_pars
+    # Read inputs
+    inputs = load_staged_inputs(staging_dir, yyyyi, block)
+    n_t = inputs['p'].shape[0]
+    lat_n, lon_n = rco.shape
+    # Buffers
+    res = {'monthly': dict((name, np.full((n_t, lat_n, lon_n), np.nan))
+                           for name in ['Qsw', 'delta_Qsw', 'Qgw', 'Qtot',
+                                        'dsm', 'perc', 'delta_perc',
+                                        'supply', 'thetarz', 'eff',
+                                        'et_blue', 'et_green']),
+           'rainfed': np.zeros((lat_n, lon_n), dtype=int),
+           'mask': rco > 0}
+    # Cells loops
+    for loni, lati in np.ndindex(lon_n, lat_n):
+        if res['mask'][lati, loni]:
+            # Read data
+            qratio = float(inputs['qratio'][lati, loni])
+            thetasat = float(inputs['thetasat'][lati, loni])
+            rootdepth = float(inputs['rootdepth'][lati, loni])
+            # Additional parameters for second round
+            infz = float(infz_arr[lati, loni])
+            a = float(a_arr[lati, loni])
+            b = float(b_arr[lati, loni])
+            green_et_yr = float(green_et_arr[lati, loni])
+            blue_et_yr = float(blue_et_arr[lati, loni])
+            # Dataframe
+            df = pd.DataFrame(data={'p': inputs['p'][:, lati, loni],
+                                    'et': inputs['et'][:, lati, loni],
+                                    'eto': inputs['eto'][:, lati, loni],
+                                    'lai': inputs['lai'][:, lati, loni],
+                                    'swi': inputs['swi'][:, lati, loni],
+                                    'swio': inputs['swio'][:, lati, loni],
+                                    'swix': inputs['swix'][:, lati, loni],
+                                    'qratio': qratio,
+                                    'rainydays': inputs['rainydays'][:, lati,
+                                                                     loni]})
+            # Calculate second round
+            df_out = calculate_second_round(df, (thetasat, rootdepth,
+                                                 qratio, infz, a, b,
+                                                 green_et_yr, blue_et_yr,
+                                                 baseflow_filter),
+                                            default_eff,
+                                            tolerance_monthly_greenpx,
+                                            incrunoff_propfactor_bounds)
+            # Store values in buffers
+            for name in res['monthly'].keys():
+                res['monthly'][name][:, lati, loni] = np.array(
+                    df_out[name], dtype=float)
+            res['rainfed'][lati, loni] = df_out['rainfed'][0]
+    # Return buffers
+    return res
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Gonzalo E. Espinoza-Dávalos
+         IHE Delft 2017
+Contact: g.espinoza@un-ihe.org
+Repository: https://github.com/gespinoza/waterpix
+Module: waterpix
+"""
+
+from __future__ import division
+import unittest
+import numpy as np
+from waterpix.functions import (kriging_interpolation, idw_interpolation,
+                                fit_variogram)
+
+
+def noisy_infz_field(seed, missing=0.3):
+    '''
+    Smooth infz field (range ~300-1550 mm) with noise (sigma = 10 mm) and
+    a fraction of missing cells
+    '''
+    lon_ls = np.linspace(30, 34, 40)
+    lat_ls = np.linspace(5, 2, 30)
+    lon_grid, lat_grid = np.meshgrid(lon_ls, lat_ls)
+    random = np.random.RandomState(seed)
+    field = (1000 + 450 * np.sin(1.3 * lon_grid) * np.cos(1.1 * lat_grid) +
+             125 * (lon_grid - 32) + random.normal(0, 10, lon_grid.shape))
+    array = field.copy()
+    array[random.rand(*field.shape) < missing] = np.nan
+    return lon_ls, lat_ls, field, array
+
+
+class TestKrigingInterpolation(unittest.TestCase):
+
+    def test_noisy_field(self):
+        for seed in range(5):
+            lon_ls, lat_ls, field, array = noisy_infz_field(seed)
+            missing = np.isnan(array)
+            kriging = kriging_interpolation(lon_ls, lat_ls, array)
+            idw = idw_interpolation(lon_ls, lat_ls, array)
+            kriging_error = np.abs(kriging - field)[missing]
+            idw_error = np.abs(idw - field)[missing]
+            # Values stay within the range of the data
+            self.assertGreaterEqual(kriging.min(), np.nanmin(array))
+            self.assertLessEqual(kriging.max(), np.nanmax(array))
+            # Not worse than inverse distance weighting, no outliers
+            self.assertLessEqual(kriging_error.mean(), idw_error.mean())
+            self.assertLess(kriging_error.max(), 100)
+
+    def test_nugget_floor(self):
+        lon_ls, lat_ls, field, array = noisy_infz_field(2)
+        lon_grid, lat_grid = np.meshgrid(lon_ls, lat_ls)
+        known = np.isfinite(array)
+        coords = np.column_stack((lon_grid[known], lat_grid[known]))
+        model, (nugget, psill, vrange) = fit_variogram(coords, array[known])
+        self.assertGreaterEqual(nugget, 0.01 * np.var(array[known]) * 0.999)
+
+    def test_known_cells_are_kept(self):
+        lon_ls, lat_ls, field, array = noisy_infz_field(0)
+        known = np.isfinite(array)
+        kriging = kriging_interpolation(lon_ls, lat_ls, array)
+        self.assertTrue(np.allclose(kriging[known], array[known]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,8 +21,7 @@ import gdal
 import pandas as pd
 import netCDF4
 from scipy.interpolate import griddata
-import rpy2.robjects as robjects
-from rpy2.robjects import pandas2ri
+from waterpix.functions import mean_neighbors
 
 np = pd.np
 
@@ -740,6 +739,8 @@ def Kriging_Interpolation_Points(input_shp, field_name, output_tiff, cellsize,
 
     Reference: https://cran.r-project.org/web/packages/automap/automap.pdf
     """
+    import rpy2.robjects as robjects
+    from rpy2.robjects import pandas2ri
     # Spatial reference
     inp_driver = ogr.GetDriverByName('ESRI Shapefile')
     inp_source = inp_driver.Open(input_shp, 0)
@@ -785,6 +786,8 @@ def Kriging_Interpolation_Array(input_array, x_vector, y_vector):
 
     Reference: https://cran.r-project.org/web/packages/automap/automap.pdf
     """
+    import rpy2.robjects as robjects
+    from rpy2.robjects import pandas2ri
     # Total values in array
     n_values = np.isfinite(input_array).sum()
     # Load function
@@ -838,12 +841,12 @@ def get_neighbors(x, y, nx, ny, cells=1):
     """
     Get a list of neighboring cells
     """
-    neighbors_ls = [(xi, yi)
-                    for xi in range(x - 1 - cells + 1, x + 2 + cells - 1)
-                    for yi in range(y - 1 - cells + 1, y + 2 + cells - 1)
-                    if (-1 < x <= nx - 1 and -1 < y <= ny - 1 and
-                        (x != xi or y != yi) and
-                        (0 <= xi <= nx - 1) and (0 <= yi <= ny - 1))]
+    if not (-1 < x <= nx - 1 and -1 < y <= ny - 1):
+        return []
+    xi, yi = np.mgrid[max(x - cells, 0):min(x + cells + 1, nx),
+                      max(y - cells, 0):min(y + cells + 1, ny)]
+    keep = (xi != x) | (yi != y)
+    neighbors_ls = list(zip(xi[keep], yi[keep]))
     return neighbors_ls
 
 
@@ -853,18 +856,19 @@ def get_mean_neighbors(array, index, include_cell=False):
     """
     xi, yi = index
     nx, ny = array.shape
-    stay = True
+    value = np.nan
     cells = 1
-    while stay:
-        neighbors_ls = get_neighbors(xi, yi, nx, ny, cells)
-        if include_cell:
-            neighbors_ls = neighbors_ls + [(xi, yi)]
-        values_ls = [array[i] for i in neighbors_ls]
-        if pd.np.isnan(values_ls).all():
+    while cells < max(nx, ny):
+        x0, y0 = max(xi - cells, 0), max(yi - cells, 0)
+        window = np.array(array[x0:xi + cells + 1, y0:yi + cells + 1],
+                          dtype=float)
+        if not include_cell:
+            window[xi - x0, yi - y0] = np.nan
+        if np.isnan(window).all():
             cells += 1
         else:
-            value = pd.np.nanmean(values_ls)
-            stay = False
+            value = np.nanmean(window)
+            break
     return value
 
 
@@ -874,12 +878,7 @@ def array_filter(array, number_of_passes=1):
     surrounding cells
     """
     while number_of_passes >= 1:
-        ny, nx = array.shape
-        arrayf = pd.np.empty(array.shape)
-        arrayf[:] = pd.np.nan
-        for j in range(ny):
-            for i in range(nx):
-                arrayf[j, i] = get_mean_neighbors(array, (j, i), True)
+        arrayf = mean_neighbors(array, True)
         array[:] = arrayf[:]
         number_of_passes -= 1
     return arrayf
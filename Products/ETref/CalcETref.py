@@ -9,13 +9,16 @@ Module: Products/ETref
 '''
 # import general python modules
 import gdal
+import hashlib
 import numpy as np
+from scipy.spatial import cKDTree
 
 # import WA+ modules
-from watools.Products.ETref.Interpolate_Meteo_ETref import process_GLDAS, lapse_rate, adjust_P, slope_correct
+from watools.Products.ETref.Interpolate_Meteo_ETref import process_GLDAS, lapse_rate, adjust_P, slope_correct, lapse_rate_array, adjust_P_array, slope_correct_array
+from watools.Products.ETref.TerrainETref import Radiation_DOY
 import watools.General.raster_conversions as RC
 
-def calc_ETref(Dir, tmin_str, tmax_str, humid_str, press_str, wind_str, down_short_str, down_long_str, up_long_str, DEMmap_str, DOY):
+def calc_ETref(Dir, tmin_str, tmax_str, humid_str, press_str, wind_str, down_short_str, down_long_str, up_long_str, DEMmap_str, DOY, Terrain = None):
     """
     This function calculates the ETref by using all the input parameters (path)
     according to FAO standards
@@ -32,6 +35,7 @@ def calc_ETref(Dir, tmin_str, tmax_str, humid_str, press_str, wind_str, down_sho
     up_long_str -- 'C:/'  path to the upward longwave radiation tiff file [W*m-2], e.g. from CFSR/LANDSAF
     DEMmap_str -- 'C:/'  path to the DEM tiff file [m] e.g. from HydroSHED
     DOY -- Day of the year
+    Terrain -- dictionary with the static terrain arrays (see TerrainETref), computed from DEMmap_str if not given
     """
 
     # Get some geo-data to save results
@@ -64,11 +68,11 @@ def calc_ETref(Dir, tmin_str, tmax_str, humid_str, press_str, wind_str, down_sho
     input_array = dict({'tmin':None,'tmax':None,'humid':None,'press':None,'wind':None,'albedo':None,'down_short':None,'down_long':None,'up_short':None,'up_long':None,'net_radiation':None,'ea':None,'es':None,'delta':None})
 
     #APPLY LAPSE RATE CORRECTION ON TEMPERATURE
-    tmin = lapse_rate(Dir, inputs['tmin'], DEMmap_str)
-    tmax = lapse_rate(Dir, inputs['tmax'], DEMmap_str)
+    tmin = lapse_rate(Dir, inputs['tmin'], DEMmap_str, Terrain)
+    tmax = lapse_rate(Dir, inputs['tmax'], DEMmap_str, Terrain)
 
     #PROCESS PRESSURE MAPS
-    press =adjust_P(Dir, inputs['press'], DEMmap_str)
+    press =adjust_P(Dir, inputs['press'], DEMmap_str, Terrain)
 
     #PREPARE HUMIDITY MAPS
     dest = RC.reproject_dataset_example(inputs['humid'], DEMmap_str, method = 2)
@@ -110,7 +114,7 @@ def calc_ETref(Dir, tmin_str, tmax_str, humid_str, press_str, wind_str, down_sho
         dest = RC.reproject_dataset_example(inputs['down_short'], DEMmap_str,method = 2)
         down_short=dest.GetRasterBand(1).ReadAsArray()
         dest = None
-        down_short, tau, bias = slope_correct(down_short,press,ea,DEMmap_str,DOY)
+        down_short, tau, bias = slope_correct(down_short,press,ea,DEMmap_str,DOY,Terrain)
 
         #OPEN OTHER RADS
         up_short = down_short*0.23
@@ -140,21 +144,165 @@ def calc_ETref(Dir, tmin_str, tmax_str, humid_str, press_str, wind_str, down_sho
     #return a reference ET map (numpy array), a dictionary containing all intermediate information and a bias of the slope correction on down_short
     return ETref
 
+def calc_ETref_stack(Input_Files_Days, DOYs, DEMmap_str, Terrain, Plans = None):
+    """
+    This function calculates the ETref of a block of days at once. The inputs
+    of all the days are loaded as [days, y, x] stacks on the DEM grid and the
+    FAO equations are evaluated in one vectorised pass (see calc_ETref for
+    the equations of one day)
+
+    Keyword arguments:
+    Input_Files_Days -- list with per day the paths [tmin, tmax, humid, press, wind, down_short, down_long, up_long] (see SetVarETref.Input_Files)
+    DOYs -- list with the day of year of every day
+    DEMmap_str -- 'C:/'  path to the DEM tiff file [m] e.g. from HydroSHED
+    Terrain -- dictionary with the static terrain arrays (see TerrainETref)
+    Plans -- dictionary with the reprojection and gap filling plans of earlier blocks (optional)
+
+    Returns:
+    ETref -- numpy array [days, y, x] with the reference ET [mm/day]
+    Plans -- dictionary with the plans, can be reused for the next block
+    """
+    if Plans is None:
+        Plans = dict()
 
+    # Get the grid of the output
+    GeoT, Projection, xsize, ysize = RC.Open_array_info(DEMmap_str)
+    Grid = [GeoT, ysize, xsize]
 
+    # Load the GLDAS data as stacks
+    Files = list(zip(*Input_Files_Days))
+    tmin = Load_Stack(Files[0], -9999, Grid, Plans)
+    tmax = Load_Stack(Files[1], -9999, Grid, Plans)
+    humid = Load_Stack(Files[2], -9999, Grid, Plans)
+    press = Load_Stack(Files[3], -9999, Grid, Plans)
+    wind = Load_Stack(Files[4], -9999, Grid, Plans) * 0.75
 
+    #APPLY LAPSE RATE CORRECTION ON TEMPERATURE AND PROCESS PRESSURE MAPS
+    tmin = lapse_rate_array(tmin, Terrain['dem_avg'], Terrain['dem'])
+    tmax = lapse_rate_array(tmax, Terrain['dem_avg'], Terrain['dem'])
+    press = adjust_P_array(press, Terrain['dem_avg'], Terrain['dem'])
 
+    #PROCESS GLDAS DATA
+    ea, es, delta = process_GLDAS(tmax,tmin,humid,press)
 
+    if Files[7][0] == 'not':
 
+        # LANDSAF shortwave net and clear sky radiation (not gap filled)
+        Short_Net_data = Load_Stack(Files[5], None, Grid, Plans) * 0.75
+        Short_Clear_data = Load_Stack(Files[6], None, Grid, Plans) * 0.75
+
+        # Calculate Long wave Net radiation
+        Rnl = 4.903e-9 * (((tmin + 273.16)**4+(tmax + 273.16)**4)/2)*(0.34 - 0.14 * np.sqrt(ea)) * (1.35 * Short_Net_data/Short_Clear_data -0.35)
+
+        # Calulate Net Radiation and converted to MJ*d-1*m-2
+        net_radiation = (Short_Net_data * 0.77 + Rnl)*86400/10**6
+
+    else:
+
+        #OPEN DOWNWARD SHORTWAVE RADIATION AND CORRECT FOR THE SLOPE
+        down_short = Load_Stack(Files[5], np.nan, Grid, Plans)
+        Radiation = [Radiation_DOY(Terrain, DOY) for DOY in DOYs]
+        Ra_hor, Ra_slp, sinb, sinb_hor = [np.array(Radiation_one) for Radiation_one in zip(*Radiation)]
+        slope = Terrain['slope']
+        fi = 0.75 + 0.25*np.cos(slope) - (0.5*slope/np.pi)
+        down_short, tau, bias = slope_correct_array(down_short, press, ea, Ra_hor, Ra_slp, sinb, sinb_hor, fi, slope)
+
+        #OPEN OTHER RADS
+        up_short = down_short*0.23
+        down_long = Load_Stack(Files[6], np.nan, Grid, Plans)
+        up_long = Load_Stack(Files[7], np.nan, Grid, Plans)
 
+        #OPEN NET RADIATION AND CONVERT W*m-2 TO MJ*d-1*m-2
+        net_radiation = ((down_short-up_short) + (down_long-up_long))*86400/10**6
 
+    #CALCULATE ETref
+    ETref = (0.408 * delta * net_radiation + 0.665*10**-3 *
+        press * (900/((tmax+tmin)/2 + 273)) *
+        wind * (es - ea)) / (delta + 0.665*10**-3 *
+        press * (1 + 0.34 * wind))
 
+    # Set limits ETref
+    ETref[ETref<0]=0
+    ETref[ETref>400]=np.nan
 
+    return ETref, Plans
 
+def Load_Stack(filenames, NoDataValue, Grid, Plans):
+    """
+    This function opens tiff files, fills the gaps with the nearest value and
+    resamples them bilinearly to the output grid. The gap filling and the
+    resampling weights are calculated once per mask and per input grid and are
+    stored in Plans. The input and output grids must have the same projection.
 
+    Keyword arguments:
+    filenames -- list with the paths of the tiff files
+    NoDataValue -- value that must be gap filled (None for no gap filling)
+    Grid -- [geotransform, size_Y, size_X] of the output grid
+    Plans -- dictionary with the plans, new plans are added to it
 
+    Returns:
+    Stack -- numpy array [files, y, x] on the output grid
+    """
+    Stack = np.zeros([len(filenames), Grid[1], Grid[2]])
+    for i, filename in enumerate(filenames):
+        geo_in, proj_in, size_X_in, size_Y_in = RC.Open_array_info(filename)
+        data = RC.Open_tiff_array(filename).astype(np.float64)
+
+        # Fill the gaps with the nearest value
+        if NoDataValue is not None:
+            if NoDataValue is np.nan:
+                mask = ~(np.isnan(data))
+            else:
+                mask = ~(data==NoDataValue)
+            if not np.all(mask):
+                key = ('fill', hashlib.md5(mask.tostring()).hexdigest(), mask.shape)
+                if key not in Plans:
+                    yy, xx = np.nonzero(mask)
+                    yy_all, xx_all = np.indices(mask.shape)
+                    Tree = cKDTree(np.vstack((xx, yy)).T)
+                    Plans[key] = Tree.query(np.vstack((np.ravel(xx_all), np.ravel(yy_all))).T)[1]
+                data = data[mask][Plans[key]].reshape(data.shape)
+
+        # Resample to the output grid
+        key = ('grid', tuple(geo_in), size_Y_in, size_X_in)
+        if key not in Plans:
+            Plans[key] = Bilinear_Plan(geo_in, size_Y_in, size_X_in, Grid)
+        Stack[i,:,:] = Apply_Bilinear_Plan(data, Plans[key])
+
+    return(Stack)
+
+def Bilinear_Plan(geo_in, size_Y_in, size_X_in, Grid):
+    """
+    This function calculates the rows, columns and weights for a bilinear
+    resampling between two north-up grids. Output pixels outside the input
+    grid get the value of the nearest edge pixel.
 
+    Keyword arguments:
+    geo_in -- geotransform of the input grid
+    size_Y_in -- amount of rows of the input grid
+    size_X_in -- amount of columns of the input grid
+    Grid -- [geotransform, size_Y, size_X] of the output grid
+    """
+    geo_out, size_Y_out, size_X_out = Grid
 
+    # Position of the output pixel centers in input pixels (0 is the center of the first pixel)
+    x = (geo_out[0] + (np.arange(size_X_out) + 0.5) * geo_out[1] - geo_in[0]) / geo_in[1] - 0.5
+    y = (geo_out[3] + (np.arange(size_Y_out) + 0.5) * geo_out[5] - geo_in[3]) / geo_in[5] - 0.5
 
+    Plan = []
+    for position, size in [(y, size_Y_in), (x, size_X_in)]:
+        first = np.floor(position)
+        weight = np.clip(position - first, 0, 1)
+        second = np.clip(first + 1, 0, size - 1).astype(int)
+        first = np.clip(first, 0, size - 1).astype(int)
+        Plan.append([first, second, weight])
 
+    return(Plan)
 
+def Apply_Bilinear_Plan(data, Plan):
+    """
+    This function resamples a 2D array with the plan of Bilinear_Plan
+    """
+    [row_1, row_2, weight_row], [col_1, col_2, weight_col] = Plan
+    data_rows = data[row_1,:] * (1 - weight_row[:,None]) + data[row_2,:] * weight_row[:,None]
+    return(data_rows[:,col_1] * (1 - weight_col[None,:]) + data_rows[:,col_2] * weight_col[None,:])
@@ -15,11 +15,11 @@ import pandas as pd
 import subprocess
 import osr
 import netCDF4
-import glob
 
 # import WA+ modules
 from watools.General import data_conversions as DC
 from watools.General import raster_conversions as RC
+from watools.General import file_catalogue as FC
 from watools.Products.ETref.SlopeInfluence_ETref import SlopeInfluence
 
 def CollectLANDSAF(SourceLANDSAF, Dir, Startdate, Enddate, latlim, lonlim):
@@ -169,7 +169,6 @@ def Transform(SourceLANDSAF, OutPath, Type, Dates = ['2000-01-01','2013-12-31'])
 
     path = os.path.join(SourceLANDSAF,Type)
 
-    os.chdir(path)
     Dates = pd.date_range(Dates[0],Dates[1],freq='D')
 
     srs = osr.SpatialReference()
@@ -180,14 +179,14 @@ def Transform(SourceLANDSAF, OutPath, Type, Dates = ['2000-01-01','2013-12-31'])
 
     for Date in Dates:
         if Type == 'SIS':
-            ZipFile = glob.glob('SISdm%s*.nc.gz' % Date.strftime('%Y%m%d'))[0]
+            ZipFile = FC.Find_Files(path, 'SISdm%s*.nc.gz' % Date.strftime('%Y%m%d'))[0]
             File = os.path.splitext(ZipFile)[0]
         elif Type == 'SID':
-            ZipFile = glob.glob('*dm%s*.nc.gz' % Date.strftime('%Y%m%d'))[0]
+            ZipFile = FC.Find_Files(path, '*dm%s*.nc.gz' % Date.strftime('%Y%m%d'))[0]
             File = os.path.splitext(ZipFile)[0]
 
         # find path to the executable
-        fullCmd = ''.join("7z x %s -o%s -aoa"  %(os.path.join(path,ZipFile),path))
+        fullCmd = ''.join("7z x %s -o%s -aoa"  %(ZipFile,path))
         process = subprocess.Popen(fullCmd)
         process.wait()
 
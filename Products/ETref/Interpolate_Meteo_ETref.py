@@ -8,13 +8,12 @@ Module: Products/ETref
 """
 
 # import general python modules
-import os
 import numpy as np
 
 # import WA+ modules
-from watools.General import data_conversions as DC
 from watools.General import raster_conversions as RC
 from watools.Products.ETref.SlopeInfluence_ETref import SlopeInfluence
+from watools.Products.ETref.TerrainETref import Radiation_DOY
 
 def process_GLDAS(Tmax, Tmin, humidity, surface_pressure):
     """
@@ -48,31 +47,27 @@ def process_GLDAS(Tmax, Tmin, humidity, surface_pressure):
 
     return ea, es, delta
 
-def lapse_rate(Dir,temperature_map, DEMmap):
+def lapse_rate(Dir,temperature_map, DEMmap, Terrain = None):
     """
     This function downscales the GLDAS temperature map by using the DEM map
 
     Keyword arguments:
     temperature_map -- 'C:/' path to the temperature map
     DEMmap -- 'C:/' path to the DEM map
+    Terrain -- dictionary with the static terrain arrays (see TerrainETref)
     """
 
-    # calculate average altitudes corresponding to T resolution
-    dest = RC.reproject_dataset_example(DEMmap, temperature_map,method = 4)
-    DEM_ave_out_name = os.path.join(Dir,'HydroSHED', 'DEM','DEM_ave.tif')
-    geo_out, proj, size_X, size_Y = RC.Open_array_info(temperature_map)
-    DEM_ave_data = dest.GetRasterBand(1).ReadAsArray()
-    DC.Save_as_tiff(DEM_ave_out_name, DEM_ave_data, geo_out, proj)
-    dest = None
+    if Terrain is not None:
+        dem_avg = Terrain['dem_avg']
+    else:
+        # calculate average altitudes corresponding to T resolution (in memory)
+        destDEMave = RC.reproject_dataset_example(DEMmap, temperature_map,method = 4)
 
-    # determine lapse-rate [degress Celcius per meter]
-    lapse_rate_number = 0.0065
-
-    # open maps as numpy arrays
-    dest = RC.reproject_dataset_example(DEM_ave_out_name, DEMmap, method = 2)
-    dem_avg=dest.GetRasterBand(1).ReadAsArray()
-    dem_avg[dem_avg<0]=0
-    dest = None
+        # open maps as numpy arrays
+        dest = RC.reproject_dataset_example(destDEMave, DEMmap, method = 2)
+        dem_avg=dest.GetRasterBand(1).ReadAsArray()
+        dest = None
+        destDEMave = None
 
     # Open the temperature dataset
     dest = RC.reproject_dataset_example(temperature_map, DEMmap, method = 2)
@@ -80,7 +75,30 @@ def lapse_rate(Dir,temperature_map, DEMmap):
     dest = None
 
     # Open Demmap
-    demmap = RC.Open_tiff_array(DEMmap)
+    if Terrain is not None:
+        demmap = Terrain['dem']
+    else:
+        demmap = RC.Open_tiff_array(DEMmap)
+
+    return lapse_rate_array(T, dem_avg, demmap)
+
+def lapse_rate_array(T, dem_avg, demmap):
+    """
+    This function applies the lapse rate correction on a temperature array,
+    that can also be a stack of days [days, y, x]
+
+    Keyword arguments:
+    T -- numpy array with the temperature on the DEM grid
+    dem_avg -- numpy array with the DEM averaged over the temperature pixels
+    demmap -- numpy array with the DEM
+    """
+
+    # determine lapse-rate [degress Celcius per meter]
+    lapse_rate_number = 0.0065
+
+    dem_avg = np.array(dem_avg)
+    demmap = np.array(demmap)
+    dem_avg[dem_avg<0]=0
     dem_avg[demmap<=0]=0
     demmap[demmap==-32768]=np.nan
 
@@ -89,44 +107,61 @@ def lapse_rate(Dir,temperature_map, DEMmap):
 
     return T
 
-def adjust_P(Dir, pressure_map, DEMmap):
+def adjust_P(Dir, pressure_map, DEMmap, Terrain = None):
     """
     This function downscales the GLDAS air pressure map by using the DEM map
 
     Keyword arguments:
     pressure_map -- 'C:/' path to the pressure map
     DEMmap -- 'C:/' path to the DEM map
+    Terrain -- dictionary with the static terrain arrays (see TerrainETref)
     """
 
-    # calculate average latitudes
-    destDEMave = RC.reproject_dataset_example(DEMmap, pressure_map, method = 4)
-    DEM_ave_out_name = os.path.join(Dir, 'HydroSHED', 'DEM','DEM_ave.tif')
-    geo_out, proj, size_X, size_Y = RC.Open_array_info(pressure_map)
-    DEM_ave_data = destDEMave.GetRasterBand(1).ReadAsArray()
-    DC.Save_as_tiff(DEM_ave_out_name, DEM_ave_data, geo_out, proj)
+    if Terrain is not None:
+        dem_avg = Terrain['dem_avg']
+    else:
+        # calculate average latitudes (in memory)
+        destDEMave = RC.reproject_dataset_example(DEMmap, pressure_map, method = 4)
 
-    # open maps as numpy arrays
-    dest = RC.reproject_dataset_example(DEM_ave_out_name, DEMmap, method = 2)
-    dem_avg=dest.GetRasterBand(1).ReadAsArray()
-    dest = None
+        # open maps as numpy arrays
+        dest = RC.reproject_dataset_example(destDEMave, DEMmap, method = 2)
+        dem_avg=dest.GetRasterBand(1).ReadAsArray()
+        dest = None
+        destDEMave = None
 
     # open maps as numpy arrays
     dest = RC.reproject_dataset_example(pressure_map, DEMmap, method = 2)
     P=dest.GetRasterBand(1).ReadAsArray()
     dest = None
 
-    demmap = RC.Open_tiff_array(DEMmap)
+    if Terrain is not None:
+        demmap = Terrain['dem']
+    else:
+        demmap = RC.Open_tiff_array(DEMmap)
+
+    return adjust_P_array(P, dem_avg, demmap)
+
+def adjust_P_array(P, dem_avg, demmap):
+    """
+    This function applies the altitude correction on an air pressure array,
+    that can also be a stack of days [days, y, x]
+
+    Keyword arguments:
+    P -- numpy array with the air pressure on the DEM grid
+    dem_avg -- numpy array with the DEM averaged over the pressure pixels
+    demmap -- numpy array with the DEM
+    """
+    dem_avg = np.array(dem_avg)
+    demmap = np.array(demmap)
     dem_avg[demmap<=0]=0
     demmap[demmap==-32768]=np.nan
 
     # calculate second part
     P = P + (101.3*((293-0.0065*(demmap-dem_avg))/293)**5.26 - 101.3)
 
-    os.remove(DEM_ave_out_name)
-
     return P
 
-def slope_correct(down_short_hor, pressure, ea, DEMmap, DOY):
+def slope_correct(down_short_hor, pressure, ea, DEMmap, DOY, Terrain = None):
     """
     This function downscales the CFSR solar radiation by using the DEM map
     The Slope correction is based on Allen et al. (2006)
@@ -138,23 +173,50 @@ def slope_correct(down_short_hor, pressure, ea, DEMmap, DOY):
     ea -- numpy array with the actual vapour pressure
     DEMmap -- 'C:/' path to the DEM map
     DOY -- day of the year
+    Terrain -- dictionary with the static terrain arrays (see TerrainETref)
     """
 
-    # Get Geo Info
-    GeoT, Projection, xsize, ysize = RC.Open_array_info(DEMmap)
+    if Terrain is not None:
+
+        # apply the slope correction with the stored radiation of this day of the year
+        Ra_hor, Ra_slp, sinb, sinb_hor = Radiation_DOY(Terrain, DOY)
+        slope = Terrain['slope']
+        fi = 0.75 + 0.25*np.cos(slope) - (0.5*slope/np.pi)
+
+    else:
+
+        # Get Geo Info
+        GeoT, Projection, xsize, ysize = RC.Open_array_info(DEMmap)
 
-    minx = GeoT[0]
-    miny = GeoT[3] + xsize*GeoT[4] + ysize*GeoT[5]
+        minx = GeoT[0]
+        miny = GeoT[3] + xsize*GeoT[4] + ysize*GeoT[5]
 
-    x = np.flipud(np.arange(xsize)*GeoT[1] + minx + GeoT[1]/2)
-    y = np.flipud(np.arange(ysize)*-GeoT[5] + miny + -GeoT[5]/2)
+        x = np.flipud(np.arange(xsize)*GeoT[1] + minx + GeoT[1]/2)
+        y = np.flipud(np.arange(ysize)*-GeoT[5] + miny + -GeoT[5]/2)
 
-    # Calculate Extraterrestrial Solar Radiation [W m-2]
-    demmap = RC.Open_tiff_array(DEMmap)
-    demmap[demmap<0]=0
+        # Calculate Extraterrestrial Solar Radiation [W m-2]
+        demmap = RC.Open_tiff_array(DEMmap)
+        demmap[demmap<0]=0
 
-	# apply the slope correction
-    Ra_hor, Ra_slp, sinb, sinb_hor, fi, slope, ID = SlopeInfluence(demmap,y,x,DOY)
+        # apply the slope correction
+        Ra_hor, Ra_slp, sinb, sinb_hor, fi, slope, ID = SlopeInfluence(demmap,y,x,DOY)
+
+    return slope_correct_array(down_short_hor, pressure, ea, Ra_hor, Ra_slp, sinb, sinb_hor, fi, slope)
+
+def slope_correct_array(down_short_hor, pressure, ea, Ra_hor, Ra_slp, sinb, sinb_hor, fi, slope):
+    """
+    This function applies the slope correction of Allen et al. (2006) on the
+    horizontal shortwave radiation, that can also be a stack of days [days, y, x]
+    with the radiation terms stacked in the same way
+
+    Keyword arguments:
+    down_short_hor -- numpy array with the horizontal downwards shortwave radiation
+    pressure -- numpy array with the air pressure
+    ea -- numpy array with the actual vapour pressure
+    Ra_hor, Ra_slp, sinb, sinb_hor -- numpy arrays with the extraterrestrial radiation terms
+    fi -- numpy array with the sky view factor
+    slope -- numpy array with the slope [radians]
+    """
 
     # Calculate atmospheric transmissivity
     Rs_hor = down_short_hor
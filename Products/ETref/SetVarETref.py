@@ -8,13 +8,16 @@ Module: Products/ETref
 '''
 # import general python modules
 import os
+import calendar
+import numpy as np
 import pandas as pd
 from joblib import Parallel, delayed
 
 # import WA+ modules
 from watools.General import raster_conversions as RC
 from watools.General import data_conversions as DC
-from watools.Products.ETref.CalcETref import calc_ETref
+from watools.Products.ETref.CalcETref import calc_ETref, calc_ETref_stack
+from watools.Products.ETref.TerrainETref import Prepare_Terrain
 
 
 def SetVariables(Dir, Startdate, Enddate, latlim, lonlim, pixel_size, cores, LANDSAF, Waitbar):
@@ -45,8 +48,11 @@ def SetVariables(Dir, Startdate, Enddate, latlim, lonlim, pixel_size, cores, LAN
         amount = 0
         Waitbar.printWaitBar(amount, total_amount, prefix = 'Progress:', suffix = 'Complete', length = 50)
 
+    # Reshape the DEM and calculate the static terrain fields once before the days are processed
+    DEMmap_str, Terrain = Prepare_DEM(Dir, pixel_size, Dates[0])
+
     # Pass variables to parallel function and run
-    args = [Dir, lonlim, latlim, pixel_size, LANDSAF]
+    args = [Dir, lonlim, latlim, DEMmap_str, LANDSAF, Terrain]
     if not cores:
         for Date in Dates:
             ETref(Date, args)
@@ -69,9 +75,142 @@ def ETref(Date, args):
 	"""
 
 	# unpack the arguments
-    [Dir, lonlim, latlim, pixel_size, LANDSAF] = args
+    [Dir, lonlim, latlim, DEMmap_str, LANDSAF, Terrain] = args
 
     # Set the paths
+    [tmin_str, tmax_str, humid_str, press_str, wind_str, input1_str, input2_str, input3_str] = Input_Files(Dir, Date, LANDSAF)
+
+   # The day of year
+    DOY=Date.dayofyear
+
+    # Calc ETref
+    ETref = calc_ETref(Dir, tmin_str, tmax_str, humid_str, press_str, wind_str, input1_str, input2_str, input3_str, DEMmap_str, DOY, Terrain)
+
+    # Make directory for the MODIS ET data
+    output_folder=os.path.join(Dir,'ETref','Daily')
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+
+    # Create the output names
+    NameETref='ETref_mm-day-1_daily_'+Date.strftime('%Y.%m.%d') + '.tif'
+    NameEnd=os.path.join(output_folder,NameETref)
+
+    # Collect geotiff information
+    geo_out, proj, size_X, size_Y = RC.Open_array_info(DEMmap_str)
+
+    # Create daily ETref tiff files
+    DC.Save_as_tiff(name=NameEnd, data=ETref, geo=geo_out, projection=proj)
+
+def SetVariablesMonthly(Dir, Startdate, Enddate, latlim, lonlim, pixel_size, cores, LANDSAF, Waitbar, batch_days = 8, Save_Daily = 1):
+    """
+    This function calculates the monthly ETref month by month. The days of a
+    month are calculated in blocks of batch_days days with the vectorised
+    calc_ETref_stack and every block is directly added to a running monthly
+    sum, the daily tiff files are only saved if Save_Daily is 1. The months
+    are calculated in parallel if cores is defined.
+
+    Keyword arguments:
+    Dir -- 'C:/file/to/path/'
+    Startdate -- 'yyyy-mm-dd'
+    Enddate -- 'yyyy-mm-dd'
+    latlim -- [ymin, ymax] (values must be between -60 and 60)
+    lonlim -- [xmin, xmax] (values must be between -180 and 180)
+    pixel_size -- The output pixel size
+    cores -- The number of cores used to run the routine.
+             It can be 'False' to avoid using parallel computing
+			routines.
+    LANDSAF -- if LANDSAF data must be used it is 1
+    Waitbar -- 1 (Default) will print the waitbar
+    batch_days -- amount of days that are calculated at once
+    Save_Daily -- 1 (Default) also saves the daily ETref tiff files
+    """
+    # An array of monthly dates which will be calculated
+    Dates = pd.date_range(Startdate,Enddate,freq = 'MS')
+
+    # Create Waitbar
+    if Waitbar == 1:
+        import watools.Functions.Start.WaitbarConsole as WaitbarConsole
+        total_amount = len(Dates)
+        amount = 0
+        WaitbarConsole.printWaitBar(amount, total_amount, prefix = 'Progress:', suffix = 'Complete', length = 50)
+
+    # Reshape the DEM and calculate the static terrain fields once before the months are processed
+    DEMmap_str, Terrain = Prepare_DEM(Dir, pixel_size, Dates[0])
+
+    # Pass variables to parallel function and run
+    args = [Dir, DEMmap_str, LANDSAF, Terrain, batch_days, Save_Daily]
+    if not cores:
+        for Date in Dates:
+            ETref_Month(Date, args)
+            if Waitbar == 1:
+                amount += 1
+                WaitbarConsole.printWaitBar(amount, total_amount, prefix = 'Progress:', suffix = 'Complete', length = 50)
+        results = True
+    else:
+        results = Parallel(n_jobs=cores)(delayed(ETref_Month)(Date, args)
+                                         for Date in Dates)
+    return results
+
+def ETref_Month(Date, args):
+    """
+    This function calculates the daily ETref of one month in blocks of days,
+    sums them to the monthly ETref and saves the monthly (and daily) ETref tiff files
+
+    Keyword arguments:
+    Date -- panda timestamp of the first day of the month
+    args -- includes all the parameters that are needed for the ETref
+    """
+    # unpack the arguments
+    [Dir, DEMmap_str, LANDSAF, Terrain, batch_days, Save_Daily] = args
+
+    # Collect geotiff information
+    geo_out, proj, size_X, size_Y = RC.Open_array_info(DEMmap_str)
+
+    # Make directories for the daily and monthly ETref
+    output_folder=os.path.join(Dir,'ETref','Daily')
+    if Save_Daily == 1 and not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    output_folder_month=os.path.join(Dir,'ETref','Monthly')
+    if not os.path.exists(output_folder_month):
+        os.makedirs(output_folder_month)
+
+    Mday=calendar.monthrange(Date.year,Date.month)[1]
+    Days=pd.date_range(Date,Date+pd.Timedelta(days=Mday-1),freq='D')
+    dataMonth=np.zeros([size_Y,size_X])
+    Plans = dict()
+
+    for i in range(0, len(Days), batch_days):
+        Days_block = Days[i:i+batch_days]
+
+        # Calc ETref of the whole block
+        Input_Files_Days = [Input_Files(Dir, Day, LANDSAF) for Day in Days_block]
+        ETref_block, Plans = calc_ETref_stack(Input_Files_Days, [Day.dayofyear for Day in Days_block], DEMmap_str, Terrain, Plans)
+
+        for Day, ETref_day in zip(Days_block, ETref_block):
+
+            # Create daily ETref tiff files
+            if Save_Daily == 1:
+                NameETref='ETref_mm-day-1_daily_'+Day.strftime('%Y.%m.%d') + '.tif'
+                DC.Save_as_tiff(name=os.path.join(output_folder,NameETref), data=ETref_day, geo=geo_out, projection=proj)
+
+            # Add the day to the running monthly sum, with the precision of the daily tiff files
+            Dval = ETref_day.astype(np.float32)
+            Dval[Dval<0]=0
+            dataMonth=dataMonth+Dval
+
+    # Create the monthly ETref tiff file
+    DirMonth=os.path.join(output_folder_month,'ETref_mm-month-1_monthly_'+Date.strftime('%Y.%m.%d') + '.tif')
+    DC.Save_as_tiff(DirMonth,dataMonth, geo_out, proj)
+
+def Input_Files(Dir, Date, LANDSAF):
+    """
+    This function returns the paths of the GLDAS and CFSR/LANDSAF input files of one day
+
+    Keyword arguments:
+    Dir -- 'C:/file/to/path/'
+    Date -- panda timestamp
+    LANDSAF -- if LANDSAF data must be used it is 1
+    """
     nameTmin='Tair-min_GLDAS-NOAH_C_daily_' + Date.strftime('%Y.%m.%d') + ".tif"
     tmin_str=os.path.join(Dir,'Weather_Data','Model','GLDAS','daily','tair_f_inst','min',nameTmin )
 
@@ -119,10 +258,22 @@ def ETref(Date, args):
             nameUpLong='ULWR_CFSRv2_W-m2_' + Date.strftime('%Y.%m.%d') + ".tif"
             input3_str=os.path.join(Dir,'Radiation','CFSRv2',nameUpLong)
 
-   # The day of year
-    DOY=Date.dayofyear
+    return([tmin_str, tmax_str, humid_str, press_str, wind_str, input1_str, input2_str, input3_str])
+
+def Prepare_DEM(Dir, pixel_size, Date):
+    """
+    This function reshapes the DEM to the output pixel size (if needed) and
+    prepares the static terrain fields, this is done once before the days are processed
 
-    # Load DEM
+    Keyword arguments:
+    Dir -- 'C:/file/to/path/'
+    pixel_size -- The output pixel size
+    Date -- panda timestamp of a day of which the GLDAS data is available
+
+    Returns:
+    DEMmap_str -- path to the DEM that defines the output grid
+    Terrain -- dictionary with the static terrain arrays
+    """
     if not pixel_size:
         DEMmap_str=os.path.join(Dir,'HydroSHED','DEM','DEM_HydroShed_m_3s.tif')
     else:
@@ -132,25 +283,8 @@ def ETref(Date, args):
         DEM_data = dest.GetRasterBand(1).ReadAsArray()
         geo_dem = [ulx, pixel_size, 0.0, uly, 0.0, - pixel_size]
         DC.Save_as_tiff(name=DEMmap_str, data=DEM_data, geo=geo_dem, projection='4326')
+    nameTmin='Tair-min_GLDAS-NOAH_C_daily_' + Date.strftime('%Y.%m.%d') + ".tif"
+    tmin_str=os.path.join(Dir,'Weather_Data','Model','GLDAS','daily','tair_f_inst','min',nameTmin )
+    Terrain = Prepare_Terrain(Dir, DEMmap_str, tmin_str)
 
-    # Calc ETref
-    ETref = calc_ETref(Dir, tmin_str, tmax_str, humid_str, press_str, wind_str, input1_str, input2_str, input3_str, DEMmap_str, DOY)
-
-    # Make directory for the MODIS ET data
-    output_folder=os.path.join(Dir,'ETref','Daily')
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
-
-    # Create the output names
-    NameETref='ETref_mm-day-1_daily_'+Date.strftime('%Y.%m.%d') + '.tif'
-    NameEnd=os.path.join(output_folder,NameETref)
-
-    # Collect geotiff information
-    geo_out, proj, size_X, size_Y = RC.Open_array_info(DEMmap_str)
-
-    # Create daily ETref tiff files
-    DC.Save_as_tiff(name=NameEnd, data=ETref, geo=geo_out, projection=proj)
-
-
-
-
+    return(DEMmap_str, Terrain)
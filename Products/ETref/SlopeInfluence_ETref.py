@@ -32,9 +32,21 @@ def SlopeInfluence(DEMmap,latitude,longitude,day):
     # Be carefull with high latitudes (>66, polar circle)! Calculations for regions without sunset
     # (all day sun) are not calculated correctly.
     
-    # Solar constant
-    G = 1367.0
-    
+    lat, slope, slopedir = SlopeTerrain(DEMmap,latitude,longitude)
+
+    return(SlopeRadiation(lat,slope,slopedir,day))
+
+def SlopeTerrain(DEMmap,latitude,longitude):
+
+    '''
+    This function calculates the latitude grid, slope and slope direction that are
+    needed for the slope correction, these only depend on the DEM
+
+    DEMmap -- numpy array with the DEM
+    latitude -- numpy array with the latitude
+    longitude -- numpy array with the longitude
+    '''
+
     # If lat/lon are not a matrix but a vector create matrixes
     if not latitude.shape == longitude.shape:
         latitude = np.tile(latitude.reshape(len(latitude),1),[1,len(longitude)])
@@ -69,13 +81,6 @@ def SlopeInfluence(DEMmap,latitude,longitude,day):
     # Calculate slope
     slope = np.arctan((np.abs(dy_lat) + np.abs(dy_lon)) / np.sqrt(dlon**2+dlat**2))
     
-    # declination of earth
-    delta = np.arcsin(np.sin(23.45/360*2*np.pi)*np.sin((360.0/365.0)*(day-81)/360*2*np.pi))
-    # EQ 2
-    D2 = 1 / (1 + 0.033* np.cos(day/365*2*np.pi))
-    
-    constant =  G / D2 / (2*np.pi) 
-    
     # Slope direction
     with np.errstate(divide='ignore'):
         slopedir = np.arctan(dy_lon/dy_lat) 
@@ -87,6 +92,30 @@ def SlopeInfluence(DEMmap,latitude,longitude,day):
         # Correction ip dy_lat > 0
         slopedir[np.logical_and(dy_lat > 0, dy_lon < 0)] = np.pi + slopedir[np.logical_and(dy_lat > 0, dy_lon < 0)]
         slopedir[np.logical_and(dy_lat > 0, dy_lon >= 0)] = -np.pi + slopedir[np.logical_and(dy_lat > 0, dy_lon >= 0)]
+
+    return(lat, slope, slopedir)
+
+def SlopeRadiation(lat,slope,slopedir,day):
+
+    '''
+    This function calculates the horizontal and sloping extraterrestrial radiation
+    for one day by using the output of SlopeTerrain
+
+    lat -- numpy array with the latitude [radians]
+    slope -- numpy array with the slope [radians]
+    slopedir -- numpy array with the slope direction [radians]
+    day -- Day of the year
+    '''
+
+    # Solar constant
+    G = 1367.0
+
+    # declination of earth
+    delta = np.arcsin(np.sin(23.45/360*2*np.pi)*np.sin((360.0/365.0)*(day-81)/360*2*np.pi))
+    # EQ 2
+    D2 = 1 / (1 + 0.033* np.cos(day/365*2*np.pi))
+    
+    constant =  G / D2 / (2*np.pi) 
     
     # Now calculate the expected clear sky radiance day by day for:
     # - A horizontal surface
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+'''
+Authors: Tim Hessels
+         UNESCO-IHE 2016
+Contact: t.hessels@unesco-ihe.org
+Repository: https://github.com/wateraccounting/wa
+Module: Products/ETref
+'''
+# import general python modules
+import os
+import hashlib
+import tempfile
+import numpy as np
+
+# import WA+ modules
+from watools.General import raster_conversions as RC
+from watools.Products.ETref.SlopeInfluence_ETref import SlopeTerrain, SlopeRadiation
+
+def Prepare_Terrain(Dir, DEMmap_str, example_str):
+    """
+    This function calculates the static terrain fields that are used by the
+    daily ETref (DEM, DEM averaged over the GLDAS pixels, latitude, slope and
+    slope direction) and stores them in the HydroSHED folder. If the fields
+    are already stored for the same DEM and GLDAS grid they are only loaded.
+
+    Keyword arguments:
+    Dir -- 'C:/file/to/path/'
+    DEMmap_str -- 'C:/' path to the DEM tiff file [m] e.g. from HydroSHED
+    example_str -- 'C:/' path to a GLDAS tiff file that defines the GLDAS grid
+
+    Returns:
+    Terrain -- dictionary with the static terrain arrays and the folder of the radiation cache
+    """
+    # Create a key of the DEM and the GLDAS grid
+    geo_dem, proj_dem, size_X_dem, size_Y_dem = RC.Open_array_info(DEMmap_str)
+    geo_ex, proj_ex, size_X_ex, size_Y_ex = RC.Open_array_info(example_str)
+    demmap = RC.Open_tiff_array(DEMmap_str)
+    key = Terrain_Key(demmap, geo_dem, [geo_ex, size_X_ex, size_Y_ex])
+
+    # Load the terrain if it was already calculated
+    Terrain_filename = os.path.join(Dir, 'HydroSHED', 'DEM', 'Terrain_ETref_%s.npz' %key)
+    Radiation_folder = os.path.join(Dir, 'HydroSHED', 'DEM', 'Radiation_ETref_%s' %key)
+    if os.path.exists(Terrain_filename):
+        Terrain_file = np.load(Terrain_filename)
+        Terrain = dict((name, Terrain_file[name]) for name in Terrain_file.files)
+        Terrain_file.close()
+        Terrain['radiation_folder'] = Radiation_folder
+        return(Terrain)
+
+    # calculate average altitudes corresponding to the GLDAS resolution and reproject back
+    dest = RC.reproject_dataset_example(DEMmap_str, example_str, method = 4)
+    dest_avg = RC.reproject_dataset_example(dest, DEMmap_str, method = 2)
+    dem_avg = dest_avg.GetRasterBand(1).ReadAsArray()
+    dest = None
+    dest_avg = None
+
+    # Get the latitude and longitude of the DEM pixels
+    minx = geo_dem[0]
+    miny = geo_dem[3] + size_X_dem*geo_dem[4] + size_Y_dem*geo_dem[5]
+    x = np.flipud(np.arange(size_X_dem)*geo_dem[1] + minx + geo_dem[1]/2)
+    y = np.flipud(np.arange(size_Y_dem)*-geo_dem[5] + miny + -geo_dem[5]/2)
+
+    # Calculate the slope and slope direction
+    dem_slope = np.copy(demmap)
+    dem_slope[dem_slope<0] = 0
+    lat, slope, slopedir = SlopeTerrain(dem_slope, y, x)
+
+    Terrain = dict({'dem':demmap, 'dem_avg':dem_avg, 'lat':lat, 'slope':slope, 'slopedir':slopedir, 'key':np.array(key)})
+
+    # Save the terrain for the next runs
+    np.savez_compressed(Terrain_filename, **Terrain)
+    Terrain['radiation_folder'] = Radiation_folder
+
+    return(Terrain)
+
+def Radiation_DOY(Terrain, DOY):
+    """
+    This function returns the horizontal and sloping extraterrestrial radiation
+    of one day of the year. The grids only depend on the DEM and the day of the
+    year, so they are calculated once and stored (float32) in the radiation
+    folder of the terrain.
+
+    Keyword arguments:
+    Terrain -- dictionary with the static terrain arrays (output of Prepare_Terrain)
+    DOY -- day of the year
+
+    Returns:
+    Ra_hor, Ra_slp, sinb, sinb_hor -- numpy arrays with the radiation of that day
+    """
+    Radiation_filename = os.path.join(Terrain['radiation_folder'], 'Radiation_DOY_%03d.npz' %DOY)
+
+    # Load the radiation if it was already calculated
+    if os.path.exists(Radiation_filename):
+        Radiation_file = np.load(Radiation_filename)
+        Radiation = [Radiation_file[name].astype(np.float64) for name in ['Ra_hor', 'Ra_slp', 'sinb', 'sinb_hor']]
+        Radiation_file.close()
+        return(Radiation)
+
+    Ra_hor, Ra_slp, sinb, sinb_hor, fi, slope, ID = SlopeRadiation(Terrain['lat'], Terrain['slope'], Terrain['slopedir'], DOY)
+    Radiation = [np.float32(Ra_hor), np.float32(Ra_slp), np.float32(sinb), np.float32(sinb_hor)]
+
+    # Save the radiation under a temporary name first, so parallel days never read a half written file
+    if not os.path.exists(Terrain['radiation_folder']):
+        try:
+            os.makedirs(Terrain['radiation_folder'])
+        except OSError:
+            pass
+    handle, Temp_filename = tempfile.mkstemp(suffix = '.npz', dir = Terrain['radiation_folder'])
+    os.close(handle)
+    np.savez_compressed(Temp_filename, Ra_hor = Radiation[0], Ra_slp = Radiation[1], sinb = Radiation[2], sinb_hor = Radiation[3])
+    try:
+        os.rename(Temp_filename, Radiation_filename)
+    except OSError:
+        os.remove(Temp_filename)
+
+    return([Radiation_array.astype(np.float64) for Radiation_array in Radiation])
+
+def Terrain_Key(demmap, geo_dem, grid_info):
+    """
+    This function creates a key of the DEM values, the DEM grid and the
+    information of another grid
+
+    Keyword arguments:
+    demmap -- numpy array with the DEM
+    geo_dem -- geotransform of the DEM
+    grid_info -- list with extra grid information (e.g. geotransform and size)
+    """
+    md5 = hashlib.md5()
+    md5.update(np.ascontiguousarray(demmap).tostring())
+    md5.update(str([list(geo_dem), demmap.shape, grid_info]).encode('utf-8'))
+    return(md5.hexdigest()[:16])
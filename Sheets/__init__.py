@@ -36,6 +36,9 @@ create_sheet6(basin='Helmand', period='2007-2011',
 create_sheet7(basin='Sample data', period='2006-2016', units='Mm3/yr',
               data=r'C:\Sheets\csv\Sample_sheet7.csv',
               output=r'C:\Sheets\sheet_7.jpg')
+create_sheets(create_sheet2, [dict(basin='Nile Basin', period='2010', units='km3/year',
+                                   data=r'C:\Sheets\csv\Sample_sheet2.csv',
+                                   output=r'C:\Sheets\sheet_2.pdf')], cores=4)
 """
 
 
@@ -45,7 +48,8 @@ from .sheet3 import create_sheet3
 from .sheet4 import create_sheet4
 from .sheet6 import create_sheet6
 from .sheet7 import create_sheet7
+from .render import create_sheets
 
-__all__ = ['create_sheet1', 'create_sheet3', 'create_sheet2', 'create_sheet4', 'create_sheet6', 'create_sheet7']
+__all__ = ['create_sheet1', 'create_sheet3', 'create_sheet2', 'create_sheet4', 'create_sheet6', 'create_sheet7', 'create_sheets']
 
 __version__ = '0.1'
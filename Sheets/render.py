@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Tim Hessels
+         UNESCO-IHE 2017
+Contact: t.hessels@unesco-ihe.org
+Repository: https://github.com/wateraccounting/wa
+Module: Sheets/render
+"""
+
+import os
+import copy
+import subprocess
+import xml.etree.ElementTree as ET
+
+# Parsed svg templates, every process parses a template only once
+templates = dict()
+
+def open_template(svg_template_path):
+    """
+    Returns a copy of a svg template that can be filled, together with an
+    index of all the elements with an id. The template itself is only parsed
+    once.
+
+    Keyword arguments:
+    svg_template_path -- The path of the svg file of the sheet.
+    """
+    svg_template_path = os.path.abspath(svg_template_path)
+    key = (svg_template_path, os.path.getmtime(svg_template_path))
+    if key not in templates:
+        templates[key] = ET.parse(svg_template_path).getroot()
+
+    # Copy the template and index the ids (the first element wins, like findall)
+    root = copy.deepcopy(templates[key])
+    ids = dict()
+    for element in root.iter():
+        if element is not root and 'id' in element.attrib:
+            ids.setdefault(element.attrib['id'], element)
+
+    return ET.ElementTree(root), ids
+
+def create_sheets(create_sheet, sheets, cores=1):
+    """
+    Create many sheets of the same type (e.g. all the months and years of a
+    simulation) in parallel.
+
+    Keyword arguments:
+    create_sheet -- The function that creates one sheet (e.g. create_sheet2)
+    sheets -- A list with for every sheet a dictionary with the keyword
+              arguments of create_sheet
+    cores -- The number of cores used to create the sheets
+    """
+    from joblib import Parallel, delayed
+
+    if cores == 1:
+        outputs = [create_sheet(**sheet) for sheet in sheets]
+    else:
+        outputs = Parallel(n_jobs=cores)(delayed(create_sheet)(**sheet) for sheet in sheets)
+
+    return outputs
+
+def export_sheet(tree, output, backend=None, dpi=300):
+    """
+    Export the filled svg tree of a sheet to a pdf or png file. By default the
+    svg is rendered in memory with cairosvg, inkscape is used if cairosvg is
+    not installed.
+
+    Keyword arguments:
+    tree -- ElementTree of the filled svg template
+    output -- The output path of the pdf or png file for the sheet.
+    backend -- 'cairosvg', 'inkscape' or None (default) to use cairosvg if
+               it is available
+    dpi -- Resolution of png outputs
+    """
+    ET.register_namespace("", "http://www.w3.org/2000/svg")
+
+    if backend is None:
+        try:
+            import cairosvg
+            backend = 'cairosvg'
+        except ImportError:
+            backend = 'inkscape'
+
+    if backend == 'cairosvg':
+        export_cairosvg(tree, output, dpi)
+    else:
+        export_inkscape(tree, output, dpi)
+
+    return output
+
+def export_cairosvg(tree, output, dpi=300):
+    """
+    Render the svg tree in memory with cairosvg
+
+    Keyword arguments:
+    tree -- ElementTree of the filled svg template
+    output -- The output path of the pdf or png file for the sheet.
+    dpi -- Resolution of png outputs
+    """
+    import cairosvg
+
+    svg_string = ET.tostring(tree.getroot(), encoding='UTF-8', method='xml')
+
+    if output.lower().endswith('.png'):
+        cairosvg.svg2png(bytestring=svg_string, write_to=output, scale=dpi/96.)
+    else:
+        cairosvg.svg2pdf(bytestring=svg_string, write_to=output)
+
+    return output
+
+def export_inkscape(tree, output, dpi=300):
+    """
+    Render the svg tree with the inkscape command line, the svg is written to
+    a temporary file next to the output.
+
+    Keyword arguments:
+    tree -- ElementTree of the filled svg template
+    output -- The output path of the pdf or png file for the sheet.
+    dpi -- Resolution of png outputs
+    """
+    # Get the paths based on the environment variable
+    if os.name == 'posix':
+        Path_Inkscape = 'inkscape'
+
+    else:
+        WA_env_paths = os.environ["WA_PATHS"].split(';')
+        Inkscape_env_path = WA_env_paths[1]
+        Path_Inkscape = os.path.join(Inkscape_env_path,'inkscape.exe')
+
+    if output.lower().endswith('.png'):
+        export_option = '--export-png='
+    else:
+        export_option = '--export-pdf='
+
+    # Export svg, inkscape is finished when the call returns
+    tempout_path = os.path.splitext(output)[0] + '_temporary.svg'
+    tree.write(tempout_path)
+    subprocess.call([Path_Inkscape, tempout_path, export_option + output, '-d', '%d' % dpi])
+    os.remove(tempout_path)
+
+    return output
@@ -9,10 +9,11 @@ Module: Sheets/sheet2
 
 import os
 import pandas as pd
-import subprocess
-import time
 import xml.etree.ElementTree as ET
 
+from watools.Sheets.table import SheetTable
+from watools.Sheets.render import open_template, export_sheet
+
 
 def create_sheet2(basin, period, units, data, output, template=False,
                   tolerance=0.2):
@@ -41,427 +42,419 @@ def create_sheet2(basin, period, units, data, output, template=False,
 
     # Read table
 
-    df = pd.read_csv(data, sep=';')
-
-    # Data frames
-
-    df_Pr = df.loc[df.LAND_USE == "PROTECTED"]
-    df_Ut = df.loc[df.LAND_USE == "UTILIZED"]
-    df_Mo = df.loc[df.LAND_USE == "MODIFIED"]
-    df_Mc = df.loc[df.LAND_USE == "MANAGED CONVENTIONAL"]
-    df_Mn = df.loc[df.LAND_USE == "MANAGED NON_CONVENTIONAL"]
+    table = SheetTable(data)
 
     # Column 1: Transpiration
 
-    c1r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].TRANSPIRATION)
-    c1r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].TRANSPIRATION)
-    c1r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].TRANSPIRATION)
-    c1r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].TRANSPIRATION)
-    c1r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].TRANSPIRATION)
-    c1r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].TRANSPIRATION)
-    c1r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].TRANSPIRATION)
+    c1r1_t1 = table.value('TRANSPIRATION', LAND_USE="PROTECTED", CLASS="Forest")
+    c1r2_t1 = table.value('TRANSPIRATION', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c1r3_t1 = table.value('TRANSPIRATION', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c1r4_t1 = table.value('TRANSPIRATION', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c1r5_t1 = table.value('TRANSPIRATION', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c1r6_t1 = table.value('TRANSPIRATION', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c1r7_t1 = table.value('TRANSPIRATION', LAND_USE="PROTECTED", CLASS="Others")
     c1_t1_total = c1r1_t1 + c1r2_t1 + c1r3_t1 + c1r4_t1 + c1r5_t1 + \
         c1r6_t1 + c1r7_t1
 
-    c1r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].TRANSPIRATION)
-    c1r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].TRANSPIRATION)
-    c1r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].TRANSPIRATION)
-    c1r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].TRANSPIRATION)
-    c1r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].TRANSPIRATION)
-    c1r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].TRANSPIRATION)
+    c1r1_t2 = table.value('TRANSPIRATION', LAND_USE="UTILIZED", CLASS="Forest")
+    c1r2_t2 = table.value('TRANSPIRATION', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c1r3_t2 = table.value('TRANSPIRATION', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c1r4_t2 = table.value('TRANSPIRATION', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c1r5_t2 = table.value('TRANSPIRATION', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c1r6_t2 = table.value('TRANSPIRATION', LAND_USE="UTILIZED", CLASS="Others")
     c1_t2_total = c1r1_t2 + c1r2_t2 + c1r3_t2 + c1r4_t2 + c1r5_t2 + c1r6_t2
 
-    c1r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].TRANSPIRATION)
-    c1r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].TRANSPIRATION)
-    c1r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].TRANSPIRATION)
-    c1r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].TRANSPIRATION)
+    c1r1_t3 = table.value('TRANSPIRATION', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c1r2_t3 = table.value('TRANSPIRATION', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c1r3_t3 = table.value('TRANSPIRATION', LAND_USE="MODIFIED", CLASS="Settlements")
+    c1r4_t3 = table.value('TRANSPIRATION', LAND_USE="MODIFIED", CLASS="Others")
     c1_t3_total = c1r1_t3 + c1r2_t3 + c1r3_t3 + c1r4_t3
 
-    c1r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].TRANSPIRATION)
-    c1r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].TRANSPIRATION)
-    c1r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].TRANSPIRATION)
-    c1r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].TRANSPIRATION)
-    c1r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].TRANSPIRATION)
+    c1r1_t4 = table.value('TRANSPIRATION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c1r2_t4 = table.value('TRANSPIRATION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c1r3_t4 = table.value('TRANSPIRATION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c1r4_t4 = table.value('TRANSPIRATION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c1r5_t4 = table.value('TRANSPIRATION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c1_t4_total = c1r1_t4 + c1r2_t4 + c1r3_t4 + c1r4_t4 + c1r5_t4
 
-    c1r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].TRANSPIRATION)
-    c1r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].TRANSPIRATION)
-    c1r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].TRANSPIRATION)
-    c1r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].TRANSPIRATION)
-    c1r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].TRANSPIRATION)
-    c1r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].TRANSPIRATION)
+    c1r1_t5 = table.value('TRANSPIRATION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c1r2_t5 = table.value('TRANSPIRATION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c1r3_t5 = table.value('TRANSPIRATION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c1r4_t5 = table.value('TRANSPIRATION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c1r5_t5 = table.value('TRANSPIRATION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c1r6_t5 = table.value('TRANSPIRATION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c1_t5_total = c1r1_t5 + c1r2_t5 + c1r3_t5 + c1r4_t5 + c1r5_t5 + c1r6_t5
 
     # Column 2: Water
 
-    c2r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].WATER)
-    c2r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].WATER)
-    c2r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].WATER)
-    c2r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].WATER)
-    c2r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].WATER)
-    c2r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].WATER)
-    c2r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].WATER)
+    c2r1_t1 = table.value('WATER', LAND_USE="PROTECTED", CLASS="Forest")
+    c2r2_t1 = table.value('WATER', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c2r3_t1 = table.value('WATER', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c2r4_t1 = table.value('WATER', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c2r5_t1 = table.value('WATER', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c2r6_t1 = table.value('WATER', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c2r7_t1 = table.value('WATER', LAND_USE="PROTECTED", CLASS="Others")
     c2_t1_total = c2r1_t1 + c2r2_t1 + c2r3_t1 + c2r4_t1 + c2r5_t1 + \
         c2r6_t1 + c2r7_t1
 
-    c2r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].WATER)
-    c2r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].WATER)
-    c2r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].WATER)
-    c2r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].WATER)
-    c2r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].WATER)
-    c2r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].WATER)
+    c2r1_t2 = table.value('WATER', LAND_USE="UTILIZED", CLASS="Forest")
+    c2r2_t2 = table.value('WATER', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c2r3_t2 = table.value('WATER', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c2r4_t2 = table.value('WATER', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c2r5_t2 = table.value('WATER', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c2r6_t2 = table.value('WATER', LAND_USE="UTILIZED", CLASS="Others")
     c2_t2_total = c2r1_t2 + c2r2_t2 + c2r3_t2 + c2r4_t2 + c2r5_t2 + c2r6_t2
 
-    c2r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].WATER)
-    c2r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].WATER)
-    c2r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].WATER)
-    c2r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].WATER)
+    c2r1_t3 = table.value('WATER', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c2r2_t3 = table.value('WATER', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c2r3_t3 = table.value('WATER', LAND_USE="MODIFIED", CLASS="Settlements")
+    c2r4_t3 = table.value('WATER', LAND_USE="MODIFIED", CLASS="Others")
     c2_t3_total = c2r1_t3 + c2r2_t3 + c2r3_t3 + c2r4_t3
 
-    c2r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].WATER)
-    c2r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].WATER)
-    c2r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].WATER)
-    c2r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].WATER)
-    c2r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].WATER)
+    c2r1_t4 = table.value('WATER', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c2r2_t4 = table.value('WATER', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c2r3_t4 = table.value('WATER', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c2r4_t4 = table.value('WATER', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c2r5_t4 = table.value('WATER', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c2_t4_total = c2r1_t4 + c2r2_t4 + c2r3_t4 + c2r4_t4 + c2r5_t4
 
-    c2r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].WATER)
-    c2r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].WATER)
-    c2r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].WATER)
-    c2r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].WATER)
-    c2r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].WATER)
-    c2r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].WATER)
+    c2r1_t5 = table.value('WATER', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c2r2_t5 = table.value('WATER', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c2r3_t5 = table.value('WATER', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c2r4_t5 = table.value('WATER', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c2r5_t5 = table.value('WATER', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c2r6_t5 = table.value('WATER', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c2_t5_total = c2r1_t5 + c2r2_t5 + c2r3_t5 + c2r4_t5 + c2r5_t5 + c2r6_t5
 
     # Column 3: Soil
 
-    c3r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].SOIL)
-    c3r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].SOIL)
-    c3r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].SOIL)
-    c3r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].SOIL)
-    c3r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].SOIL)
-    c3r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].SOIL)
-    c3r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].SOIL)
+    c3r1_t1 = table.value('SOIL', LAND_USE="PROTECTED", CLASS="Forest")
+    c3r2_t1 = table.value('SOIL', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c3r3_t1 = table.value('SOIL', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c3r4_t1 = table.value('SOIL', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c3r5_t1 = table.value('SOIL', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c3r6_t1 = table.value('SOIL', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c3r7_t1 = table.value('SOIL', LAND_USE="PROTECTED", CLASS="Others")
     c3_t1_total = c3r1_t1 + c3r2_t1 + c3r3_t1 + c3r4_t1 + c3r5_t1 + \
         c3r6_t1 + c3r7_t1
 
-    c3r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].SOIL)
-    c3r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].SOIL)
-    c3r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].SOIL)
-    c3r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].SOIL)
-    c3r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].SOIL)
-    c3r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].SOIL)
+    c3r1_t2 = table.value('SOIL', LAND_USE="UTILIZED", CLASS="Forest")
+    c3r2_t2 = table.value('SOIL', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c3r3_t2 = table.value('SOIL', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c3r4_t2 = table.value('SOIL', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c3r5_t2 = table.value('SOIL', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c3r6_t2 = table.value('SOIL', LAND_USE="UTILIZED", CLASS="Others")
     c3_t2_total = c3r1_t2 + c3r2_t2 + c3r3_t2 + c3r4_t2 + c3r5_t2 + c3r6_t2
 
-    c3r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].SOIL)
-    c3r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].SOIL)
-    c3r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].SOIL)
-    c3r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].SOIL)
+    c3r1_t3 = table.value('SOIL', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c3r2_t3 = table.value('SOIL', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c3r3_t3 = table.value('SOIL', LAND_USE="MODIFIED", CLASS="Settlements")
+    c3r4_t3 = table.value('SOIL', LAND_USE="MODIFIED", CLASS="Others")
     c3_t3_total = c3r1_t3 + c3r2_t3 + c3r3_t3 + c3r4_t3
 
-    c3r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].SOIL)
-    c3r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].SOIL)
-    c3r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].SOIL)
-    c3r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].SOIL)
-    c3r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].SOIL)
+    c3r1_t4 = table.value('SOIL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c3r2_t4 = table.value('SOIL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c3r3_t4 = table.value('SOIL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c3r4_t4 = table.value('SOIL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c3r5_t4 = table.value('SOIL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c3_t4_total = c3r1_t4 + c3r2_t4 + c3r3_t4 + c3r4_t4 + c3r5_t4
 
-    c3r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].SOIL)
-    c3r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].SOIL)
-    c3r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].SOIL)
-    c3r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].SOIL)
-    c3r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].SOIL)
-    c3r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].SOIL)
+    c3r1_t5 = table.value('SOIL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c3r2_t5 = table.value('SOIL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c3r3_t5 = table.value('SOIL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c3r4_t5 = table.value('SOIL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c3r5_t5 = table.value('SOIL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c3r6_t5 = table.value('SOIL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c3_t5_total = c3r1_t5 + c3r2_t5 + c3r3_t5 + c3r4_t5 + c3r5_t5 + c3r6_t5
 
     # Column 4: INTERCEPTION
 
-    c4r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].INTERCEPTION)
-    c4r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].INTERCEPTION)
-    c4r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].INTERCEPTION)
-    c4r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].INTERCEPTION)
-    c4r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].INTERCEPTION)
-    c4r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].INTERCEPTION)
-    c4r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].INTERCEPTION)
+    c4r1_t1 = table.value('INTERCEPTION', LAND_USE="PROTECTED", CLASS="Forest")
+    c4r2_t1 = table.value('INTERCEPTION', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c4r3_t1 = table.value('INTERCEPTION', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c4r4_t1 = table.value('INTERCEPTION', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c4r5_t1 = table.value('INTERCEPTION', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c4r6_t1 = table.value('INTERCEPTION', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c4r7_t1 = table.value('INTERCEPTION', LAND_USE="PROTECTED", CLASS="Others")
     c4_t1_total = c4r1_t1 + c4r2_t1 + c4r3_t1 + c4r4_t1 + c4r5_t1 + \
         c4r6_t1 + c4r7_t1
 
-    c4r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].INTERCEPTION)
-    c4r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].INTERCEPTION)
-    c4r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].INTERCEPTION)
-    c4r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].INTERCEPTION)
-    c4r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].INTERCEPTION)
-    c4r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].INTERCEPTION)
+    c4r1_t2 = table.value('INTERCEPTION', LAND_USE="UTILIZED", CLASS="Forest")
+    c4r2_t2 = table.value('INTERCEPTION', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c4r3_t2 = table.value('INTERCEPTION', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c4r4_t2 = table.value('INTERCEPTION', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c4r5_t2 = table.value('INTERCEPTION', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c4r6_t2 = table.value('INTERCEPTION', LAND_USE="UTILIZED", CLASS="Others")
     c4_t2_total = c4r1_t2 + c4r2_t2 + c4r3_t2 + c4r4_t2 + c4r5_t2 + c4r6_t2
 
-    c4r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].INTERCEPTION)
-    c4r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].INTERCEPTION)
-    c4r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].INTERCEPTION)
-    c4r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].INTERCEPTION)
+    c4r1_t3 = table.value('INTERCEPTION', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c4r2_t3 = table.value('INTERCEPTION', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c4r3_t3 = table.value('INTERCEPTION', LAND_USE="MODIFIED", CLASS="Settlements")
+    c4r4_t3 = table.value('INTERCEPTION', LAND_USE="MODIFIED", CLASS="Others")
     c4_t3_total = c4r1_t3 + c4r2_t3 + c4r3_t3 + c4r4_t3
 
-    c4r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].INTERCEPTION)
-    c4r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].INTERCEPTION)
-    c4r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].INTERCEPTION)
-    c4r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].INTERCEPTION)
-    c4r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].INTERCEPTION)
+    c4r1_t4 = table.value('INTERCEPTION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c4r2_t4 = table.value('INTERCEPTION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c4r3_t4 = table.value('INTERCEPTION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c4r4_t4 = table.value('INTERCEPTION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c4r5_t4 = table.value('INTERCEPTION', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c4_t4_total = c4r1_t4 + c4r2_t4 + c4r3_t4 + c4r4_t4 + c4r5_t4
 
-    c4r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].INTERCEPTION)
-    c4r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].INTERCEPTION)
-    c4r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].INTERCEPTION)
-    c4r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].INTERCEPTION)
-    c4r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].INTERCEPTION)
-    c4r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].INTERCEPTION)
+    c4r1_t5 = table.value('INTERCEPTION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c4r2_t5 = table.value('INTERCEPTION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c4r3_t5 = table.value('INTERCEPTION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c4r4_t5 = table.value('INTERCEPTION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c4r5_t5 = table.value('INTERCEPTION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c4r6_t5 = table.value('INTERCEPTION', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c4_t5_total = c4r1_t5 + c4r2_t5 + c4r3_t5 + c4r4_t5 + c4r5_t5 + c4r6_t5
 
     # Column 6: AGRICULTURE
 
-    c6r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].AGRICULTURE)
-    c6r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].AGRICULTURE)
-    c6r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].AGRICULTURE)
-    c6r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].AGRICULTURE)
-    c6r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].AGRICULTURE)
-    c6r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].AGRICULTURE)
-    c6r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].AGRICULTURE)
+    c6r1_t1 = table.value('AGRICULTURE', LAND_USE="PROTECTED", CLASS="Forest")
+    c6r2_t1 = table.value('AGRICULTURE', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c6r3_t1 = table.value('AGRICULTURE', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c6r4_t1 = table.value('AGRICULTURE', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c6r5_t1 = table.value('AGRICULTURE', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c6r6_t1 = table.value('AGRICULTURE', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c6r7_t1 = table.value('AGRICULTURE', LAND_USE="PROTECTED", CLASS="Others")
     c6_t1_total = c6r1_t1 + c6r2_t1 + c6r3_t1 + c6r4_t1 + c6r5_t1 + \
         c6r6_t1 + c6r7_t1
 
-    c6r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].AGRICULTURE)
-    c6r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].AGRICULTURE)
-    c6r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].AGRICULTURE)
-    c6r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].AGRICULTURE)
-    c6r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].AGRICULTURE)
-    c6r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].AGRICULTURE)
+    c6r1_t2 = table.value('AGRICULTURE', LAND_USE="UTILIZED", CLASS="Forest")
+    c6r2_t2 = table.value('AGRICULTURE', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c6r3_t2 = table.value('AGRICULTURE', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c6r4_t2 = table.value('AGRICULTURE', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c6r5_t2 = table.value('AGRICULTURE', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c6r6_t2 = table.value('AGRICULTURE', LAND_USE="UTILIZED", CLASS="Others")
     c6_t2_total = c6r1_t2 + c6r2_t2 + c6r3_t2 + c6r4_t2 + c6r5_t2 + c6r6_t2
 
-    c6r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].AGRICULTURE)
-    c6r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].AGRICULTURE)
-    c6r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].AGRICULTURE)
-    c6r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].AGRICULTURE)
+    c6r1_t3 = table.value('AGRICULTURE', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c6r2_t3 = table.value('AGRICULTURE', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c6r3_t3 = table.value('AGRICULTURE', LAND_USE="MODIFIED", CLASS="Settlements")
+    c6r4_t3 = table.value('AGRICULTURE', LAND_USE="MODIFIED", CLASS="Others")
     c6_t3_total = c6r1_t3 + c6r2_t3 + c6r3_t3 + c6r4_t3
 
-    c6r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].AGRICULTURE)
-    c6r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].AGRICULTURE)
-    c6r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].AGRICULTURE)
-    c6r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].AGRICULTURE)
-    c6r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].AGRICULTURE)
+    c6r1_t4 = table.value('AGRICULTURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c6r2_t4 = table.value('AGRICULTURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c6r3_t4 = table.value('AGRICULTURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c6r4_t4 = table.value('AGRICULTURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c6r5_t4 = table.value('AGRICULTURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c6_t4_total = c6r1_t4 + c6r2_t4 + c6r3_t4 + c6r4_t4 + c6r5_t4
 
-    c6r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].AGRICULTURE)
-    c6r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].AGRICULTURE)
-    c6r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].AGRICULTURE)
-    c6r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].AGRICULTURE)
-    c6r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].AGRICULTURE)
-    c6r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].AGRICULTURE)
+    c6r1_t5 = table.value('AGRICULTURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c6r2_t5 = table.value('AGRICULTURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c6r3_t5 = table.value('AGRICULTURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c6r4_t5 = table.value('AGRICULTURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c6r5_t5 = table.value('AGRICULTURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c6r6_t5 = table.value('AGRICULTURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c6_t5_total = c6r1_t5 + c6r2_t5 + c6r3_t5 + c6r4_t5 + c6r5_t5 + c6r6_t5
 
     # Column 7: ENVIRONMENT
 
-    c7r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].ENVIRONMENT)
-    c7r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].ENVIRONMENT)
-    c7r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].ENVIRONMENT)
-    c7r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].ENVIRONMENT)
-    c7r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].ENVIRONMENT)
-    c7r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].ENVIRONMENT)
-    c7r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].ENVIRONMENT)
+    c7r1_t1 = table.value('ENVIRONMENT', LAND_USE="PROTECTED", CLASS="Forest")
+    c7r2_t1 = table.value('ENVIRONMENT', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c7r3_t1 = table.value('ENVIRONMENT', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c7r4_t1 = table.value('ENVIRONMENT', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c7r5_t1 = table.value('ENVIRONMENT', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c7r6_t1 = table.value('ENVIRONMENT', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c7r7_t1 = table.value('ENVIRONMENT', LAND_USE="PROTECTED", CLASS="Others")
     c7_t1_total = c7r1_t1 + c7r2_t1 + c7r3_t1 + c7r4_t1 + c7r5_t1 + \
         c7r6_t1 + c7r7_t1
 
-    c7r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].ENVIRONMENT)
-    c7r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].ENVIRONMENT)
-    c7r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].ENVIRONMENT)
-    c7r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].ENVIRONMENT)
-    c7r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].ENVIRONMENT)
-    c7r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].ENVIRONMENT)
+    c7r1_t2 = table.value('ENVIRONMENT', LAND_USE="UTILIZED", CLASS="Forest")
+    c7r2_t2 = table.value('ENVIRONMENT', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c7r3_t2 = table.value('ENVIRONMENT', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c7r4_t2 = table.value('ENVIRONMENT', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c7r5_t2 = table.value('ENVIRONMENT', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c7r6_t2 = table.value('ENVIRONMENT', LAND_USE="UTILIZED", CLASS="Others")
     c7_t2_total = c7r1_t2 + c7r2_t2 + c7r3_t2 + c7r4_t2 + c7r5_t2 + c7r6_t2
 
-    c7r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].ENVIRONMENT)
-    c7r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].ENVIRONMENT)
-    c7r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].ENVIRONMENT)
-    c7r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].ENVIRONMENT)
+    c7r1_t3 = table.value('ENVIRONMENT', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c7r2_t3 = table.value('ENVIRONMENT', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c7r3_t3 = table.value('ENVIRONMENT', LAND_USE="MODIFIED", CLASS="Settlements")
+    c7r4_t3 = table.value('ENVIRONMENT', LAND_USE="MODIFIED", CLASS="Others")
     c7_t3_total = c7r1_t3 + c7r2_t3 + c7r3_t3 + c7r4_t3
 
-    c7r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].ENVIRONMENT)
-    c7r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].ENVIRONMENT)
-    c7r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].ENVIRONMENT)
-    c7r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].ENVIRONMENT)
-    c7r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].ENVIRONMENT)
+    c7r1_t4 = table.value('ENVIRONMENT', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c7r2_t4 = table.value('ENVIRONMENT', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c7r3_t4 = table.value('ENVIRONMENT', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c7r4_t4 = table.value('ENVIRONMENT', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c7r5_t4 = table.value('ENVIRONMENT', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c7_t4_total = c7r1_t4 + c7r2_t4 + c7r3_t4 + c7r4_t4 + c7r5_t4
 
-    c7r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].ENVIRONMENT)
-    c7r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].ENVIRONMENT)
-    c7r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].ENVIRONMENT)
-    c7r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].ENVIRONMENT)
-    c7r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].ENVIRONMENT)
-    c7r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].ENVIRONMENT)
+    c7r1_t5 = table.value('ENVIRONMENT', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c7r2_t5 = table.value('ENVIRONMENT', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c7r3_t5 = table.value('ENVIRONMENT', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c7r4_t5 = table.value('ENVIRONMENT', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c7r5_t5 = table.value('ENVIRONMENT', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c7r6_t5 = table.value('ENVIRONMENT', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c7_t5_total = c7r1_t5 + c7r2_t5 + c7r3_t5 + c7r4_t5 + c7r5_t5 + c7r6_t5
 
     # Column 8: ECONOMY
 
-    c8r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].ECONOMY)
-    c8r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].ECONOMY)
-    c8r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].ECONOMY)
-    c8r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].ECONOMY)
-    c8r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].ECONOMY)
-    c8r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].ECONOMY)
-    c8r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].ECONOMY)
+    c8r1_t1 = table.value('ECONOMY', LAND_USE="PROTECTED", CLASS="Forest")
+    c8r2_t1 = table.value('ECONOMY', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c8r3_t1 = table.value('ECONOMY', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c8r4_t1 = table.value('ECONOMY', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c8r5_t1 = table.value('ECONOMY', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c8r6_t1 = table.value('ECONOMY', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c8r7_t1 = table.value('ECONOMY', LAND_USE="PROTECTED", CLASS="Others")
     c8_t1_total = c8r1_t1 + c8r2_t1 + c8r3_t1 + c8r4_t1 + c8r5_t1 + \
         c8r6_t1 + c8r7_t1
 
-    c8r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].ECONOMY)
-    c8r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].ECONOMY)
-    c8r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].ECONOMY)
-    c8r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].ECONOMY)
-    c8r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].ECONOMY)
-    c8r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].ECONOMY)
+    c8r1_t2 = table.value('ECONOMY', LAND_USE="UTILIZED", CLASS="Forest")
+    c8r2_t2 = table.value('ECONOMY', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c8r3_t2 = table.value('ECONOMY', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c8r4_t2 = table.value('ECONOMY', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c8r5_t2 = table.value('ECONOMY', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c8r6_t2 = table.value('ECONOMY', LAND_USE="UTILIZED", CLASS="Others")
     c8_t2_total = c8r1_t2 + c8r2_t2 + c8r3_t2 + c8r4_t2 + c8r5_t2 + c8r6_t2
 
-    c8r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].ECONOMY)
-    c8r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].ECONOMY)
-    c8r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].ECONOMY)
-    c8r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].ECONOMY)
+    c8r1_t3 = table.value('ECONOMY', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c8r2_t3 = table.value('ECONOMY', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c8r3_t3 = table.value('ECONOMY', LAND_USE="MODIFIED", CLASS="Settlements")
+    c8r4_t3 = table.value('ECONOMY', LAND_USE="MODIFIED", CLASS="Others")
     c8_t3_total = c8r1_t3 + c8r2_t3 + c8r3_t3 + c8r4_t3
 
-    c8r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].ECONOMY)
-    c8r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].ECONOMY)
-    c8r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].ECONOMY)
-    c8r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].ECONOMY)
-    c8r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].ECONOMY)
+    c8r1_t4 = table.value('ECONOMY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c8r2_t4 = table.value('ECONOMY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c8r3_t4 = table.value('ECONOMY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c8r4_t4 = table.value('ECONOMY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c8r5_t4 = table.value('ECONOMY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c8_t4_total = c8r1_t4 + c8r2_t4 + c8r3_t4 + c8r4_t4 + c8r5_t4
 
-    c8r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].ECONOMY)
-    c8r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].ECONOMY)
-    c8r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].ECONOMY)
-    c8r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].ECONOMY)
-    c8r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].ECONOMY)
-    c8r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].ECONOMY)
+    c8r1_t5 = table.value('ECONOMY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c8r2_t5 = table.value('ECONOMY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c8r3_t5 = table.value('ECONOMY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c8r4_t5 = table.value('ECONOMY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c8r5_t5 = table.value('ECONOMY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c8r6_t5 = table.value('ECONOMY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c8_t5_total = c8r1_t5 + c8r2_t5 + c8r3_t5 + c8r4_t5 + c8r5_t5 + c8r6_t5
 
     # Column 9: ENERGY
 
-    c9r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].ENERGY)
-    c9r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].ENERGY)
-    c9r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].ENERGY)
-    c9r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].ENERGY)
-    c9r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].ENERGY)
-    c9r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].ENERGY)
-    c9r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].ENERGY)
+    c9r1_t1 = table.value('ENERGY', LAND_USE="PROTECTED", CLASS="Forest")
+    c9r2_t1 = table.value('ENERGY', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c9r3_t1 = table.value('ENERGY', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c9r4_t1 = table.value('ENERGY', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c9r5_t1 = table.value('ENERGY', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c9r6_t1 = table.value('ENERGY', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c9r7_t1 = table.value('ENERGY', LAND_USE="PROTECTED", CLASS="Others")
     c9_t1_total = c9r1_t1 + c9r2_t1 + c9r3_t1 + c9r4_t1 + c9r5_t1 + \
         c9r6_t1 + c9r7_t1
 
-    c9r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].ENERGY)
-    c9r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].ENERGY)
-    c9r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].ENERGY)
-    c9r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].ENERGY)
-    c9r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].ENERGY)
-    c9r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].ENERGY)
+    c9r1_t2 = table.value('ENERGY', LAND_USE="UTILIZED", CLASS="Forest")
+    c9r2_t2 = table.value('ENERGY', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c9r3_t2 = table.value('ENERGY', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c9r4_t2 = table.value('ENERGY', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c9r5_t2 = table.value('ENERGY', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c9r6_t2 = table.value('ENERGY', LAND_USE="UTILIZED", CLASS="Others")
     c9_t2_total = c9r1_t2 + c9r2_t2 + c9r3_t2 + c9r4_t2 + c9r5_t2 + c9r6_t2
 
-    c9r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].ENERGY)
-    c9r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].ENERGY)
-    c9r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].ENERGY)
-    c9r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].ENERGY)
+    c9r1_t3 = table.value('ENERGY', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c9r2_t3 = table.value('ENERGY', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c9r3_t3 = table.value('ENERGY', LAND_USE="MODIFIED", CLASS="Settlements")
+    c9r4_t3 = table.value('ENERGY', LAND_USE="MODIFIED", CLASS="Others")
     c9_t3_total = c9r1_t3 + c9r2_t3 + c9r3_t3 + c9r4_t3
 
-    c9r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].ENERGY)
-    c9r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].ENERGY)
-    c9r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].ENERGY)
-    c9r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].ENERGY)
-    c9r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].ENERGY)
+    c9r1_t4 = table.value('ENERGY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c9r2_t4 = table.value('ENERGY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c9r3_t4 = table.value('ENERGY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c9r4_t4 = table.value('ENERGY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c9r5_t4 = table.value('ENERGY', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c9_t4_total = c9r1_t4 + c9r2_t4 + c9r3_t4 + c9r4_t4 + c9r5_t4
 
-    c9r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].ENERGY)
-    c9r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].ENERGY)
-    c9r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].ENERGY)
-    c9r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].ENERGY)
-    c9r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].ENERGY)
-    c9r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].ENERGY)
+    c9r1_t5 = table.value('ENERGY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c9r2_t5 = table.value('ENERGY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c9r3_t5 = table.value('ENERGY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c9r4_t5 = table.value('ENERGY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c9r5_t5 = table.value('ENERGY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c9r6_t5 = table.value('ENERGY', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c9_t5_total = c9r1_t5 + c9r2_t5 + c9r3_t5 + c9r4_t5 + c9r5_t5 + c9r6_t5
 
     # Column 10: LEISURE
 
-    c10r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].LEISURE)
-    c10r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].LEISURE)
-    c10r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].LEISURE)
-    c10r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].LEISURE)
-    c10r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].LEISURE)
-    c10r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].LEISURE)
-    c10r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].LEISURE)
+    c10r1_t1 = table.value('LEISURE', LAND_USE="PROTECTED", CLASS="Forest")
+    c10r2_t1 = table.value('LEISURE', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c10r3_t1 = table.value('LEISURE', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c10r4_t1 = table.value('LEISURE', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c10r5_t1 = table.value('LEISURE', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c10r6_t1 = table.value('LEISURE', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c10r7_t1 = table.value('LEISURE', LAND_USE="PROTECTED", CLASS="Others")
     c10_t1_total = c10r1_t1 + c10r2_t1 + c10r3_t1 + c10r4_t1 + c10r5_t1 + \
         c10r6_t1 + c10r7_t1
 
-    c10r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].LEISURE)
-    c10r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].LEISURE)
-    c10r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].LEISURE)
-    c10r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].LEISURE)
-    c10r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].LEISURE)
-    c10r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].LEISURE)
+    c10r1_t2 = table.value('LEISURE', LAND_USE="UTILIZED", CLASS="Forest")
+    c10r2_t2 = table.value('LEISURE', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c10r3_t2 = table.value('LEISURE', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c10r4_t2 = table.value('LEISURE', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c10r5_t2 = table.value('LEISURE', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c10r6_t2 = table.value('LEISURE', LAND_USE="UTILIZED", CLASS="Others")
     c10_t2_total = c10r1_t2 + c10r2_t2 + c10r3_t2 + c10r4_t2 + \
         c10r5_t2 + c10r6_t2
 
-    c10r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].LEISURE)
-    c10r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].LEISURE)
-    c10r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].LEISURE)
-    c10r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].LEISURE)
+    c10r1_t3 = table.value('LEISURE', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c10r2_t3 = table.value('LEISURE', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c10r3_t3 = table.value('LEISURE', LAND_USE="MODIFIED", CLASS="Settlements")
+    c10r4_t3 = table.value('LEISURE', LAND_USE="MODIFIED", CLASS="Others")
     c10_t3_total = c10r1_t3 + c10r2_t3 + c10r3_t3 + c10r4_t3
 
-    c10r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].LEISURE)
-    c10r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].LEISURE)
-    c10r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].LEISURE)
-    c10r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].LEISURE)
-    c10r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].LEISURE)
+    c10r1_t4 = table.value('LEISURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c10r2_t4 = table.value('LEISURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c10r3_t4 = table.value('LEISURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c10r4_t4 = table.value('LEISURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c10r5_t4 = table.value('LEISURE', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c10_t4_total = c10r1_t4 + c10r2_t4 + c10r3_t4 + c10r4_t4 + c10r5_t4
 
-    c10r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].LEISURE)
-    c10r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].LEISURE)
-    c10r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].LEISURE)
-    c10r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].LEISURE)
-    c10r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].LEISURE)
-    c10r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].LEISURE)
+    c10r1_t5 = table.value('LEISURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c10r2_t5 = table.value('LEISURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c10r3_t5 = table.value('LEISURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c10r4_t5 = table.value('LEISURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c10r5_t5 = table.value('LEISURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c10r6_t5 = table.value('LEISURE', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c10_t5_total = c10r1_t5 + c10r2_t5 + c10r3_t5 + c10r4_t5 + \
         c10r5_t5 + c10r6_t5
 
     # Column 11: NON_BENEFICIAL
 
-    c11r1_t1 = float(df_Pr.loc[df_Pr.CLASS == "Forest"].NON_BENEFICIAL)
-    c11r2_t1 = float(df_Pr.loc[df_Pr.CLASS == "Shrubland"].NON_BENEFICIAL)
-    c11r3_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural grasslands"].NON_BENEFICIAL)
-    c11r4_t1 = float(df_Pr.loc[df_Pr.CLASS == "Natural water bodies"].NON_BENEFICIAL)
-    c11r5_t1 = float(df_Pr.loc[df_Pr.CLASS == "Wetlands"].NON_BENEFICIAL)
-    c11r6_t1 = float(df_Pr.loc[df_Pr.CLASS == "Glaciers"].NON_BENEFICIAL)
-    c11r7_t1 = float(df_Pr.loc[df_Pr.CLASS == "Others"].NON_BENEFICIAL)
+    c11r1_t1 = table.value('NON_BENEFICIAL', LAND_USE="PROTECTED", CLASS="Forest")
+    c11r2_t1 = table.value('NON_BENEFICIAL', LAND_USE="PROTECTED", CLASS="Shrubland")
+    c11r3_t1 = table.value('NON_BENEFICIAL', LAND_USE="PROTECTED", CLASS="Natural grasslands")
+    c11r4_t1 = table.value('NON_BENEFICIAL', LAND_USE="PROTECTED", CLASS="Natural water bodies")
+    c11r5_t1 = table.value('NON_BENEFICIAL', LAND_USE="PROTECTED", CLASS="Wetlands")
+    c11r6_t1 = table.value('NON_BENEFICIAL', LAND_USE="PROTECTED", CLASS="Glaciers")
+    c11r7_t1 = table.value('NON_BENEFICIAL', LAND_USE="PROTECTED", CLASS="Others")
     c11_t1_total = c11r1_t1 + c11r2_t1 + c11r3_t1 + c11r4_t1 + c11r5_t1 + \
         c11r6_t1 + c11r7_t1
 
-    c11r1_t2 = float(df_Ut.loc[df_Ut.CLASS == "Forest"].NON_BENEFICIAL)
-    c11r2_t2 = float(df_Ut.loc[df_Ut.CLASS == "Shrubland"].NON_BENEFICIAL)
-    c11r3_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural grasslands"].NON_BENEFICIAL)
-    c11r4_t2 = float(df_Ut.loc[df_Ut.CLASS == "Natural water bodies"].NON_BENEFICIAL)
-    c11r5_t2 = float(df_Ut.loc[df_Ut.CLASS == "Wetlands"].NON_BENEFICIAL)
-    c11r6_t2 = float(df_Ut.loc[df_Ut.CLASS == "Others"].NON_BENEFICIAL)
+    c11r1_t2 = table.value('NON_BENEFICIAL', LAND_USE="UTILIZED", CLASS="Forest")
+    c11r2_t2 = table.value('NON_BENEFICIAL', LAND_USE="UTILIZED", CLASS="Shrubland")
+    c11r3_t2 = table.value('NON_BENEFICIAL', LAND_USE="UTILIZED", CLASS="Natural grasslands")
+    c11r4_t2 = table.value('NON_BENEFICIAL', LAND_USE="UTILIZED", CLASS="Natural water bodies")
+    c11r5_t2 = table.value('NON_BENEFICIAL', LAND_USE="UTILIZED", CLASS="Wetlands")
+    c11r6_t2 = table.value('NON_BENEFICIAL', LAND_USE="UTILIZED", CLASS="Others")
     c11_t2_total = c11r1_t2 + c11r2_t2 + c11r3_t2 + c11r4_t2 + \
         c11r5_t2 + c11r6_t2
 
-    c11r1_t3 = float(df_Mo.loc[df_Mo.CLASS == "Rainfed crops"].NON_BENEFICIAL)
-    c11r2_t3 = float(df_Mo.loc[df_Mo.CLASS == "Forest plantations"].NON_BENEFICIAL)
-    c11r3_t3 = float(df_Mo.loc[df_Mo.CLASS == "Settlements"].NON_BENEFICIAL)
-    c11r4_t3 = float(df_Mo.loc[df_Mo.CLASS == "Others"].NON_BENEFICIAL)
+    c11r1_t3 = table.value('NON_BENEFICIAL', LAND_USE="MODIFIED", CLASS="Rainfed crops")
+    c11r2_t3 = table.value('NON_BENEFICIAL', LAND_USE="MODIFIED", CLASS="Forest plantations")
+    c11r3_t3 = table.value('NON_BENEFICIAL', LAND_USE="MODIFIED", CLASS="Settlements")
+    c11r4_t3 = table.value('NON_BENEFICIAL', LAND_USE="MODIFIED", CLASS="Others")
     c11_t3_total = c11r1_t3 + c11r2_t3 + c11r3_t3 + c11r4_t3
 
-    c11r1_t4 = float(df_Mc.loc[df_Mc.CLASS == "Irrigated crops"].NON_BENEFICIAL)
-    c11r2_t4 = float(df_Mc.loc[df_Mc.CLASS == "Managed water bodies"].NON_BENEFICIAL)
-    c11r3_t4 = float(df_Mc.loc[df_Mc.CLASS == "Residential"].NON_BENEFICIAL)
-    c11r4_t4 = float(df_Mc.loc[df_Mc.CLASS == "Industry"].NON_BENEFICIAL)
-    c11r5_t4 = float(df_Mc.loc[df_Mc.CLASS == "Others"].NON_BENEFICIAL)
+    c11r1_t4 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Irrigated crops")
+    c11r2_t4 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Managed water bodies")
+    c11r3_t4 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Residential")
+    c11r4_t4 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Industry")
+    c11r5_t4 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED CONVENTIONAL", CLASS="Others")
     c11_t4_total = c11r1_t4 + c11r2_t4 + c11r3_t4 + c11r4_t4 + c11r5_t4
 
-    c11r1_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor domestic"].NON_BENEFICIAL)
-    c11r2_t5 = float(df_Mn.loc[df_Mn.CLASS == "Indoor industry"].NON_BENEFICIAL)
-    c11r3_t5 = float(df_Mn.loc[df_Mn.CLASS == "Greenhouses"].NON_BENEFICIAL)
-    c11r4_t5 = float(df_Mn.loc[df_Mn.CLASS == "Livestock and husbandry"].NON_BENEFICIAL)
-    c11r5_t5 = float(df_Mn.loc[df_Mn.CLASS == "Power and energy"].NON_BENEFICIAL)
-    c11r6_t5 = float(df_Mn.loc[df_Mn.CLASS == "Others"].NON_BENEFICIAL)
+    c11r1_t5 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor domestic")
+    c11r2_t5 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Indoor industry")
+    c11r3_t5 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Greenhouses")
+    c11r4_t5 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Livestock and husbandry")
+    c11r5_t5 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Power and energy")
+    c11r6_t5 = table.value('NON_BENEFICIAL', LAND_USE="MANAGED NON_CONVENTIONAL", CLASS="Others")
     c11_t5_total = c11r1_t5 + c11r2_t5 + c11r3_t5 + c11r4_t5 + \
         c11r5_t5 + c11r6_t5
 
@@ -716,17 +709,17 @@ def create_sheet2(basin, period, units, data, output, template=False,
     else:
         svg_template_path = os.path.abspath(template)
 
-    tree = ET.parse(svg_template_path)
+    tree, ids = open_template(svg_template_path)
 
     # Titles
 
-    xml_txt_box = tree.findall('''.//*[@id='basin']''')[0]
+    xml_txt_box = ids['basin']
     xml_txt_box.getchildren()[0].text = 'Basin: ' + basin
 
-    xml_txt_box = tree.findall('''.//*[@id='period']''')[0]
+    xml_txt_box = ids['period']
     xml_txt_box.getchildren()[0].text = 'Period: ' + period
 
-    xml_txt_box = tree.findall('''.//*[@id='units']''')[0]
+    xml_txt_box = ids['units']
     xml_txt_box.getchildren()[0].text = 'Sheet 2: Evapotranspiration (' + units + ')'
 
     # Total ET
@@ -748,215 +741,215 @@ def create_sheet2(basin, period, units, data, output, template=False,
 
     t_total_managed_lu = c1_t4_total + c1_t5_total
 
-    xml_txt_box = tree.findall('''.//*[@id='total_et']''')[0]
+    xml_txt_box = ids['total_et']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_et
 
-    xml_txt_box = tree.findall('''.//*[@id='non-manageble']''')[0]
+    xml_txt_box = ids['non-manageble']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_et_t1
 
-    xml_txt_box = tree.findall('''.//*[@id='manageble']''')[0]
+    xml_txt_box = ids['manageble']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_et_t2
 
-    xml_txt_box = tree.findall('''.//*[@id='managed']''')[0]
+    xml_txt_box = ids['managed']
     xml_txt_box.getchildren()[0].text = '%.1f' % et_total_managed
 
     # Totals land use
 
-    xml_txt_box = tree.findall('''.//*[@id='protected_lu_et']''')[0]
+    xml_txt_box = ids['protected_lu_et']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_et_t1
 
-    xml_txt_box = tree.findall('''.//*[@id='protected_lu_t']''')[0]
+    xml_txt_box = ids['protected_lu_t']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1_t1_total
 
-    xml_txt_box = tree.findall('''.//*[@id='utilized_lu_et']''')[0]
+    xml_txt_box = ids['utilized_lu_et']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_et_t2
 
-    xml_txt_box = tree.findall('''.//*[@id='utilized_lu_t']''')[0]
+    xml_txt_box = ids['utilized_lu_t']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1_t2_total
 
-    xml_txt_box = tree.findall('''.//*[@id='modified_lu_et']''')[0]
+    xml_txt_box = ids['modified_lu_et']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_et_t3
 
-    xml_txt_box = tree.findall('''.//*[@id='modified_lu_t']''')[0]
+    xml_txt_box = ids['modified_lu_t']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1_t3_total
 
-    xml_txt_box = tree.findall('''.//*[@id='managed_lu_et']''')[0]
+    xml_txt_box = ids['managed_lu_et']
     xml_txt_box.getchildren()[0].text = '%.1f' % et_total_managed_lu
 
-    xml_txt_box = tree.findall('''.//*[@id='managed_lu_t']''')[0]
+    xml_txt_box = ids['managed_lu_t']
     xml_txt_box.getchildren()[0].text = '%.1f' % t_total_managed_lu
 
     # Table 1
-    xml_txt_box = tree.findall('''.//*[@id='plu_et_forest']''')[0]
+    xml_txt_box = ids['plu_et_forest']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r1_t1_left
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_t_forest']''')[0]
+    xml_txt_box = ids['plu_t_forest']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r1_t1
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_et_shrubland']''')[0]
+    xml_txt_box = ids['plu_et_shrubland']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r2_t1_left
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_t_shrubland']''')[0]
+    xml_txt_box = ids['plu_t_shrubland']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r2_t1
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_et_grasslands']''')[0]
+    xml_txt_box = ids['plu_et_grasslands']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r3_t1_left
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_t_grasslands']''')[0]
+    xml_txt_box = ids['plu_t_grasslands']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r3_t1
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_et_waterbodies']''')[0]
+    xml_txt_box = ids['plu_et_waterbodies']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r4_t1_left
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_t_waterbodies']''')[0]
+    xml_txt_box = ids['plu_t_waterbodies']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r4_t1
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_et_wetlands']''')[0]
+    xml_txt_box = ids['plu_et_wetlands']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r5_t1_left
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_t_wetlands']''')[0]
+    xml_txt_box = ids['plu_t_wetlands']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r5_t1
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_et_glaciers']''')[0]
+    xml_txt_box = ids['plu_et_glaciers']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r6_t1_left
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_t_glaciers']''')[0]
+    xml_txt_box = ids['plu_t_glaciers']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r6_t1
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_et_others']''')[0]
+    xml_txt_box = ids['plu_et_others']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r7_t1_left
 
-    xml_txt_box = tree.findall('''.//*[@id='plu_t_others']''')[0]
+    xml_txt_box = ids['plu_t_others']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r7_t1
 
     # Table 2
-    xml_txt_box = tree.findall('''.//*[@id='ulu_et_forest']''')[0]
+    xml_txt_box = ids['ulu_et_forest']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r1_t2_left
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_t_forest']''')[0]
+    xml_txt_box = ids['ulu_t_forest']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r1_t2
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_et_shrubland']''')[0]
+    xml_txt_box = ids['ulu_et_shrubland']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r2_t2_left
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_t_shrubland']''')[0]
+    xml_txt_box = ids['ulu_t_shrubland']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r2_t2
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_et_grasslands']''')[0]
+    xml_txt_box = ids['ulu_et_grasslands']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r3_t2_left
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_t_grasslands']''')[0]
+    xml_txt_box = ids['ulu_t_grasslands']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r3_t2
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_et_waterbodies']''')[0]
+    xml_txt_box = ids['ulu_et_waterbodies']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r4_t2_left
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_t_waterbodies']''')[0]
+    xml_txt_box = ids['ulu_t_waterbodies']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r4_t2
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_et_wetlands']''')[0]
+    xml_txt_box = ids['ulu_et_wetlands']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r5_t2_left
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_t_wetlands']''')[0]
+    xml_txt_box = ids['ulu_t_wetlands']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r5_t2
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_et_others']''')[0]
+    xml_txt_box = ids['ulu_et_others']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r6_t2_left
 
-    xml_txt_box = tree.findall('''.//*[@id='ulu_t_others']''')[0]
+    xml_txt_box = ids['ulu_t_others']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r6_t2
 
     # Table 3
-    xml_txt_box = tree.findall('''.//*[@id='molu_et_rainfed']''')[0]
+    xml_txt_box = ids['molu_et_rainfed']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r1_t3_left
 
-    xml_txt_box = tree.findall('''.//*[@id='molu_t_rainfed']''')[0]
+    xml_txt_box = ids['molu_t_rainfed']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r1_t3
 
-    xml_txt_box = tree.findall('''.//*[@id='molu_et_forest']''')[0]
+    xml_txt_box = ids['molu_et_forest']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r2_t3_left
 
-    xml_txt_box = tree.findall('''.//*[@id='molu_t_forest']''')[0]
+    xml_txt_box = ids['molu_t_forest']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r2_t3
 
-    xml_txt_box = tree.findall('''.//*[@id='molu_et_settlements']''')[0]
+    xml_txt_box = ids['molu_et_settlements']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r3_t3_left
 
-    xml_txt_box = tree.findall('''.//*[@id='molu_t_settlements']''')[0]
+    xml_txt_box = ids['molu_t_settlements']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r3_t3
 
-    xml_txt_box = tree.findall('''.//*[@id='molu_et_others']''')[0]
+    xml_txt_box = ids['molu_et_others']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r4_t3_left
 
-    xml_txt_box = tree.findall('''.//*[@id='molu_t_others']''')[0]
+    xml_txt_box = ids['molu_t_others']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r4_t3
 
     # Table 4
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_crops']''')[0]
+    xml_txt_box = ids['malu_et_crops']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r1_t4_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_crops']''')[0]
+    xml_txt_box = ids['malu_t_crops']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r1_t4
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_waterbodies']''')[0]
+    xml_txt_box = ids['malu_et_waterbodies']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r2_t4_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_waterbodies']''')[0]
+    xml_txt_box = ids['malu_t_waterbodies']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r2_t4
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_residential']''')[0]
+    xml_txt_box = ids['malu_et_residential']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r3_t4_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_residential']''')[0]
+    xml_txt_box = ids['malu_t_residential']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r3_t4
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_industry']''')[0]
+    xml_txt_box = ids['malu_et_industry']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r4_t4_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_industry']''')[0]
+    xml_txt_box = ids['malu_t_industry']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r4_t4
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_others1']''')[0]
+    xml_txt_box = ids['malu_et_others1']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r5_t4_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_others1']''')[0]
+    xml_txt_box = ids['malu_t_others1']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r5_t4
 
     # Table 5
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_idomestic']''')[0]
+    xml_txt_box = ids['malu_et_idomestic']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r1_t5_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_idomestic']''')[0]
+    xml_txt_box = ids['malu_t_idomestic']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r1_t5
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_iindustry']''')[0]
+    xml_txt_box = ids['malu_et_iindustry']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r2_t5_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_iindustry']''')[0]
+    xml_txt_box = ids['malu_t_iindustry']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r2_t5
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_greenhouses']''')[0]
+    xml_txt_box = ids['malu_et_greenhouses']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r3_t5_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_greenhouses']''')[0]
+    xml_txt_box = ids['malu_t_greenhouses']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r3_t5
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_livestock']''')[0]
+    xml_txt_box = ids['malu_et_livestock']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r4_t5_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_livestock']''')[0]
+    xml_txt_box = ids['malu_t_livestock']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r4_t5
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_powerandenergy']''')[0]
+    xml_txt_box = ids['malu_et_powerandenergy']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r5_t5_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_powerandenergy']''')[0]
+    xml_txt_box = ids['malu_t_powerandenergy']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r5_t5
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_et_others2']''')[0]
+    xml_txt_box = ids['malu_et_others2']
     xml_txt_box.getchildren()[0].text = '%.1f' % c5r6_t5_left
 
-    xml_txt_box = tree.findall('''.//*[@id='malu_t_others2']''')[0]
+    xml_txt_box = ids['malu_t_others2']
     xml_txt_box.getchildren()[0].text = '%.1f' % c1r6_t5
 
     # Right box
@@ -971,19 +964,19 @@ def create_sheet2(basin, period, units, data, output, template=False,
     total_interception = c4_t1_total + c4_t2_total + c4_t3_total + \
         c4_t4_total + c4_t5_total
 
-    xml_txt_box = tree.findall('''.//*[@id='evaporation']''')[0]
+    xml_txt_box = ids['evaporation']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_e
 
-    xml_txt_box = tree.findall('''.//*[@id='transpiration']''')[0]
+    xml_txt_box = ids['transpiration']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_t
 
-    xml_txt_box = tree.findall('''.//*[@id='water']''')[0]
+    xml_txt_box = ids['water']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_water
 
-    xml_txt_box = tree.findall('''.//*[@id='soil']''')[0]
+    xml_txt_box = ids['soil']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_soil
 
-    xml_txt_box = tree.findall('''.//*[@id='interception']''')[0]
+    xml_txt_box = ids['interception']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_interception
 
     total_agr = c6_t1_total + c6_t2_total + c6_t3_total + \
@@ -1001,45 +994,32 @@ def create_sheet2(basin, period, units, data, output, template=False,
     total_non_bene = c11_t1_total + c11_t2_total + c11_t3_total + \
         c11_t4_total + c11_t5_total
 
-    xml_txt_box = tree.findall('''.//*[@id='non-beneficial']''')[0]
+    xml_txt_box = ids['non-beneficial']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_non_bene
 
-    xml_txt_box = tree.findall('''.//*[@id='beneficial']''')[0]
+    xml_txt_box = ids['beneficial']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_bene
 
-    xml_txt_box = tree.findall('''.//*[@id='agriculture']''')[0]
+    xml_txt_box = ids['agriculture']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_agr
 
-    xml_txt_box = tree.findall('''.//*[@id='environment']''')[0]
+    xml_txt_box = ids['environment']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_env
 
-    xml_txt_box = tree.findall('''.//*[@id='economy']''')[0]
+    xml_txt_box = ids['economy']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_eco
 
-    xml_txt_box = tree.findall('''.//*[@id='energy']''')[0]
+    xml_txt_box = ids['energy']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_ene
 
-    xml_txt_box = tree.findall('''.//*[@id='leisure']''')[0]
+    xml_txt_box = ids['leisure']
     xml_txt_box.getchildren()[0].text = '%.1f' % total_lei
 
     # svg to string
     ET.register_namespace("", "http://www.w3.org/2000/svg")
 
-    # Get the paths based on the environment variable
-    if os.name == 'posix':
-        Path_Inkscape = 'inkscape'
-
-    else:
-        WA_env_paths = os.environ["WA_PATHS"].split(';')
-        Inkscape_env_path = WA_env_paths[1]
-        Path_Inkscape = os.path.join(Inkscape_env_path,'inkscape.exe')
-
-    # Export svg to png
-    tempout_path = output.replace('.pdf', '_temporary.svg')
-    tree.write(tempout_path)
-    subprocess.call([Path_Inkscape,tempout_path,'--export-pdf='+output, '-d 300'])
-    time.sleep(10)
-    os.remove(tempout_path)
+    # Export svg to pdf
+    export_sheet(tree, output)
 
 
     # Return
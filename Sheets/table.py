@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Authors: Tim Hessels
+         UNESCO-IHE 2017
+Contact: t.hessels@unesco-ihe.org
+Repository: https://github.com/wateraccounting/wa
+Module: Sheets/table
+"""
+
+import pandas as pd
+
+class SheetTable(object):
+    """
+    A sheet csv file indexed on its key columns, the value of a box is found
+    with one dictionary lookup instead of a filter over the whole table.
+
+    Example:
+    table = SheetTable(r'C:\Sheets\csv\Sample_sheet2.csv')
+    table.value('TRANSPIRATION', LAND_USE='PROTECTED', CLASS='Forest')
+    """
+
+    def __init__(self, data):
+        """
+        Keyword arguments:
+        data -- A csv file of a sheet (or a pandas DataFrame of the csv file,
+                or a SheetTable to reuse its indices)
+        """
+        if isinstance(data, SheetTable):
+            self.df = data.df
+            self.columns = data.columns
+            self.indices = data.indices
+            return
+        elif isinstance(data, pd.DataFrame):
+            self.df = data
+        else:
+            self.df = pd.read_csv(data, sep=';')
+        self.columns = dict((column, self.df[column].values) for column in self.df.columns)
+        self.indices = dict()
+
+    def rows(self, **keys):
+        """
+        Returns the row numbers of the table with the given key values. The
+        index of a combination of key columns is created the first time it is
+        used.
+
+        Keyword arguments:
+        keys -- The key columns and their values, e.g. CLASS='Forest'
+        """
+        names = tuple(sorted(keys.keys()))
+        if names not in self.indices:
+            index = dict()
+            for row, key in enumerate(zip(*[self.columns[name] for name in names])):
+                index.setdefault(key, []).append(row)
+            self.indices[names] = index
+
+        return self.indices[names].get(tuple(keys[name] for name in names), [])
+
+    def value(self, column, **keys):
+        """
+        Returns the value of one box of the sheet, the key values must select
+        exactly one row of the table.
+
+        Keyword arguments:
+        column -- The column of the value
+        keys -- The key columns and their values, e.g. CLASS='Forest'
+        """
+        return float(self.columns[column][self.rows(**keys)])
+
+    def values(self, column, **keys):
+        """
+        Returns the values of all the rows with the given key values
+
+        Keyword arguments:
+        column -- The column of the values
+        keys -- The key columns and their values, e.g. SUBTYPE='VERTICAL_RECHARGE'
+        """
+        return self.columns[column][self.rows(**keys)]